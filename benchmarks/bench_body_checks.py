@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Full-body validation: per-call regex compiles + full_text scans vs. the precompiled matcher.
+
+Runs the legacy pass_full_body_checks (nested `any` over headings, then a freshly
+compiled multiline regex over full_text per keyword set) and the current one on
+a batch of synthetic HTML and PDF extraction results, checks both accept/reject
+the same documents, and reports ms per document.
+
+    python3 benchmarks/bench_body_checks.py --docs 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+import arxiv_fulltext_summarizer as core  # noqa: E402
+
+WORDS = "the policy robot grasp learned controller we show that data scene camera frame objects".split()
+
+
+def legacy_has_heading_like(text: str, keywords: list[str]) -> bool:
+    pattern = re.compile(
+        r"^\s*(?:\d+(?:\.\d+)*\s+)?(?:[A-Z][A-Za-z0-9\-,: ]{0,80})?\b(" + "|".join(re.escape(k) for k in keywords) + r")\b",
+        re.IGNORECASE | re.MULTILINE,
+    )
+    return bool(pattern.search(text))
+
+
+def legacy_pass_full_body_checks(result: core.ExtractionResult, min_chars: int) -> bool:
+    if len(result.full_text) <= min_chars:
+        return False
+    heading_candidates = [sec.heading.lower() for sec in result.html_sections]
+    method_ok = any(any(k in h for k in core.METHOD_KEYWORDS) for h in heading_candidates)
+    exp_ok = any(any(k in h for k in core.EXPERIMENT_KEYWORDS) for h in heading_candidates)
+    if not method_ok:
+        method_ok = legacy_has_heading_like(result.full_text, core.METHOD_KEYWORDS)
+    if not exp_ok:
+        exp_ok = legacy_has_heading_like(result.full_text, core.EXPERIMENT_KEYWORDS)
+    return method_ok and exp_ok
+
+
+def current_pass(result: core.ExtractionResult, min_chars: int) -> bool:
+    try:
+        core.pass_full_body_checks(result, min_chars)
+    except core.FullTextUnavailableError:
+        return False
+    return True
+
+
+def paragraph(rng: random.Random, words: int = 120) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+
+def synthetic_result(i: int) -> core.ExtractionResult:
+    rng = random.Random(i)
+    # A quarter of the documents never mention one of the categories, so the full scan runs to the end.
+    headings = ["Introduction", "Background", "Our Method", "Experiments", "Conclusion"]
+    if i % 4 == 1:
+        headings = ["Introduction", "Background", "Design", "Discussion", "Conclusion"]
+    if i % 2 == 0:
+        sections = [core.HtmlSection(h, f"S{n}", [paragraph(rng) for _ in range(12)]) for n, h in enumerate(headings)]
+        return core.html_extraction_result(sections, "x")
+    pages = []
+    for n in range(1, 31):
+        text = paragraph(rng, 600)
+        if n in (6, 14) and i % 4 != 1:
+            text = f"{n // 4} {'Method' if n == 6 else 'Results'} " + text
+        pages.append((n, core.clean_text(text)))
+    full_text = "\n".join(f"[Page {n}]\n{t}" for n, t in pages)
+    return core.ExtractionResult("pdf", "x", full_text, [], pages)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=200)
+    parser.add_argument("--min-chars", type=int, default=core.DEFAULT_MIN_CHARS)
+    parser.add_argument("--output", type=Path, help="Also write the JSON report here.")
+    args = parser.parse_args()
+
+    docs = [synthetic_result(i) for i in range(args.docs)]
+    expected = [legacy_pass_full_body_checks(doc, args.min_chars) for doc in docs]
+    actual = [current_pass(doc, args.min_chars) for doc in docs]
+    if expected != actual:
+        bad = [i for i, (a, b) in enumerate(zip(expected, actual)) if a != b]
+        print(f"Checks disagree on documents: {bad[:20]}", file=sys.stderr)
+        return 1
+
+    timings = {}
+    for name, fn in (("legacy", legacy_pass_full_body_checks), ("precompiled", current_pass)):
+        started = time.perf_counter()
+        for doc in docs:
+            fn(doc, args.min_chars)
+        timings[name] = time.perf_counter() - started
+
+    report = {
+        "docs": len(docs),
+        "accepted": sum(actual),
+        "legacy_ms_per_doc": round(timings["legacy"] / len(docs) * 1000, 3),
+        "precompiled_ms_per_doc": round(timings["precompiled"] / len(docs) * 1000, 3),
+        "speedup": round(timings["legacy"] / timings["precompiled"], 2),
+    }
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
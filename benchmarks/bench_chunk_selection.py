@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Full-text token savings from boilerplate dropping + BM25 chunk selection.
+
+Generates a fixture set of synthetic papers (HTML sections and the same text as
+PDF pages) with marker facts planted in the Method and Experiments sections,
+padded with related work, appendices, acknowledgements and a reference list.
+For each paper it compares sending every chunk against prepare_fulltext_chunks
+and reports tokens sent, tokens saved, and the share of planted Method /
+Experiments facts that survive selection (the quality proxy: a fact that is
+not sent cannot end up in the summary).
+
+    python3 benchmarks/bench_chunk_selection.py --papers 40 --paper-budget 6000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import re
+import statistics
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+import arxiv_fulltext_summarizer as core  # noqa: E402
+
+FACT_RE = re.compile(r"FACT[ME]\d+x\d+")
+TOPICS = ["grasping", "locomotion", "navigation", "manipulation", "tracking"]
+FILLER = (
+    "prior studies discuss broad context, historical motivation and open questions in the wider field "
+    "without committing to particular design choices or measured outcomes"
+).split()
+
+
+def sentence(rng: random.Random, words: list[str], length: int = 45) -> str:
+    return " ".join(rng.choice(words) for _ in range(length)).capitalize() + "."
+
+
+def synthetic_fixture(i: int) -> tuple[core.PaperRecord, list[core.HtmlSection], set[str]]:
+    rng = random.Random(i)
+    topic = TOPICS[i % len(TOPICS)]
+    method_words = f"we propose a {topic} policy architecture trained with a contrastive model objective and diffusion approach".split()
+    exp_words = f"experiments evaluate {topic} success rate results on benchmarks ablation shows the evaluation gains".split()
+    facts: set[str] = set()
+
+    def planted(kind: str, n: int, words: list[str]) -> list[str]:
+        paras = []
+        for j in range(n):
+            fact = f"FACT{kind}{i}x{j}"
+            facts.add(fact)
+            paras.append(f"{sentence(rng, words)} {fact} {sentence(rng, words)} {sentence(rng, FILLER, 20)}")
+        return paras
+
+    references = [
+        f"[{k}] A. Author, B. Author. A study of {rng.choice(TOPICS)} number {k}. In Proc. Conf., {rng.randint(2005, 2025)}. "
+        f"arXiv {rng.randint(2005, 2025)}; extended {rng.randint(2005, 2025)}."
+        for k in range(1, 61)
+    ]
+    sections = [
+        core.HtmlSection("1 Introduction", "S1", [sentence(rng, FILLER + method_words[:4]) for _ in range(6)]),
+        core.HtmlSection("2 Related Work", "S2", [sentence(rng, FILLER, 80) for _ in range(14)]),
+        core.HtmlSection("3 Method", "S3", planted("M", 6, method_words)),
+        core.HtmlSection("4 Experiments", "S4", planted("E", 6, exp_words)),
+        core.HtmlSection("5 Discussion", "S5", [sentence(rng, FILLER, 60) for _ in range(6)]),
+        core.HtmlSection("Acknowledgements", "A1", [sentence(rng, FILLER, 50) for _ in range(2)]),
+        core.HtmlSection("References", "bib", [" ".join(references[k : k + 10]) for k in range(0, 60, 10)]),
+        core.HtmlSection("Appendix A Proofs", "A2", [sentence(rng, FILLER, 90) for _ in range(10)]),
+    ]
+    paper = core.PaperRecord(
+        arxiv_id=f"2601.{i:05d}",
+        title=f"A {topic} policy with a contrastive diffusion approach",
+        html_url="",
+        pdf_url="",
+        published_date="2026-01-01",
+        abstract=f"We propose a {topic} policy architecture and evaluate it in experiments with ablation results.",
+    )
+    return paper, sections, facts
+
+
+def as_pdf(sections: list[core.HtmlSection], page_tokens: int = 700) -> core.ExtractionResult:
+    pages: list[tuple[int, str]] = []
+    current: list[str] = []
+    for sec in sections:
+        for text in [sec.heading, *sec.paragraphs]:
+            current.append(text)
+            if core.estimate_tokens(" ".join(current)) >= page_tokens:
+                pages.append((len(pages) + 1, " ".join(current)))
+                current = []
+    if current:
+        pages.append((len(pages) + 1, " ".join(current)))
+    return core.ExtractionResult("pdf", "x", "", [], pages)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--papers", type=int, default=40)
+    parser.add_argument("--chunk-tokens", type=int, default=1500)
+    parser.add_argument("--paper-budget", type=int, default=6000)
+    parser.add_argument("--output", type=Path, help="Also write the JSON report here.")
+    args = parser.parse_args()
+
+    report: dict[str, object] = {"papers": args.papers, "chunk_tokens": args.chunk_tokens, "paper_budget": args.paper_budget}
+    for source in ("html", "pdf"):
+        sent_all, sent_selected, recall = [], [], []
+        for i in range(args.papers):
+            paper, sections, facts = synthetic_fixture(i)
+            result = core.html_extraction_result(sections, "x") if source == "html" else as_pdf(sections)
+            every = core.build_chunks(result, args.chunk_tokens, 0)
+            selected, stats = core.prepare_fulltext_chunks(paper, result, args.chunk_tokens, 0, args.paper_budget)
+            kept = set(FACT_RE.findall(" ".join(chunk.text for chunk in selected)))
+            sent_all.append(sum(core.estimate_tokens(c.text) for c in every))
+            sent_selected.append(stats["tokens_selected"])
+            recall.append(len(kept & facts) / len(facts))
+        report[source] = {
+            "tokens_all_chunks": round(statistics.mean(sent_all)),
+            "tokens_selected": round(statistics.mean(sent_selected)),
+            "tokens_saved_pct": round(100 * (1 - sum(sent_selected) / sum(sent_all)), 1),
+            "method_experiment_fact_recall": round(statistics.mean(recall), 3),
+            "min_fact_recall": round(min(recall), 3),
+        }
+
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
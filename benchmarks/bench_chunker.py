@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Full-text chunking: legacy max_chars packing vs. the token-budget chunker.
+
+Builds synthetic papers in three registers (English prose, CJK prose, math/table
+heavy) and chunks each with the old per-section 12k-char splitter and with
+build_chunks at the same token budget. Reports chunk count (= LLM calls), how
+full each chunk is relative to the budget, and how many chunks overflow it.
+
+    python3 benchmarks/bench_chunker.py --token-budget 6000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import arxiv_fulltext_summarizer as core  # noqa: E402
+from synthetic_data import synthetic_latexml_html  # noqa: E402
+
+CJK_PARAGRAPH = "本文提出一种基于强化学习的机器人控制方法，在多个基准上显著提升了鲁棒性与样本效率。" * 6
+MATH_PARAGRAPH = " ".join(f"x_{{{i}}}=\\sum_{{k}}\\alpha_k\\phi(s_{i},a_k)+\\epsilon_{i};" for i in range(40))
+SECTION_NAMES = ["Introduction", "Method", "Experiments", "Results", "Conclusion", "Appendix"]
+
+
+def legacy_chunk_html_sections(sections: list[core.HtmlSection], max_chars: int) -> list[core.TextChunk]:
+    chunks: list[core.TextChunk] = []
+    for sec in sections:
+        current: list[str] = []
+        current_len = 0
+        for para in sec.paragraphs:
+            if current and current_len + len(para) + 1 > max_chars:
+                chunks.append(core.TextChunk("", f"Section: {sec.heading}\n" + "\n".join(current), ""))
+                current, current_len = [], 0
+            current.append(para)
+            current_len += len(para) + 1
+        if current:
+            chunks.append(core.TextChunk("", f"Section: {sec.heading}\n" + "\n".join(current), ""))
+    return chunks
+
+
+def synthetic_sections(paragraph: str, paras: list[int]) -> list[core.HtmlSection]:
+    return [
+        core.HtmlSection(heading=f"{i + 1} {SECTION_NAMES[i % len(SECTION_NAMES)]}", anchor_id=f"S{i + 1}",
+                         paragraphs=[f"({i}.{p}) {paragraph}" for p in range(count)])
+        for i, count in enumerate(paras)
+    ]
+
+
+def corpora() -> dict[str, list[list[core.HtmlSection]]]:
+    english = [core.extract_html_sections(synthetic_latexml_html(i), "x").html_sections for i in range(10)]
+    layouts = [[3, 14, 22, 9, 2, 30], [5, 8, 40, 12, 3, 6], [2, 25, 18, 18, 4, 10]]
+    return {
+        "english": english,
+        "cjk": [synthetic_sections(CJK_PARAGRAPH, layout) for layout in layouts],
+        "math": [synthetic_sections(MATH_PARAGRAPH, layout) for layout in layouts],
+    }
+
+
+def describe(chunks: list[list[core.TextChunk]], budget: int) -> dict[str, float]:
+    tokens = [core.estimate_tokens(c.text) for paper in chunks for c in paper]
+    return {
+        "chunks_per_paper": round(statistics.mean(len(paper) for paper in chunks), 2),
+        "mean_fill": round(statistics.mean(tokens) / budget, 3),
+        "max_tokens": max(tokens),
+        "over_budget": sum(1 for t in tokens if t > budget),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--token-budget", type=int, default=core.DEFAULT_CHUNK_TOKENS)
+    parser.add_argument("--overlap-tokens", type=int, default=core.DEFAULT_CHUNK_OVERLAP_TOKENS)
+    parser.add_argument("--max-chars", type=int, default=core.DEFAULT_CHUNK_MAX_CHARS)
+    parser.add_argument("--output", type=Path, help="Also write the JSON report here.")
+    args = parser.parse_args()
+
+    report: dict[str, object] = {"token_budget": args.token_budget, "legacy_max_chars": args.max_chars}
+    for name, papers in corpora().items():
+        legacy = [legacy_chunk_html_sections(sections, args.max_chars) for sections in papers]
+        started = time.perf_counter()
+        token = [
+            core.build_chunks(
+                core.ExtractionResult("html", "x", "", sections, []), args.token_budget, args.overlap_tokens
+            )
+            for sections in papers
+        ]
+        elapsed = time.perf_counter() - started
+        report[name] = {
+            "legacy": describe(legacy, args.token_budget),
+            "token_budget": {**describe(token, args.token_budget), "ms_per_paper": round(elapsed / len(papers) * 1000, 2)},
+        }
+
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
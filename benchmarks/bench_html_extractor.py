@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""HTML section extraction: BeautifulSoup path vs. the lxml single-walk extractor.
+
+Checks that both produce identical sections (heading, anchor, paragraphs) and
+full_text, then reports pages/s and ms/page for each. Uses synthetic
+LaTeXML-shaped pages plus a set of edge-case snippets by default; point
+--html-dir at saved arXiv HTML pages (*.html) to run on real fixtures.
+
+    python3 benchmarks/bench_html_extractor.py --pages 20
+    python3 benchmarks/bench_html_extractor.py --html-dir /path/to/saved_html
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import arxiv_fulltext_summarizer as core  # noqa: E402
+from synthetic_data import synthetic_latexml_html  # noqa: E402
+
+LONG = "this sentence is long enough to pass the forty character paragraph floor"
+
+EDGE_CASES = [
+    "",
+    "   ",
+    "<p>no body wrapper but " + LONG + "</p>",
+    "<html><head><title>t</title></head></html>",
+    f"<body><h2>Top</h2><p>{LONG}</p><main id='m'><h2>In main</h2><p>{LONG}</p></main></body>",
+    f"<body><div id='content'><h3>Sec</h3><p>{LONG}</p></div><article></article></body>",
+    f"<body><noscript><article><h2>hidden</h2><p>{LONG}</p></article></noscript><h2>Shown</h2><p>{LONG}</p></body>",
+    f"<body><div id='a'><div id=''><h2>Empty id parent</h2><p>{LONG}</p></div></div></body>",
+    f"<body><section id='s'><h2 id=''>Own empty id</h2><p>{LONG}</p></section></body>",
+    f"<body><h2><p>{LONG} nested in heading</p></h2><p>{LONG}</p></body>",
+    f"<body><p>a<b>b</b>c<script>x</script>d<!-- c -->e {LONG}</p><h4>  </h4><p>{LONG}</p></body>",
+    f"<body><h1>T&nbsp;one two</h1><p>{LONG}&amp;&lt;tag&gt;</p><p>short</p></body>",
+    f"<?xml version='1.0' encoding='utf-8'?><html><body><h2>XML decl</h2><p>{LONG}</p></body></html>",
+    f"<body><article id='outer'><div><h2>Nested anchor</h2><p>{LONG}</p></div></article></body>",
+    f"<body><H2 ID='UP'>Upper</H2><P>{LONG}</P></body>",
+]
+
+
+def load_fixtures(html_dir: Path | None, pages: int) -> list[tuple[str, str]]:
+    if html_dir is not None:
+        return [(p.name, p.read_text(encoding="utf-8", errors="replace")) for p in sorted(html_dir.glob("*.html"))]
+    fixtures = [(f"edge-{i}", html) for i, html in enumerate(EDGE_CASES)]
+    fixtures += [(f"synthetic-{i}", synthetic_latexml_html(i)) for i in range(pages)]
+    return fixtures
+
+
+def sections_signature(result: core.ExtractionResult) -> tuple:
+    return (
+        result.full_text,
+        [(sec.heading, sec.anchor_id, sec.paragraphs) for sec in result.html_sections],
+    )
+
+
+def throughput(fn, pages: list[str], repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for html in pages:
+            fn(html, "https://arxiv.org/html/bench")
+    return time.perf_counter() - started
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=20, help="Synthetic pages when --html-dir is not given.")
+    parser.add_argument("--html-dir", type=Path, help="Directory of saved arXiv HTML pages (*.html).")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", type=Path, help="Also write the JSON report here.")
+    args = parser.parse_args()
+
+    fixtures = load_fixtures(args.html_dir, args.pages)
+    mismatches = []
+    for name, html in fixtures:
+        expected = sections_signature(core.extract_html_sections_bs4(html, "x"))
+        actual = sections_signature(core.extract_html_sections_lxml(html, "x"))
+        if expected != actual:
+            mismatches.append(name)
+    if mismatches:
+        print(f"Extractors disagree on: {', '.join(mismatches)}", file=sys.stderr)
+        return 1
+
+    pages = [html for name, html in fixtures if not name.startswith("edge-")]
+    total_bytes = sum(len(html.encode("utf-8")) for html in pages)
+    bs4_seconds = throughput(core.extract_html_sections_bs4, pages, args.repeat)
+    lxml_seconds = throughput(core.extract_html_sections_lxml, pages, args.repeat)
+    calls = len(pages) * args.repeat
+
+    report = {
+        "fixtures_checked": len(fixtures),
+        "pages": len(pages),
+        "avg_page_kib": round(total_bytes / max(1, len(pages)) / 1024, 1),
+        "bs4_ms_per_page": round(bs4_seconds / calls * 1000, 2),
+        "lxml_ms_per_page": round(lxml_seconds / calls * 1000, 2),
+        "bs4_pages_per_s": round(calls / bs4_seconds, 1),
+        "lxml_pages_per_s": round(calls / lxml_seconds, 1),
+        "speedup": round(bs4_seconds / lxml_seconds, 2),
+    }
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
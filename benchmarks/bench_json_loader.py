@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Peak RSS and latency of the JSON paper loaders, one fresh process per mode.
+
+Modes:
+  legacy_full    json.loads of the whole file, normalize every row, sort, take N
+  stream_table   streaming PaperTable fill (what the realtime server caches)
+  stream_newest  streaming top-N heap (summarize_new --n)
+  stream_latest  streaming latest-day filter (summarize_new --latest-day-only)
+  stream_find    streaming id lookup that stops at the match (summarize_one --arxiv_id)
+
+`first_record_seconds` is the time until the first normalized record is
+available: after the full parse for legacy_full, after one row when streaming.
+
+    python3 benchmarks/bench_json_loader.py --papers 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+MODES = ["legacy_full", "stream_table", "stream_newest", "stream_latest", "stream_find"]
+
+
+def rss_mib(key: str = "VmHWM") -> float:
+    """Peak (VmHWM) or current (VmRSS) resident set in MiB.
+
+    /proc is used rather than ru_maxrss, which Linux carries over from the
+    forking parent and would report the generator's peak instead.
+    """
+    try:
+        with open("/proc/self/status", encoding="ascii") as fh:
+            for line in fh:
+                if line.startswith(key + ":"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_mode(mode: str, path: Path, n: int, target: str) -> dict[str, float]:
+    import arxiv_fulltext_summarizer as core
+
+    baseline = rss_mib("VmRSS")
+    started = time.perf_counter()
+    first_record = 0.0
+    if mode == "legacy_full":
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        rows = [r for field in payload["fields"] for r in field["papers"]]
+        records = [core.normalize_record(r) for r in rows]
+        first_record = time.perf_counter() - started
+        result = core.sort_newest(r for r in records if r is not None)[:n]
+    else:
+        first_row = next(core.iter_json_paper_rows(path))
+        core.normalize_record(first_row)
+        first_record = time.perf_counter() - started
+        started = time.perf_counter()
+        if mode == "stream_table":
+            result = core.load_json_table(path)
+        elif mode == "stream_newest":
+            result = core.stream_newest_json_records(path, n)
+        elif mode == "stream_latest":
+            result = core.stream_latest_day_json_records(path)
+        else:
+            result = core.stream_find_json_record(path, target)
+    total = time.perf_counter() - started
+    return {
+        "first_record_seconds": round(first_record, 4),
+        "total_seconds": round(total, 3),
+        "peak_rss_mib": round(rss_mib(), 1),
+        "peak_rss_over_baseline_mib": round(rss_mib() - baseline, 1),
+        "result_size": len(result) if hasattr(result, "__len__") else int(result is not None),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--papers", type=int, default=100_000)
+    parser.add_argument("--n", type=int, default=300)
+    parser.add_argument("--output", type=Path, help="Also write the JSON report here.")
+    parser.add_argument("--mode", choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument("--input", type=Path, help=argparse.SUPPRESS)
+    parser.add_argument("--target", default="", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(run_mode(args.mode, args.input, args.n, args.target)))
+        return 0
+
+    from synthetic_data import synthetic_arxiv_id, write_synthetic_payload
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "papers.json"
+        write_synthetic_payload(path, args.papers)
+        # An early id: the lookup a user makes for a paper from today's list.
+        target = synthetic_arxiv_id(min(40, args.papers - 1))
+        report: dict[str, object] = {"papers": args.papers, "input_mib": round(path.stat().st_size / 2**20, 1)}
+        for mode in MODES:
+            proc = subprocess.run(
+                [sys.executable, __file__, "--mode", mode, "--input", str(path), "--n", str(args.n), "--target", target],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            report[mode] = json.loads(proc.stdout.strip().splitlines()[-1])
+
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
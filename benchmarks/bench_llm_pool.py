@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""LLM tail latency: one endpoint vs. a two-endpoint pool with hedged requests.
+
+Starts two local fake OpenAI servers with the same latency distribution (a fast
+body plus a slow tail on --tail-rate of requests, independently seeded), then
+sends the same requests through
+  - single: a pool holding only the first endpoint, hedging off (the old client);
+  - hedged: both endpoints, hedging on a p95-based timer.
+Plain completions are timed end to end, streams by time to first token. Reply
+text is checked to be identical across modes. A third pass puts a dead endpoint
+in the pool and checks every request still succeeds by failing over.
+
+    python3 benchmarks/bench_llm_pool.py --requests 200 --tail-rate 0.05
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import socket
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import arxiv_fulltext_summarizer as core  # noqa: E402
+import llm_pool  # noqa: E402
+from fake_openai_server import LLMServerConfig, start_fake_openai  # noqa: E402
+
+MESSAGES = [{"role": "user", "content": "Summarize the abstract."}]
+
+
+def quantile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else 0.0
+
+
+def latency_report(values: list[float]) -> dict[str, float]:
+    return {
+        "p50_s": round(quantile(values, 0.50), 3),
+        "p95_s": round(quantile(values, 0.95), 3),
+        "p99_s": round(quantile(values, 0.99), 3),
+        "mean_s": round(statistics.fmean(values), 3) if values else 0.0,
+    }
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def make_pool(urls: list[str], hedge: str, args: argparse.Namespace) -> llm_pool.EndpointPool:
+    openai = core.optional_module("openai")
+    endpoints = [llm_pool.Endpoint(name=f"ep{i}", base_url=url, api_key="bench") for i, url in enumerate(urls)]
+    return llm_pool.EndpointPool(
+        endpoints,
+        lambda e: openai.OpenAI(api_key=e.api_key, base_url=e.base_url, max_retries=0),
+        hedge=hedge,
+        hedge_min=args.hedge_min,
+        hedge_default=args.hedge_default,
+        seed=7,
+    )
+
+
+def run_requests(
+    pool: llm_pool.EndpointPool, n: int, concurrency: int, stream: bool
+) -> tuple[list[float], list[str], int]:
+    def one(_i: int) -> tuple[float, str]:
+        started = time.perf_counter()
+        if not stream:
+            text = pool.complete(model="fake-model", temperature=0.1, messages=MESSAGES)
+            return time.perf_counter() - started, text
+        handle = pool.open_stream(model="fake-model", temperature=0.1, messages=MESSAGES)
+        ttft = 0.0
+        parts: list[str] = []
+        try:
+            for part in handle:
+                delta = part.choices[0].delta.content or ""
+                if delta and not ttft:
+                    ttft = time.perf_counter() - started
+                parts.append(delta)
+        finally:
+            handle.close()
+        return ttft, "".join(parts)
+
+    failures = 0
+    latencies: list[float] = []
+    texts: list[str] = []
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for future in [executor.submit(one, i) for i in range(n)]:
+            try:
+                latency, text = future.result()
+            except Exception:  # noqa: BLE001
+                failures += 1
+                continue
+            latencies.append(latency)
+            texts.append(text)
+    return latencies, texts, failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.15, help="Fake server latency for most requests.")
+    parser.add_argument("--tail-rate", type=float, default=0.05)
+    parser.add_argument("--tail-latency", type=float, default=3.0)
+    parser.add_argument("--tokens-per-s", type=float, default=400.0)
+    parser.add_argument("--hedge-min", type=float, default=0.3)
+    parser.add_argument("--hedge-default", type=float, default=0.5)
+    parser.add_argument("--output", type=Path, help="Also write the JSON report here.")
+    args = parser.parse_args()
+
+    servers = []
+    urls = []
+    for seed in (11, 23):
+        config = LLMServerConfig(
+            latency=args.latency,
+            tokens_per_s=args.tokens_per_s,
+            completion_tokens=40,
+            tail_rate=args.tail_rate,
+            tail_latency=args.tail_latency,
+            seed=seed,
+        )
+        server, _stats = start_fake_openai(0, config)
+        servers.append(server)
+        urls.append(f"http://127.0.0.1:{server.server_address[1]}/v1")
+
+    report: dict[str, object] = {
+        "requests": args.requests,
+        "tail_rate": args.tail_rate,
+        "tail_latency_s": args.tail_latency,
+    }
+    reference_text = ""
+    ok = True
+    for kind in ("complete", "stream"):
+        hedges_before = {w: llm_pool.HEDGED_REQUESTS.value(winner=w) for w in ("primary", "backup")}
+        for mode, pool in (("single", make_pool(urls[:1], "off", args)), ("hedged", make_pool(urls, "on", args))):
+            latencies, texts, failures = run_requests(pool, args.requests, args.concurrency, stream=kind == "stream")
+            report[f"{kind}_{mode}"] = {**latency_report(latencies), "failures": failures}
+            expected = reference_text or (texts[0] if texts else "")
+            if kind == "complete":
+                reference_text = expected
+            ok &= failures == 0 and all(t.strip() == expected.strip() for t in texts)
+        report[f"{kind}_hedges"] = {
+            w: int(llm_pool.HEDGED_REQUESTS.value(winner=w) - hedges_before[w]) for w in ("primary", "backup")
+        }
+
+    dead_url = f"http://127.0.0.1:{free_port()}/v1"
+    latencies, texts, failures = run_requests(make_pool([dead_url, urls[0]], "auto", args), 50, 4, stream=False)
+    report["failover_dead_endpoint"] = {**latency_report(latencies), "failures": failures}
+    ok &= failures == 0
+    report["outputs_identical"] = ok
+
+    for server in servers:
+        server.shutdown()
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    if not ok:
+        print("Pooled replies differ from single-endpoint replies, or requests failed.", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
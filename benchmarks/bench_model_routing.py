@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""Abstract summaries under --mode fast / deep / auto / auto with a deep budget.
+
+A local fake OpenAI server plays both models: the deep one is --slow-factor
+times slower, and the fast one cuts its reply short on --weak-rate of requests,
+so the quality check has something to catch. Papers mix short, boilerplate,
+medium and long abstracts. For each mode the report gives wall time, deep/fast
+call counts, estimated deep tokens, escalations, and the share of final
+summaries that pass the quality check.
+
+    python3 benchmarks/bench_model_routing.py --papers 200 --deep-token-budget 30000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import arxiv_fulltext_summarizer as core  # noqa: E402
+import model_routing  # noqa: E402
+from fake_openai_server import LLMServerConfig, start_fake_openai  # noqa: E402
+
+FAST_MODEL = "fake-fast"
+DEEP_MODEL = "fake-deep"
+SENTENCE = "We propose a learned controller that improves grasp success on cluttered scenes by 12 percent. "
+
+
+def synthetic_papers(n: int, seed: int = 5) -> list[core.PaperRecord]:
+    rng = random.Random(seed)
+    papers = []
+    for i in range(n):
+        roll = rng.random()
+        if roll < 0.05:
+            abstract = "This paper has been withdrawn by the authors due to an error in the experiments."
+        elif roll < 0.20:
+            abstract = SENTENCE * 2
+        elif roll < 0.70:
+            abstract = SENTENCE * rng.randint(7, 12)
+        else:
+            abstract = SENTENCE * rng.randint(16, 24)
+        papers.append(
+            core.PaperRecord(
+                arxiv_id=f"2601.{i:05d}",
+                title=f"Synthetic paper {i}",
+                html_url="",
+                pdf_url="",
+                published_date="2026-01-01",
+                abstract=abstract,
+                field=rng.choice(["cs.RO", "cs.CV", "cs.CL"]),
+            )
+        )
+    return papers
+
+
+def run_mode(
+    runner: core.LLMRunner, papers: list[core.PaperRecord], mode: str, budget_tokens: int, workers: int
+) -> dict[str, object]:
+    router = model_routing.ModelRouter(budget=model_routing.RoutingBudget(max_tokens=budget_tokens))
+
+    def one(paper: core.PaperRecord) -> tuple[str, dict[str, object]]:
+        if mode == "auto":
+            return runner.summarize_abstract_routed(paper, router)
+        text = runner.summarize_abstract(paper, mode)
+        tokens = sum(core.estimate_tokens(m["content"]) for m in core.build_abstract_messages(paper))
+        if mode == "deep":
+            router.budget.charge(tokens + core.estimate_tokens(text), 0.0)
+        return text, {"initial_tier": mode, "final_tier": mode, "escalated": False, "reason": mode}
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(one, papers))
+    wall = time.perf_counter() - started
+
+    decisions = [d for _text, d in results]
+    escalated = sum(1 for d in decisions if d["escalated"])
+    deep_calls = sum(1 for d in decisions if d["initial_tier"] == "deep") + escalated
+    passing = sum(1 for text, _d in results if not model_routing.summary_quality_issues(text))
+    return {
+        "wall_s": round(wall, 3),
+        "deep_calls": deep_calls,
+        "fast_calls": sum(1 for d in decisions if d["initial_tier"] == "fast"),
+        "escalated": escalated,
+        "deep_tokens_est": router.budget.spent_tokens,
+        "quality_pass_rate": round(passing / max(1, len(results)), 3),
+        "reasons": dict(Counter(str(d["reason"]) for d in decisions)),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--papers", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--tokens-per-s", type=float, default=2000.0)
+    parser.add_argument("--slow-factor", type=float, default=4.0)
+    parser.add_argument("--weak-rate", type=float, default=0.1)
+    parser.add_argument("--deep-token-budget", type=int, default=30000)
+    parser.add_argument("--output", type=Path, help="Also write the JSON report here.")
+    args = parser.parse_args()
+
+    config = LLMServerConfig(
+        latency=args.latency,
+        tokens_per_s=args.tokens_per_s,
+        slow_models=(DEEP_MODEL,),
+        slow_factor=args.slow_factor,
+        weak_models=(FAST_MODEL,),
+        weak_rate=args.weak_rate,
+    )
+    server, _stats = start_fake_openai(0, config)
+    os.environ["LLM_API_KEY"] = "bench"
+    runner = core.LLMRunner(FAST_MODEL, DEEP_MODEL, base_url=f"http://127.0.0.1:{server.server_address[1]}/v1")
+    papers = synthetic_papers(args.papers)
+
+    report: dict[str, object] = {"papers": args.papers, "weak_rate": args.weak_rate, "slow_factor": args.slow_factor}
+    for label, mode, budget in (
+        ("fast", "fast", 0),
+        ("deep", "deep", 0),
+        ("auto", "auto", 0),
+        ("auto_budget", "auto", args.deep_token_budget),
+    ):
+        report[label] = run_mode(runner, papers, mode, budget, args.workers)
+    server.shutdown()
+
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    print(text)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""Compare the legacy list-of-dataclasses loader with PaperTable on synthetic input.
+
+Writes a synthetic `fields[].papers[]` payload (default 100k papers), then for
+each implementation measures load time, tracemalloc peak and retained memory,
+plus the follow-up operations summarize_new/summarize_one perform: newest N,
+latest day, and one id lookup.
+
+    python3 benchmarks/bench_paper_table.py --papers 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import re
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+import arxiv_fulltext_summarizer as core  # noqa: E402
+from synthetic_data import synthetic_arxiv_id, write_synthetic_payload  # noqa: E402
+
+
+@dataclass
+class LegacyPaperRecord:
+    arxiv_id: str
+    title: str
+    html_url: str
+    pdf_url: str
+    published_date: str
+    abstract: str
+    field: str = ""
+
+
+def legacy_canonical(raw: str) -> str:
+    return re.sub(r"v\d+$", "", core.normalize_arxiv_id(raw), flags=re.IGNORECASE)
+
+
+def legacy_load(path: Path) -> list[LegacyPaperRecord]:
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    rows = [r for field in payload["fields"] for r in field["papers"]]
+    out: list[LegacyPaperRecord] = []
+    seen: set[str] = set()
+    for row in rows:
+        values = core.normalize_values(row)
+        if values is None or values[0] in seen:
+            continue
+        seen.add(values[0])
+        out.append(LegacyPaperRecord(*values))
+    return out
+
+
+def legacy_ts(item: LegacyPaperRecord) -> float:
+    dt = core.parse_datetime(item.published_date)
+    return dt.timestamp() if dt else 0.0
+
+
+def legacy_day(item: LegacyPaperRecord) -> str:
+    dt = core.parse_datetime(item.published_date)
+    return (dt.astimezone(timezone.utc) + timedelta(hours=8)).date().isoformat() if dt else ""
+
+
+def legacy_ops(records: list[LegacyPaperRecord], target: str, n: int) -> None:
+    ordered = sorted(records, key=legacy_ts, reverse=True)
+    _ = ordered[:n]
+    latest = max((legacy_day(r) for r in ordered), default="")
+    _ = [r for r in ordered if legacy_day(r) == latest]
+    _ = next(r for r in ordered if legacy_canonical(r.arxiv_id) == legacy_canonical(target))
+
+
+def table_ops(table: core.PaperTable, target: str, n: int) -> None:
+    _ = table.newest(n)
+    _ = table.latest_day()
+    _ = table.find(target)
+
+
+def measure(load: Callable[[], Any], ops: Callable[[Any], None]) -> dict[str, float]:
+    """Wall time from an untraced pass, memory from a second pass under tracemalloc."""
+    gc.collect()
+    started = time.perf_counter()
+    loaded = load()
+    load_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    ops(loaded)
+    ops_seconds = time.perf_counter() - started
+    del loaded
+    gc.collect()
+
+    tracemalloc.start()
+    loaded = load()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del loaded
+    gc.collect()
+    return {
+        "load_seconds": round(load_seconds, 3),
+        "ops_seconds": round(ops_seconds, 3),
+        "peak_mib": round(peak / 2**20, 1),
+        "retained_mib": round(retained / 2**20, 1),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--papers", type=int, default=100_000)
+    parser.add_argument("--n", type=int, default=300, help="Newest-N size for the follow-up operations.")
+    parser.add_argument("--output", type=Path, help="Also write the JSON report here.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "papers.json"
+        write_synthetic_payload(path, args.papers)
+        target = synthetic_arxiv_id(args.papers // 2)
+        report = {
+            "papers": args.papers,
+            "input_mib": round(path.stat().st_size / 2**20, 1),
+            "legacy_records": measure(lambda: legacy_load(path), lambda r: legacy_ops(r, target, args.n)),
+            "paper_table": measure(lambda: core.load_json_table(path), lambda t: table_ops(t, target, args.n)),
+        }
+
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
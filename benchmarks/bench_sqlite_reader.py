@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""SQLite input: full-scan PaperTable load vs. pushed-down queries.
+
+Builds a synthetic `papers` table (default 1M rows), then times a one-id
+lookup, newest N and latest day through the pushdown helpers, against the
+full projected scan every call used to pay. The benchmark opts into
+SQLITE_BUILD_INDEXES, so the first pushdown call also creates the
+id/published indexes; that one-off cost is reported separately.
+
+    python3 benchmarks/bench_sqlite_reader.py --rows 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import arxiv_fulltext_summarizer as core  # noqa: E402
+from synthetic_data import synthetic_arxiv_id, synthetic_paper  # noqa: E402
+
+
+def build_database(path: Path, rows: int) -> None:
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE papers (arxiv_id TEXT, title TEXT, published TEXT, summary TEXT, primary_category TEXT)"
+    )
+    batch: list[tuple[str, str, str, str, str]] = []
+    for i in range(rows):
+        paper = synthetic_paper(i)
+        batch.append(
+            (f"{synthetic_arxiv_id(i)}v1", paper["title"], paper["published"], paper["summary"], paper["field"])
+        )
+        if len(batch) >= 50_000:
+            conn.executemany("INSERT INTO papers VALUES (?, ?, ?, ?, ?)", batch)
+            batch.clear()
+    conn.executemany("INSERT INTO papers VALUES (?, ?, ?, ?, ?)", batch)
+    conn.commit()
+    conn.close()
+
+
+def timed(fn) -> tuple[float, object]:
+    started = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - started, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--n", type=int, default=300)
+    parser.add_argument("--output", type=Path, help="Also write the JSON report here.")
+    args = parser.parse_args()
+    core.SQLITE_BUILD_INDEXES = True
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "papers.sqlite"
+        build_database(path, args.rows)
+        target = synthetic_arxiv_id(args.rows // 2)
+
+        index_seconds, _ = timed(lambda: core.sqlite_find_record(path, target))
+        scan_seconds, table = timed(lambda: core.load_sqlite_table(path))
+        _, scan_hit = timed(lambda: table.find(target))
+        find_seconds, hit = timed(lambda: core.sqlite_find_record(path, target))
+        newest_seconds, newest = timed(lambda: core.sqlite_newest_records(path, args.n))
+        latest_seconds, latest = timed(lambda: core.sqlite_latest_day_records(path))
+
+        assert hit is not None and scan_hit is not None and hit.arxiv_id == scan_hit.arxiv_id
+        assert [r.arxiv_id for r in newest] == [r.arxiv_id for r in table.newest(args.n)]
+        assert [r.arxiv_id for r in latest] == [r.arxiv_id for r in table.latest_day()]
+
+        report = {
+            "rows": args.rows,
+            "full_scan_load_seconds": round(scan_seconds, 3),
+            "first_call_with_index_build_seconds": round(index_seconds, 3),
+            "find_one_ms": round(find_seconds * 1000, 2),
+            "newest_n_ms": round(newest_seconds * 1000, 2),
+            "latest_day_ms": round(latest_seconds * 1000, 2),
+            "latest_day_rows": len(latest),
+        }
+
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
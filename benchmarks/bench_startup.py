@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Cold-start cost of each entry point, measured with `python -X importtime`.
+
+Every sample is a fresh interpreter. For each entry point the report gives the
+median wall-clock time of the process, the cumulative import time of the entry
+module as reported by -X importtime, and the heaviest top-level imports it
+pulled in — so a heavy dependency sneaking back into module load shows up by name.
+
+    python3 benchmarks/bench_startup.py --runs 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1] / "scripts"
+
+ENTRY_POINTS = {
+    "summarizer_import": ["-c", "import arxiv_fulltext_summarizer"],
+    "summarizer_cli_help": [str(SCRIPTS_DIR / "arxiv_fulltext_summarizer.py"), "--help"],
+    "realtime_server_import": ["-c", "import realtime_summary_server"],
+    "fetch_feed_import": ["-c", "import fetch_cs_ro"],
+    # Paid later, on first use, by the paths that need them.
+    "openai_first_use": ["-c", "import openai"],
+    "pdf_html_first_use": ["-c", "import fitz, requests, bs4, lxml.html"],
+}
+
+
+def parse_importtime(stderr: str) -> list[tuple[int, int, str]]:
+    """(self_us, cumulative_us, indented module name) per `import time:` line."""
+    rows: list[tuple[int, int, str]] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|", 2)
+        rows.append((int(self_us), int(cumulative_us), name.rstrip()))
+    return rows
+
+
+def sample(args: list[str]) -> tuple[float, list[tuple[int, int, str]]]:
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=SCRIPTS_DIR,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    elapsed = time.perf_counter() - started
+    if proc.returncode != 0:
+        raise RuntimeError(f"{' '.join(args)} exited {proc.returncode}: {proc.stderr[-500:]}")
+    return elapsed, parse_importtime(proc.stderr)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=5, help="Heaviest top-level imports to list per entry point.")
+    parser.add_argument("--output", type=Path, help="Also write the JSON report here.")
+    args = parser.parse_args()
+
+    report: dict[str, object] = {"python": sys.version.split()[0], "runs": args.runs}
+    for name, entry_args in ENTRY_POINTS.items():
+        try:
+            sample(entry_args)  # warm the OS page cache and .pyc files
+        except RuntimeError as err:
+            report[name] = {"error": str(err)}
+            continue
+        walls: list[float] = []
+        imports: list[int] = []
+        heaviest: dict[str, list[int]] = {}
+        for _ in range(args.runs):
+            wall, rows = sample(entry_args)
+            walls.append(wall)
+            top_level = [(cum, mod.strip()) for _, cum, mod in rows if not mod.startswith("  ")]
+            imports.append(sum(cum for cum, _ in top_level))
+            # Direct imports of the entry module (or of the script) plus interpreter startup.
+            for _, cum, mod in rows:
+                if not mod.startswith("     ") and mod.strip() not in {"arxiv_fulltext_summarizer", "realtime_summary_server", "fetch_cs_ro"}:
+                    heaviest.setdefault(mod.strip(), []).append(cum)
+        ranked = sorted(heaviest.items(), key=lambda item: -statistics.median(item[1]))[: args.top]
+        report[name] = {
+            "wall_ms": round(statistics.median(walls) * 1000, 1),
+            "import_ms": round(statistics.median(imports) / 1000, 1),
+            "heaviest_imports_ms": {mod: round(statistics.median(us) / 1000, 1) for mod, us in ranked},
+        }
+
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Tracing overhead: a bare loop vs. the same loop wrapped in `tracing.span` off and on.
+
+The disabled case is what every untraced run pays at each instrumented call site
+(one global check, then a shared no-op context manager); the enabled case is the
+cost of recording a span. Both are reported in ns per span.
+
+    python3 benchmarks/bench_tracing.py --spans 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+import tracing  # noqa: E402
+
+
+def work(i: int) -> int:
+    return (i * 2654435761) & 0xFFFF
+
+
+def bare(n: int) -> float:
+    started = time.perf_counter_ns()
+    for i in range(n):
+        work(i)
+    return (time.perf_counter_ns() - started) / n
+
+
+def spanned(n: int) -> float:
+    started = time.perf_counter_ns()
+    for i in range(n):
+        with tracing.span("llm_call", model="bench"):
+            work(i)
+    return (time.perf_counter_ns() - started) / n
+
+
+def best_of(fn, n: int, repeats: int) -> float:
+    return min(fn(n) for _ in range(repeats))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--spans", type=int, default=200_000)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--output", type=Path, help="Also write the JSON report here.")
+    args = parser.parse_args()
+
+    bare_ns = best_of(bare, args.spans, args.repeats)
+    disabled_ns = best_of(spanned, args.spans, args.repeats)
+    tracing.TRACER.enable()
+    enabled_ns = best_of(spanned, args.spans, args.repeats)
+    tracing.TRACER.enabled = False
+    recorded = len(tracing.TRACER.spans())
+
+    report = {
+        "spans": args.spans,
+        "bare_ns_per_iter": round(bare_ns, 1),
+        "disabled_overhead_ns_per_span": round(disabled_ns - bare_ns, 1),
+        "enabled_overhead_ns_per_span": round(enabled_ns - bare_ns, 1),
+        "recorded_spans": recorded,
+    }
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""Local stand-in for the arXiv Atom API (`/api/query`).
+
+Answers the queries fetch_cs_ro.py sends — `cat:X`, optionally `AND` a
+`submittedDate:[A TO B]` range or `(submittedDate:[..] OR lastUpdatedDate:[..])`, sorted by submittedDate or lastUpdatedDate, paged by
+start/max_results — from a synthetic corpus dated relative to server start.
+
+With --fixtures DIR it replays recorded pages instead: a page is keyed by
+category, sort field, start and max_results (the date bounds move with the
+clock, so they are not part of the key). Add --upstream URL to record misses
+from the real API into DIR on first sight.
+
+    ARXIV_API_URL=http://127.0.0.1:8791/api/query python3 scripts/fetch_cs_ro.py ...
+    python3 benchmarks/fake_arxiv_server.py --port 8791 --papers 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import re
+import threading
+import time
+import urllib.parse
+import urllib.request
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+CATEGORIES = ["cs.RO", "cs.CV", "cs.CL", "cs.SY"]
+DATE_RANGE_RE = re.compile(r"(submittedDate|lastUpdatedDate):\[(\d{12}) TO (\d{12})\]")
+CATEGORY_RE = re.compile(r"cat:(\S+)")
+
+
+@dataclass
+class FakeEntry:
+    arxiv_id: str
+    version: int
+    published: datetime
+    updated: datetime
+    category: str
+
+
+@dataclass
+class ArxivServerStats:
+    requests: int = 0
+    replayed: int = 0
+    recorded: int = 0
+    latencies: list[float] = field(default_factory=list)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+def synthetic_corpus(papers: int, window_days: int, now: datetime) -> dict[str, list[FakeEntry]]:
+    """Papers spread evenly over the window, newest first per category; every 7th one revised."""
+    by_category: dict[str, list[FakeEntry]] = {cat: [] for cat in CATEGORIES}
+    step = timedelta(seconds=window_days * 86400 / max(1, papers))
+    for i in range(papers):
+        published = now - timedelta(minutes=5) - step * i
+        revised = i % 7 == 3
+        entry = FakeEntry(
+            arxiv_id=f"{2600 + i // 90000}.{i % 90000:05d}",
+            version=2 if revised else 1,
+            published=published,
+            updated=published + timedelta(hours=20) if revised else published,
+            category=CATEGORIES[i % len(CATEGORIES)],
+        )
+        by_category[entry.category].append(entry)
+    return by_category
+
+
+def atom_stamp(value: datetime) -> str:
+    return value.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def atom_feed(entries: list[FakeEntry]) -> bytes:
+    parts = [
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<feed xmlns="http://www.w3.org/2005/Atom" xmlns:arxiv="http://arxiv.org/schemas/atom">'
+        "<title>ArXiv Query (fake)</title>"
+    ]
+    for e in entries:
+        abs_id = f"{e.arxiv_id}v{e.version}"
+        parts.append(
+            f"<entry><id>http://arxiv.org/abs/{abs_id}</id>"
+            f"<updated>{atom_stamp(e.updated)}</updated><published>{atom_stamp(e.published)}</published>"
+            f"<title>{escape(f'Synthetic {e.category} paper {e.arxiv_id} on learning-based control')}</title>"
+            f"<summary>{escape(f'We study problem {e.arxiv_id}. ' + 'The method improves robustness and sample efficiency. ' * 6)}</summary>"
+            "<author><name>A. Author</name></author><author><name>B. Author</name></author>"
+            f'<link href="http://arxiv.org/abs/{abs_id}" rel="alternate" type="text/html"/>'
+            f'<link title="pdf" href="http://arxiv.org/pdf/{abs_id}" rel="related" type="application/pdf"/>'
+            f'<arxiv:primary_category term="{e.category}" scheme="http://arxiv.org/schemas/atom"/>'
+            f'<category term="{e.category}" scheme="http://arxiv.org/schemas/atom"/>'
+            '<category term="cs.LG" scheme="http://arxiv.org/schemas/atom"/></entry>'
+        )
+    parts.append("</feed>")
+    return "".join(parts).encode("utf-8")
+
+
+def answer_query(corpus: dict[str, list[FakeEntry]], params: dict[str, str]) -> bytes:
+    query = params.get("search_query", "")
+    match = CATEGORY_RE.search(query)
+    rows = corpus.get(match.group(1), []) if match else []
+    ranges = []
+    for field_name, low, high in DATE_RANGE_RE.findall(query):
+        lower = datetime.strptime(low, "%Y%m%d%H%M").replace(tzinfo=timezone.utc)
+        upper = datetime.strptime(high, "%Y%m%d%H%M").replace(tzinfo=timezone.utc) + timedelta(minutes=1)
+        ranges.append((field_name == "lastUpdatedDate", lower, upper))
+    if ranges:
+        # Several ranges only ever appear OR-ed together.
+        rows = [
+            e
+            for e in rows
+            if any(lower <= (e.updated if by_updated else e.published) < upper for by_updated, lower, upper in ranges)
+        ]
+    if params.get("sortBy") == "lastUpdatedDate":
+        rows = sorted(rows, key=lambda e: e.updated, reverse=True)
+    start = int(params.get("start", "0") or 0)
+    size = int(params.get("max_results", "10") or 10)
+    return atom_feed(rows[start : start + size])
+
+
+def fixture_key(params: dict[str, str]) -> str:
+    match = CATEGORY_RE.search(params.get("search_query", ""))
+    parts = [
+        match.group(1) if match else "",
+        params.get("sortBy", ""),
+        params.get("start", "0"),
+        params.get("max_results", ""),
+    ]
+    return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()[:20]
+
+
+def build_handler(
+    corpus: dict[str, list[FakeEntry]],
+    stats: ArxivServerStats,
+    fixtures: Path | None,
+    upstream: str,
+    latency: float,
+) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+            pass
+
+        def do_GET(self) -> None:  # noqa: N802
+            started = time.perf_counter()
+            url = urllib.parse.urlparse(self.path)
+            if url.path != "/api/query":
+                self.send_error(404)
+                return
+            params = {k: v[-1] for k, v in urllib.parse.parse_qs(url.query).items()}
+            if latency:
+                time.sleep(latency)
+            body = None
+            replayed = recorded = False
+            if fixtures is not None:
+                path = fixtures / f"{fixture_key(params)}.xml"
+                if path.exists():
+                    body, replayed = path.read_bytes(), True
+                elif upstream:
+                    with urllib.request.urlopen(f"{upstream}?{url.query}", timeout=60) as resp:
+                        body = resp.read()
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    path.write_bytes(body)
+                    recorded = True
+            if body is None:
+                body = answer_query(corpus, params)
+
+            self.send_response(200)
+            self.send_header("Content-Type", "application/atom+xml; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            with stats.lock:
+                stats.requests += 1
+                stats.replayed += int(replayed)
+                stats.recorded += int(recorded)
+                stats.latencies.append(time.perf_counter() - started)
+
+    return Handler
+
+
+def start_fake_arxiv(
+    port: int = 0,
+    papers: int = 10_000,
+    window_days: int = 30,
+    fixtures: Path | None = None,
+    upstream: str = "",
+    latency: float = 0.0,
+) -> tuple[ThreadingHTTPServer, ArxivServerStats]:
+    """Serve on 127.0.0.1 in a daemon thread; the bound port is `server.server_address[1]`."""
+    corpus = synthetic_corpus(papers, window_days, datetime.now(timezone.utc).replace(microsecond=0))
+    stats = ArxivServerStats()
+    server = ThreadingHTTPServer(("127.0.0.1", port), build_handler(corpus, stats, fixtures, upstream, latency))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, stats
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8791)
+    parser.add_argument("--papers", type=int, default=10_000)
+    parser.add_argument("--window-days", type=int, default=30)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response.")
+    parser.add_argument("--fixtures", type=Path, help="Replay recorded pages from this directory.")
+    parser.add_argument("--upstream", default="", help="Record fixture misses from this API URL.")
+    args = parser.parse_args()
+
+    server, stats = start_fake_arxiv(args.port, args.papers, args.window_days, args.fixtures, args.upstream, args.latency)
+    print(f"fake arXiv API on http://127.0.0.1:{server.server_address[1]}/api/query", flush=True)
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+    print(f"requests={stats.requests} replayed={stats.replayed} recorded={stats.recorded}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
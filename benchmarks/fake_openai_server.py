@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""Local OpenAI-compatible `/v1/chat/completions` with controllable speed and failures.
+
+- --latency: seconds before the first token (both streaming and plain replies).
+- --tokens-per-s / --completion-tokens: decode speed and reply length.
+- --rate-429: share of requests rejected with 429 + Retry-After (seeded, reproducible).
+- --tail-rate / --tail-latency: share of requests that wait tail-latency seconds
+  instead of --latency, for a slow-region tail.
+- --slow-models / --weak-models: comma-separated model names that are
+  --slow-factor times slower, or whose replies are cut after the first section
+  on --weak-rate of requests (a big deep model vs. a small fast one).
+- Replies to `response_format` requests are a JSON object, so structured-output
+  paths parse cleanly.
+
+    LLM_BASE_URL=http://127.0.0.1:8792/v1 LLM_API_KEY=bench python3 scripts/arxiv_fulltext_summarizer.py ...
+    python3 benchmarks/fake_openai_server.py --port 8792 --latency 0.3 --tokens-per-s 60 --rate-429 0.05
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+@dataclass
+class LLMServerConfig:
+    latency: float = 0.2
+    tokens_per_s: float = 80.0
+    completion_tokens: int = 120
+    rate_429: float = 0.0
+    retry_after: float = 0.2
+    tail_rate: float = 0.0
+    tail_latency: float = 5.0
+    slow_models: tuple[str, ...] = ()
+    slow_factor: float = 3.0
+    weak_models: tuple[str, ...] = ()
+    weak_rate: float = 0.0
+    seed: int = 7
+
+
+@dataclass
+class LLMServerStats:
+    requests: int = 0
+    rejected_429: int = 0
+    completion_tokens: int = 0
+    ttft: list[float] = field(default_factory=list)
+    durations: list[float] = field(default_factory=list)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+def reply_tokens(n: int, structured: bool) -> list[str]:
+    if structured:
+        body = json.dumps(
+            {
+                "key_points": ["Synthetic key point."] * 3,
+                "method_details": ["Synthetic method detail."],
+                "experiment_details": ["Synthetic experiment detail."],
+                "resources": [],
+                "reasoning_brief": ["Synthetic reasoning."],
+            }
+        )
+        return [body[i : i + 4] for i in range(0, len(body), 4)]
+    words = []
+    for section in ("[1]", "[2]", "[3]", "[4]", "[依据]"):
+        words += [f"## {section} ", "Synthetic ", "summary ", "token ", "text, ", "grounded ", "in ", "the ", "abstract.\n"]
+    return [words[i % len(words)] for i in range(n)]
+
+
+def build_handler(config: LLMServerConfig, stats: LLMServerStats) -> type[BaseHTTPRequestHandler]:
+    rng = random.Random(config.seed)
+    rng_lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+            pass
+
+        def _json(self, status: int, payload: dict, headers: dict[str, str] | None = None) -> None:
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self) -> None:  # noqa: N802
+            if self.path.rstrip("/").endswith("/models"):
+                self._json(200, {"object": "list", "data": [{"id": "fake-model", "object": "model"}]})
+            else:
+                self.send_error(404)
+
+        def do_POST(self) -> None:  # noqa: N802
+            if not self.path.rstrip("/").endswith("/chat/completions"):
+                self.send_error(404)
+                return
+            started = time.perf_counter()
+            request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", "0") or 0)) or b"{}")
+            with rng_lock:
+                reject = rng.random() < config.rate_429
+                slow = config.tail_rate > 0 and rng.random() < config.tail_rate
+            with stats.lock:
+                stats.requests += 1
+                stats.rejected_429 += int(reject)
+            if reject:
+                self._json(
+                    429,
+                    {"error": {"message": "Rate limit exceeded (fake)", "type": "rate_limit_error"}},
+                    {"Retry-After": str(config.retry_after)},
+                )
+                return
+
+            model = str(request.get("model", "fake-model"))
+            tokens = reply_tokens(config.completion_tokens, bool(request.get("response_format")))
+            if model in config.weak_models and config.weak_rate > 0:
+                with rng_lock:
+                    weak = rng.random() < config.weak_rate
+                if weak:
+                    tokens = tokens[: next((i for i, t in enumerate(tokens) if t == "## [2] "), len(tokens))]
+            factor = config.slow_factor if model in config.slow_models else 1.0
+            per_token = factor / config.tokens_per_s if config.tokens_per_s > 0 else 0.0
+            time.sleep(factor * (config.tail_latency if slow else config.latency))
+            ttft = time.perf_counter() - started
+
+            if request.get("stream"):
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Cache-Control", "no-cache")
+                self.send_header("Connection", "close")
+                self.end_headers()
+                try:
+                    for i, token in enumerate(tokens):
+                        if i and per_token:
+                            time.sleep(per_token)
+                        chunk = {
+                            "id": "chatcmpl-fake",
+                            "object": "chat.completion.chunk",
+                            "created": int(time.time()),
+                            "model": model,
+                            "choices": [{"index": 0, "delta": {"content": token}, "finish_reason": None}],
+                        }
+                        self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+                        self.wfile.flush()
+                    done = {
+                        "id": "chatcmpl-fake",
+                        "object": "chat.completion.chunk",
+                        "created": int(time.time()),
+                        "model": model,
+                        "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+                    }
+                    self.wfile.write(f"data: {json.dumps(done)}\n\ndata: [DONE]\n\n".encode("utf-8"))
+                    self.wfile.flush()
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+                self.close_connection = True
+            else:
+                time.sleep(per_token * max(0, len(tokens) - 1))
+                self._json(
+                    200,
+                    {
+                        "id": "chatcmpl-fake",
+                        "object": "chat.completion",
+                        "created": int(time.time()),
+                        "model": model,
+                        "choices": [
+                            {
+                                "index": 0,
+                                "message": {"role": "assistant", "content": "".join(tokens)},
+                                "finish_reason": "stop",
+                            }
+                        ],
+                        "usage": {"prompt_tokens": 0, "completion_tokens": len(tokens), "total_tokens": len(tokens)},
+                    },
+                )
+            with stats.lock:
+                stats.completion_tokens += len(tokens)
+                stats.ttft.append(ttft)
+                stats.durations.append(time.perf_counter() - started)
+
+    return Handler
+
+
+def start_fake_openai(port: int = 0, config: LLMServerConfig | None = None) -> tuple[ThreadingHTTPServer, LLMServerStats]:
+    """Serve on 127.0.0.1 in a daemon thread; base URL is http://127.0.0.1:<port>/v1."""
+    stats = LLMServerStats()
+    server = ThreadingHTTPServer(("127.0.0.1", port), build_handler(config or LLMServerConfig(), stats))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, stats
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8792)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--tokens-per-s", type=float, default=80.0)
+    parser.add_argument("--completion-tokens", type=int, default=120)
+    parser.add_argument("--rate-429", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=float, default=0.2)
+    parser.add_argument("--tail-rate", type=float, default=0.0)
+    parser.add_argument("--tail-latency", type=float, default=5.0)
+    parser.add_argument("--slow-models", default="")
+    parser.add_argument("--slow-factor", type=float, default=3.0)
+    parser.add_argument("--weak-models", default="")
+    parser.add_argument("--weak-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    config = LLMServerConfig(
+        latency=args.latency,
+        tokens_per_s=args.tokens_per_s,
+        completion_tokens=args.completion_tokens,
+        rate_429=args.rate_429,
+        retry_after=args.retry_after,
+        tail_rate=args.tail_rate,
+        tail_latency=args.tail_latency,
+        slow_models=tuple(m for m in args.slow_models.split(",") if m),
+        slow_factor=args.slow_factor,
+        weak_models=tuple(m for m in args.weak_models.split(",") if m),
+        weak_rate=args.weak_rate,
+        seed=args.seed,
+    )
+    server, stats = start_fake_openai(args.port, config)
+    print(f"fake OpenAI API on http://127.0.0.1:{server.server_address[1]}/v1", flush=True)
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+    print(f"requests={stats.requests} rejected_429={stats.rejected_429} completion_tokens={stats.completion_tokens}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Run a script as __main__ and record its own peak RSS when it exits.
+
+    python3 benchmarks/rss_probe.py OUT.json scripts/fetch_cs_ro.py --window-days 30
+
+Writes {"peak_rss_mib": ..., "exit_code": ...} to OUT.json. VmHWM is read from
+/proc/self/status inside the measured process: ru_maxrss of a child is inherited
+from the forking parent on Linux and would report the harness's peak instead.
+"""
+
+from __future__ import annotations
+
+import json
+import resource
+import runpy
+import sys
+from pathlib import Path
+
+
+def peak_rss_mib() -> float:
+    try:
+        with open("/proc/self/status", encoding="ascii") as fh:
+            for line in fh:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main() -> int:
+    if len(sys.argv) < 3:
+        print(__doc__, file=sys.stderr)
+        return 2
+    out_path = Path(sys.argv[1])
+    script = Path(sys.argv[2]).resolve()
+    sys.argv = [str(script), *sys.argv[3:]]
+    sys.path[0] = str(script.parent)
+
+    exit_code: int | str | None = 0
+    try:
+        runpy.run_path(str(script), run_name="__main__")
+    except SystemExit as exc:
+        exit_code = exc.code
+    except KeyboardInterrupt:
+        exit_code = 130
+    finally:
+        out_path.write_text(json.dumps({"peak_rss_mib": round(peak_rss_mib(), 1), "exit_code": exit_code}))
+    return exit_code if isinstance(exit_code, int) else (0 if exit_code is None else 1)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""End-to-end benchmark suite against local fake arXiv / OpenAI servers.
+
+Scenarios (each measured in its own process, so peak RSS is per scenario):
+
+- fetch:          scripts/fetch_cs_ro.py main — cold full fetch, then an incremental re-run
+- load:           load_records + sort_newest over the synthetic payload
+- summarize_new:  scripts/arxiv_fulltext_summarizer.py summarize_new --n N
+- sse:            concurrent POST /api/summarize-one/stream against realtime_summary_server.py
+
+Each reports wall time, throughput, p95 latency where there is a per-request
+latency, and peak RSS, as one JSON document. Pass --baseline with an earlier
+report to flag regressions beyond --tolerance (exit code 1 when any are found).
+
+    python3 benchmarks/run_suite.py --papers 10000 --output bench-10k.json
+    python3 benchmarks/run_suite.py --papers 100000 --baseline bench-100k.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import http.client
+import json
+import os
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+BENCH_DIR = Path(__file__).resolve().parent
+SCRIPTS_DIR = BENCH_DIR.parent / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+sys.path.insert(0, str(BENCH_DIR))
+
+from fake_arxiv_server import start_fake_arxiv  # noqa: E402
+from fake_openai_server import LLMServerConfig, start_fake_openai  # noqa: E402
+from synthetic_data import synthetic_arxiv_id, write_synthetic_payload  # noqa: E402
+
+SCENARIOS = ["fetch", "load", "summarize_new", "sse"]
+# metric -> True when larger is worse
+REGRESSION_METRICS = {
+    "wall_s": True,
+    "p95_latency_s": True,
+    "p95_ttft_s": True,
+    "peak_rss_mib": True,
+    "throughput_per_s": False,
+}
+
+
+def p95(values: list[float]) -> float:
+    if not values:
+        return 0.0
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=20)[18]
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+def run_probed(tmp: Path, name: str, args: list[str], env: dict[str, str]) -> tuple[float, dict[str, Any]]:
+    """Run a script under rss_probe.py; returns (wall seconds, probe result)."""
+    probe_out = tmp / f"{name}.rss.json"
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, str(BENCH_DIR / "rss_probe.py"), str(probe_out), *args],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    wall = time.perf_counter() - started
+    if proc.returncode != 0:
+        raise RuntimeError(f"{name} exited {proc.returncode}: {proc.stderr[-800:] or proc.stdout[-800:]}")
+    return wall, json.loads(probe_out.read_text())
+
+
+def bench_env(**extra: str) -> dict[str, str]:
+    env = dict(os.environ)
+    env.update({"PYTHONUNBUFFERED": "1", "CI": "1", **extra})
+    return env
+
+
+def scenario_fetch(tmp: Path, args: argparse.Namespace) -> dict[str, Any]:
+    server, stats = start_fake_arxiv(papers=args.papers, window_days=30)
+    env = bench_env(ARXIV_API_URL=f"http://127.0.0.1:{server.server_address[1]}/api/query")
+    output = tmp / "feed" / "latest_cs_daily.json"
+    cmd = [str(SCRIPTS_DIR / "fetch_cs_ro.py"), "--window-days", "30", "--request-interval", "0", "--output", str(output)]
+    report: dict[str, Any] = {}
+    try:
+        for run in ("cold", "incremental"):
+            before = stats.requests
+            with stats.lock:
+                stats.latencies.clear()
+            wall, probe = run_probed(tmp, f"fetch_{run}", cmd, env)
+            payload = json.loads(output.read_text(encoding="utf-8"))
+            papers = sum(len(field.get("papers", [])) for field in payload.get("fields", []))
+            report[run] = {
+                "wall_s": round(wall, 3),
+                "api_requests": stats.requests - before,
+                "papers": papers,
+                "throughput_per_s": round(papers / wall, 1),
+                "p95_latency_s": round(p95(list(stats.latencies)), 4),
+                "peak_rss_mib": probe["peak_rss_mib"],
+            }
+    finally:
+        server.shutdown()
+    return report
+
+
+def run_load(input_path: Path, n: int) -> dict[str, Any]:
+    """Child side of the load scenario."""
+    import arxiv_fulltext_summarizer as core
+    from rss_probe import peak_rss_mib
+
+    started = time.perf_counter()
+    records = core.load_records(input_path)
+    loaded = time.perf_counter() - started
+    newest = core.sort_newest(records)[:n]
+    total = time.perf_counter() - started
+    return {
+        "wall_s": round(total, 3),
+        "load_s": round(loaded, 3),
+        "sort_s": round(total - loaded, 3),
+        "records": len(records),
+        "newest": len(newest),
+        "throughput_per_s": round(len(records) / total, 1),
+        "peak_rss_mib": round(peak_rss_mib(), 1),
+    }
+
+
+def scenario_load(tmp: Path, args: argparse.Namespace, payload: Path) -> dict[str, Any]:
+    proc = subprocess.run(
+        [sys.executable, __file__, "--child-load", str(payload), "--n", str(args.n)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def llm_config(args: argparse.Namespace) -> LLMServerConfig:
+    return LLMServerConfig(
+        latency=args.llm_latency,
+        tokens_per_s=args.llm_tokens_per_s,
+        completion_tokens=args.llm_completion_tokens,
+        rate_429=args.llm_rate_429,
+    )
+
+
+def scenario_summarize_new(tmp: Path, args: argparse.Namespace, payload: Path) -> dict[str, Any]:
+    server, stats = start_fake_openai(config=llm_config(args))
+    env = bench_env(LLM_BASE_URL=f"http://127.0.0.1:{server.server_address[1]}/v1", LLM_API_KEY="bench")
+    cmd = [
+        str(SCRIPTS_DIR / "arxiv_fulltext_summarizer.py"),
+        "summarize_new",
+        "--input",
+        str(payload),
+        "--output-dir",
+        str(tmp / "summaries"),
+        "--n",
+        str(args.summarize_n),
+        "--mode",
+        "fast",
+    ]
+    try:
+        wall, probe = run_probed(tmp, "summarize_new", cmd, env)
+    finally:
+        server.shutdown()
+    return {
+        "papers": args.summarize_n,
+        "wall_s": round(wall, 3),
+        "throughput_per_s": round(args.summarize_n / wall, 2),
+        "llm_requests": stats.requests,
+        "llm_429": stats.rejected_429,
+        "p95_latency_s": round(p95(stats.durations), 4),
+        "peak_rss_mib": probe["peak_rss_mib"],
+    }
+
+
+def sse_request(port: int, body: dict[str, Any]) -> dict[str, Any]:
+    started = time.perf_counter()
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=120)
+    conn.request("POST", "/api/summarize-one/stream", json.dumps(body), {"Content-Type": "application/json"})
+    resp = conn.getresponse()
+    first_token = 0.0
+    outcome = f"http_{resp.status}"
+    if resp.status == 200:
+        outcome = "incomplete"
+        for raw in resp:
+            line = raw.decode("utf-8").strip()
+            if line == "event: token" and not first_token:
+                first_token = time.perf_counter() - started
+            elif line in ("event: done", "event: error"):
+                outcome = line.split(": ", 1)[1]
+                break
+    conn.close()
+    return {"outcome": outcome, "ttft": first_token, "total": time.perf_counter() - started}
+
+
+def scenario_sse(tmp: Path, args: argparse.Namespace, payload: Path) -> dict[str, Any]:
+    llm, stats = start_fake_openai(config=llm_config(args))
+    port = free_port()
+    env = bench_env(LLM_BASE_URL=f"http://127.0.0.1:{llm.server_address[1]}/v1", LLM_API_KEY="bench")
+    probe_out = tmp / "sse.rss.json"
+    proc = subprocess.Popen(
+        [
+            sys.executable,
+            str(BENCH_DIR / "rss_probe.py"),
+            str(probe_out),
+            str(SCRIPTS_DIR / "realtime_summary_server.py"),
+            "--port",
+            str(port),
+            "--max-concurrency",
+            str(args.sse_concurrency),
+            "--max-queue",
+            str(args.sse_clients * args.sse_requests),
+        ],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    )
+    results: list[dict[str, Any]] = []
+    lock = threading.Lock()
+    try:
+        deadline = time.monotonic() + 60
+        while True:
+            try:
+                conn = http.client.HTTPConnection("127.0.0.1", port, timeout=2)
+                conn.request("GET", "/health")
+                if conn.getresponse().status == 200:
+                    break
+            except OSError:
+                pass
+            if time.monotonic() > deadline or proc.poll() is not None:
+                raise RuntimeError("realtime server did not come up")
+            time.sleep(0.2)
+
+        def client(worker: int) -> None:
+            for j in range(args.sse_requests):
+                body = {
+                    "arxiv_id": synthetic_arxiv_id((worker * args.sse_requests + j) % args.papers),
+                    "input_path": str(payload),
+                    "output_dir": str(tmp / "sse_summaries"),
+                    "save": False,
+                }
+                result = sse_request(port, body)
+                with lock:
+                    results.append(result)
+
+        started = time.perf_counter()
+        threads = [threading.Thread(target=client, args=(w,)) for w in range(args.sse_clients)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        wall = time.perf_counter() - started
+    finally:
+        proc.send_signal(signal.SIGINT)
+        try:
+            proc.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+        llm.shutdown()
+
+    ok = [r for r in results if r["outcome"] == "done"]
+    probe = json.loads(probe_out.read_text()) if probe_out.exists() else {}
+    return {
+        "streams": len(results),
+        "ok": len(ok),
+        "outcomes": {o: sum(1 for r in results if r["outcome"] == o) for o in sorted({r["outcome"] for r in results})},
+        "wall_s": round(wall, 3),
+        "throughput_per_s": round(len(ok) / wall, 2),
+        "p95_ttft_s": round(p95([r["ttft"] for r in ok]), 4),
+        "p95_latency_s": round(p95([r["total"] for r in ok]), 4),
+        "llm_429": stats.rejected_429,
+        "peak_rss_mib": probe.get("peak_rss_mib", 0.0),
+    }
+
+
+def compare(report: dict[str, Any], baseline: dict[str, Any], tolerance: float) -> list[str]:
+    """'scenario.metric: old -> new' for every metric that moved the wrong way by > tolerance."""
+    regressions: list[str] = []
+
+    def walk(new: Any, old: Any, path: str) -> None:
+        if isinstance(new, dict) and isinstance(old, dict):
+            for key, value in new.items():
+                if key in old:
+                    walk(value, old[key], f"{path}.{key}" if path else key)
+            return
+        metric = path.rsplit(".", 1)[-1]
+        if metric not in REGRESSION_METRICS or not isinstance(new, (int, float)) or not old:
+            return
+        ratio = new / old
+        worse = ratio > 1 + tolerance if REGRESSION_METRICS[metric] else ratio < 1 - tolerance
+        if worse:
+            regressions.append(f"{path}: {old} -> {new}")
+
+    walk(report.get("scenarios", {}), baseline.get("scenarios", {}), "")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--papers", type=int, default=10_000, help="Synthetic dataset size (10k-100k).")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS))
+    parser.add_argument("--n", type=int, default=300, help="Newest N for the load scenario.")
+    parser.add_argument("--summarize-n", type=int, default=20)
+    parser.add_argument("--sse-clients", type=int, default=8)
+    parser.add_argument("--sse-requests", type=int, default=3, help="Streams per SSE client.")
+    parser.add_argument("--sse-concurrency", type=int, default=4, help="Server --max-concurrency.")
+    parser.add_argument("--llm-latency", type=float, default=0.2)
+    parser.add_argument("--llm-tokens-per-s", type=float, default=200.0)
+    parser.add_argument("--llm-completion-tokens", type=int, default=60)
+    parser.add_argument("--llm-rate-429", type=float, default=0.05)
+    parser.add_argument("--baseline", type=Path, help="Earlier report to compare against.")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--output", type=Path, help="Also write the JSON report here.")
+    parser.add_argument("--child-load", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child_load:
+        print(json.dumps(run_load(args.child_load, args.n)))
+        return 0
+
+    wanted = [s.strip() for s in args.scenarios.split(",") if s.strip()]
+    unknown = sorted(set(wanted) - set(SCENARIOS))
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(unknown)}")
+
+    report: dict[str, Any] = {
+        "python": sys.version.split()[0],
+        "papers": args.papers,
+        "llm": {
+            "latency_s": args.llm_latency,
+            "tokens_per_s": args.llm_tokens_per_s,
+            "completion_tokens": args.llm_completion_tokens,
+            "rate_429": args.llm_rate_429,
+        },
+        "scenarios": {},
+    }
+    with tempfile.TemporaryDirectory() as tmp_name:
+        tmp = Path(tmp_name)
+        payload = tmp / "papers.json"
+        write_synthetic_payload(payload, args.papers)
+        for name in wanted:
+            print(f"[bench] {name} ...", file=sys.stderr, flush=True)
+            if name == "fetch":
+                result = scenario_fetch(tmp, args)
+            elif name == "load":
+                result = scenario_load(tmp, args, payload)
+            elif name == "summarize_new":
+                result = scenario_summarize_new(tmp, args, payload)
+            else:
+                result = scenario_sse(tmp, args, payload)
+            report["scenarios"][name] = result
+
+    exit_code = 0
+    if args.baseline:
+        regressions = compare(report, json.loads(args.baseline.read_text(encoding="utf-8")), args.tolerance)
+        report["regressions"] = regressions
+        exit_code = 1 if regressions else 0
+
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    return exit_code
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
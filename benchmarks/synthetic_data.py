@@ -0,0 +1,94 @@
+"""Synthetic arXiv-shaped payloads shared by the benchmark scripts."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+CATEGORIES = ["cs.RO", "cs.CV", "cs.CL", "cs.SY"]
+BASE_TIME = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+
+def synthetic_arxiv_id(i: int) -> str:
+    return f"{2600 + i // 90000}.{i % 90000:05d}"
+
+
+def synthetic_paper(i: int) -> dict[str, Any]:
+    cat = CATEGORIES[i % len(CATEGORIES)]
+    published = (BASE_TIME - timedelta(minutes=7 * i)).strftime("%Y-%m-%dT%H:%M:%SZ")
+    return {
+        "id": f"http://arxiv.org/abs/{synthetic_arxiv_id(i)}v1",
+        "title": f"Synthetic paper {i} on learning-based control",
+        "summary": f"We study problem {i}. " + "The method improves robustness and sample efficiency. " * 6,
+        "authors": ["A. Author", "B. Author"],
+        "published": published,
+        "updated": published,
+        "primary_category": cat,
+        "categories": [cat, "cs.LG"],
+        "pdf_url": "",
+        "field": cat,
+    }
+
+
+def write_synthetic_payload(path: Path, papers: int) -> None:
+    """`fields[].papers[]` payload in the shape fetch_cs_ro.py writes, newest first per field."""
+    per_field: dict[str, list[dict[str, Any]]] = {cat: [] for cat in CATEGORIES}
+    for i in range(papers):
+        per_field[CATEGORIES[i % len(CATEGORIES)]].append(synthetic_paper(i))
+    payload = {
+        "source": "synthetic",
+        "fetched_at": BASE_TIME.isoformat(),
+        "fields": [{"code": cat, "papers": rows} for cat, rows in per_field.items()],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+
+def synthetic_latexml_html(i: int, sections: int = 8, paras_per_section: int = 12) -> str:
+    """arXiv LaTeXML-shaped HTML: ids on section/para wrappers, inline math, cites, scripts."""
+    names = ["Introduction", "Related Work", "Method", "Experiments", "Results", "Ablation", "Discussion", "Conclusion"]
+    out = [
+        "<!DOCTYPE html><html lang=\"en\"><head><meta charset=\"utf-8\">",
+        f"<title>Synthetic paper {i}</title><style>.ltx_p{{margin:0}}</style>",
+        "<script>window.MathJax={tex:{inlineMath:[['$','$']]}};</script></head><body>",
+        "<nav class=\"ltx_page_navbar\"><p>Navigation entries that sit outside the article body.</p></nav>",
+        "<div class=\"ltx_page_main\"><div class=\"ltx_page_content\">",
+        f"<article class=\"ltx_document ltx_authors_1line\"><h1 class=\"ltx_title ltx_title_document\">Synthetic paper {i}</h1>",
+        "<div class=\"ltx_abstract\"><h6 class=\"ltx_title\">Abstract</h6>",
+        f"<p class=\"ltx_p\">We study problem {i} with a <em>learned</em> controller &amp; report results.</p></div>",
+    ]
+    for s in range(1, sections + 1):
+        name = names[(s - 1) % len(names)]
+        out.append(f"<section id=\"S{s}\" class=\"ltx_section\">")
+        out.append(
+            f"<h2 class=\"ltx_title ltx_title_section\"><span class=\"ltx_tag\">{s} </span>{name}</h2>"
+        )
+        for p in range(1, paras_per_section + 1):
+            if p == 4:
+                out.append(f"<section id=\"S{s}.SS1\" class=\"ltx_subsection\">")
+                out.append(f"<h3 class=\"ltx_title\"><span class=\"ltx_tag\">{s}.1</span>Details of {name.lower()}</h3>")
+            out.append(f"<div id=\"S{s}.p{p}\" class=\"ltx_para\"><p class=\"ltx_p\">")
+            out.append(
+                f"Paragraph {p} of section {s} describes the approach in detail, where the state "
+                f"<math alttext=\"x_t\" display=\"inline\"><semantics><msub><mi>x</mi><mi>t</mi></msub></semantics></math>"
+                f" evolves under the policy<!-- latexml comment --> and the reward "
+                f"<span class=\"ltx_text ltx_font_italic\">shaping</span>term follows "
+                f"<cite class=\"ltx_cite\">[<a href=\"#bib.bib{p}\" class=\"ltx_ref\">{p}</a>]</cite>.\n"
+                "    Results improve robustness&nbsp;and sample efficiency across benchmarks."
+            )
+            out.append("<noscript>Enable JavaScript to render the equations.</noscript></p></div>")
+            if p == 6:
+                out.append(
+                    f"<figure id=\"S{s}.F1\" class=\"ltx_figure\"><figcaption class=\"ltx_caption\">"
+                    f"<span class=\"ltx_tag\">Figure {s}: </span>Overview of the pipeline.</figcaption></figure>"
+                )
+        out.append("</section></section>")
+    out.append("<section id=\"bib\" class=\"ltx_bibliography\"><h2 class=\"ltx_title\">References</h2><ul>")
+    for b in range(1, 30):
+        out.append(f"<li id=\"bib.bib{b}\"><span class=\"ltx_bibblock\">A. Author. Title {b}. Venue, 2025.</span></li>")
+    out.append("</ul></section></article></div></div>")
+    out.append("<footer><p>Generated by LaTeXML. The footer paragraph is outside the article.</p></footer>")
+    out.append("</body></html>")
+    return "".join(out)
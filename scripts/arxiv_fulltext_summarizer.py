@@ -11,36 +11,81 @@ from __future__ import annotations
 
 import argparse
 import getpass
+import hashlib
+import heapq
+import importlib
+import importlib.util
 import json
+import math
 import os
 import re
 import sqlite3
 import sys
+import threading
 import time
+from array import array
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Iterable, Iterator
 
-try:
-    import fitz  # PyMuPDF
-except ModuleNotFoundError:
-    fitz = None
+import fulltext_validation
+import llm_pool
+import model_routing
+import runtime_metrics as metrics
+import tracing
 
 try:
-    import requests
-except ModuleNotFoundError:
-    requests = None
+    import fcntl
+except ModuleNotFoundError:  # Windows
+    fcntl = None
+
+# Heavy optional dependencies (PyMuPDF, requests, bs4/lxml, openai) load on first use through
+# optional_module(), so the abstract-only CLI path and the realtime server do not pay for
+# PDF/HTML tooling at startup.
+_OPTIONAL_MODULES: dict[str, Any] = {}
+_OPTIONAL_MODULES_LOCK = threading.Lock()
+
+# What each run mode needs: one entry per requirement, any module of an entry will do.
+RUNTIME_DEPS: dict[str, tuple[tuple[str, ...], ...]] = {
+    "abstract": (("openai",),),
+    "fulltext": (("openai",), ("requests",), ("lxml", "bs4"), ("fitz",)),
+}
+
+
+def optional_module(name: str) -> Any:
+    """Import `name` on first call and cache it; None when it is not installed."""
+    module = _OPTIONAL_MODULES.get(name, False)
+    if module is not False:
+        return module
+    with _OPTIONAL_MODULES_LOCK:
+        if name not in _OPTIONAL_MODULES:
+            try:
+                _OPTIONAL_MODULES[name] = importlib.import_module(name)
+            except ModuleNotFoundError:
+                _OPTIONAL_MODULES[name] = None
+        return _OPTIONAL_MODULES[name]
 
-try:
-    from bs4 import BeautifulSoup
-except ModuleNotFoundError:
-    BeautifulSoup = None
 
-try:
-    from openai import OpenAI
-except ModuleNotFoundError:
-    OpenAI = None
+# One endpoint pool per configuration, so runners built per request (the realtime server)
+# share health scores, hedge timers and HTTP connections.
+_ENDPOINT_POOLS: dict[tuple[str, str, str], llm_pool.EndpointPool] = {}
+_ENDPOINT_POOLS_LOCK = threading.Lock()
+
+
+def module_available(name: str) -> bool:
+    """Installed or not, without importing it."""
+    if _OPTIONAL_MODULES.get(name, False) is not False:
+        return _OPTIONAL_MODULES[name] is not None
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
 
 DEFAULT_BASE_URL = os.getenv(
     "LLM_BASE_URL",
@@ -50,11 +95,59 @@ DEFAULT_MODEL_FAST = os.getenv("LLM_MODEL_FAST", os.getenv("OPENAI_MODEL_FAST",
 DEFAULT_MODEL_DEEP = os.getenv("LLM_MODEL_DEEP", os.getenv("OPENAI_MODEL_DEEP", "qwen3.5-397b-a17b"))
 DEFAULT_MIN_CHARS = int(os.getenv("FULLTEXT_MIN_CHARS", "30000"))
 DEFAULT_CHUNK_MAX_CHARS = int(os.getenv("FULLTEXT_CHUNK_MAX_CHARS", "12000"))
+DEFAULT_CHUNK_TOKENS = int(os.getenv("FULLTEXT_CHUNK_TOKENS", "6000"))
+DEFAULT_CHUNK_OVERLAP_TOKENS = int(os.getenv("FULLTEXT_CHUNK_OVERLAP_TOKENS", "200"))
+DEFAULT_PAPER_TOKEN_BUDGET = int(os.getenv("FULLTEXT_PAPER_TOKENS", "18000"))
+# json_schema -> json_object -> off; a provider that rejects one mode is downgraded to the next.
+STRUCTURED_OUTPUT_MODES = ("json_schema", "json_object", "off")
+DEFAULT_STRUCTURED_OUTPUT = os.getenv("LLM_STRUCTURED_OUTPUT", "json_schema")
 DEFAULT_HTTP_RETRIES = int(os.getenv("FULLTEXT_HTTP_RETRIES", "4"))
 DEFAULT_HTTP_BACKOFF = float(os.getenv("FULLTEXT_HTTP_BACKOFF", "1.8"))
+DEFAULT_INDEX_COMPACT_BYTES = int(os.getenv("SUMMARY_INDEX_COMPACT_BYTES", str(64 * 1024)))
+DEFAULT_REPORT_TOKEN_BUDGET = int(os.getenv("DAILY_REPORT_TOKEN_BUDGET", "24000"))
+DEFAULT_REPORT_WORKERS = int(os.getenv("DAILY_REPORT_WORKERS", "4"))
+# SQLite inputs are opened read-only; set to 1 to let the loader add id/published indexes.
+SQLITE_BUILD_INDEXES = os.getenv("SQLITE_BUILD_INDEXES", "0").strip().lower() in {"1", "true", "yes"}
+# Prompt scaffolding + expected answer length reserved inside each report call.
+REPORT_PROMPT_OVERHEAD_TOKENS = 2500
+
+EPOCH_DATE = date(1970, 1, 1)
+JSON_STREAM_CHUNK_CHARS = 1 << 20
+
+SUMMARY_INDEX_FILE = "summary_index.json"
+SUMMARY_INDEX_JOURNAL = "summary_index.journal.jsonl"
+SUMMARY_INDEX_LOCK = ".summary_index.lock"
+RUN_JOURNAL_FILE = "summarize_new.journal.jsonl"
+SHARD_INDEX_GLOB = "summary_index.shard-*-of-*.json"
+SHARD_RECORDS_GLOB = "*_summarize_new_shard-*-of-*_records.json"
+
+CJK_RE = re.compile(r"[\u3000-\u303f\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uff00-\uffef]")
 
 METHOD_KEYWORDS = ["method", "approach", "model", "architecture", "training"]
 EXPERIMENT_KEYWORDS = ["experiment", "evaluation", "results", "ablation"]
+FULL_BODY_SIGNALS = fulltext_validation.KeywordSignalMatcher(
+    {"method": METHOD_KEYWORDS, "experiment": EXPERIMENT_KEYWORDS}
+)
+BOILERPLATE_HEADING_RE = re.compile(
+    r"^\s*(?:[A-Z]|\d+(?:\.\d+)*)?\.?\s*(?:references|bibliography|acknowledge?ments?|funding|"
+    r"author contributions|conflicts? of interest|competing interests|reproducibility checklist|checklist)\b",
+    re.IGNORECASE,
+)
+REFERENCE_YEAR_RE = re.compile(r"\b(?:19|20)\d{2}[a-z]?\b")
+RELEVANCE_TOKEN_RE = re.compile(r"[a-z][a-z0-9\-]+|[\u3400-\u4dbf\u4e00-\u9fff]")
+RELEVANCE_STOPWORDS = frozenset(
+    "the and for with that this from are was were our its their which using use used can has have "
+    "been into than then also such these those over under between both each more most other only "
+    "while where when what how not but all any may per via".split()
+)
+
+DAILY_REPORT_SECTIONS = """Output Markdown with sections:
+1) Daily highlights
+2) Method trends
+3) Evaluation patterns
+4) Risks and open gaps
+5) Suggested follow-up reading order
+"""
 
 ABSTRACT_OUTPUT_PROMPT = """只基于给定的论文 abstract 回答，禁止使用外部信息和臆测。
 
@@ -76,7 +169,7 @@ class FullTextUnavailableError(RuntimeError):
     """Raised when full paper body cannot be reliably extracted."""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PaperRecord:
     arxiv_id: str
     title: str
@@ -84,6 +177,19 @@ class PaperRecord:
     pdf_url: str
     published_date: str
     abstract: str
+    field: str = ""
+    # Sort/group keys derived once; PaperTable passes its precomputed columns.
+    published_ts: float | None = None
+    day_key: str | None = None
+    canonical_id: str = ""
+
+    def __post_init__(self) -> None:
+        if self.published_ts is None or self.day_key is None:
+            published_ts, day_key = published_sort_keys(self.published_date)
+            object.__setattr__(self, "published_ts", published_ts)
+            object.__setattr__(self, "day_key", day_key)
+        if not self.canonical_id:
+            object.__setattr__(self, "canonical_id", canonical_arxiv_id(self.arxiv_id))
 
 
 @dataclass
@@ -161,9 +267,12 @@ def parse_args() -> argparse.Namespace:
     )
     common.add_argument(
         "--mode",
-        choices=["fast", "deep"],
+        choices=["fast", "deep", "auto"],
         default="fast",
-        help="fast=batch cost-effective, deep=stronger single-paper synthesis.",
+        help=(
+            "fast=batch cost-effective, deep=stronger single-paper synthesis, "
+            "auto=route per paper by abstract length/field and escalate fast summaries that fail a quality check."
+        ),
     )
     common.add_argument(
         "--base-url",
@@ -185,6 +294,7 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Do not write summary markdown/index/records files to disk.",
     )
+    add_profiling_args(common)
 
     p_new = subparsers.add_parser(
         "summarize_new", parents=[common], help="Summarize newest N papers."
@@ -200,6 +310,60 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Also generate one daily report that synthesizes successful paper summaries.",
     )
+    p_new.add_argument(
+        "--resume",
+        action="store_true",
+        help=f"Replay {RUN_JOURNAL_FILE} in the output dir and skip papers that already succeeded.",
+    )
+    p_new.add_argument(
+        "--resummarize-all",
+        action="store_true",
+        help="Summarize every selected paper, even when its indexed abstract hash is unchanged.",
+    )
+    p_new.add_argument(
+        "--report-mode",
+        choices=["auto", "single", "hierarchical"],
+        default="auto",
+        help="Daily report strategy: auto switches to map-reduce when summaries exceed the token budget.",
+    )
+    p_new.add_argument(
+        "--report-token-budget",
+        type=int,
+        default=DEFAULT_REPORT_TOKEN_BUDGET,
+        help=f"Estimated tokens per report prompt (default: {DEFAULT_REPORT_TOKEN_BUDGET}).",
+    )
+    p_new.add_argument(
+        "--report-workers",
+        type=int,
+        default=DEFAULT_REPORT_WORKERS,
+        help=f"Concurrent bucket summaries in hierarchical mode (default: {DEFAULT_REPORT_WORKERS}).",
+    )
+
+    p_new.add_argument(
+        "--deep-token-budget",
+        type=int,
+        default=0,
+        help="--mode auto: estimated deep-model tokens for this batch; once spent, the rest stay fast (0=unlimited).",
+    )
+    p_new.add_argument(
+        "--deep-seconds-budget",
+        type=float,
+        default=0.0,
+        help="--mode auto: deep-model seconds for this batch; once spent, the rest stay fast (0=unlimited).",
+    )
+
+    p_new.add_argument(
+        "--shard-index",
+        type=int,
+        default=0,
+        help="This worker's shard (0-based) when splitting a run across hosts or matrix jobs.",
+    )
+    p_new.add_argument(
+        "--shard-count",
+        type=int,
+        default=1,
+        help="Total shards. Papers are assigned by a stable hash of the canonical arXiv id.",
+    )
 
     p_one = subparsers.add_parser(
         "summarize_one", parents=[common], help="Summarize one paper by ID or index."
@@ -211,13 +375,36 @@ def parse_args() -> argparse.Namespace:
         help="Target index in newest-first list (0-based). Useful when selecting from UI list.",
     )
 
+    p_merge = subparsers.add_parser(
+        "merge_shards",
+        aliases=["merge-shards"],
+        help="Merge shard index fragments and records into summary_index.json and one records file.",
+    )
+    p_merge.add_argument(
+        "--output-dir",
+        default="outputs/summaries",
+        help="Directory holding (or receiving) the merged summaries, index and records.",
+    )
+    p_merge.add_argument(
+        "--shard-dir",
+        action="append",
+        default=[],
+        help="Extra directory with shard outputs (e.g. a downloaded matrix artifact). Repeatable.",
+    )
+    p_merge.add_argument(
+        "--keep-fragments",
+        action="store_true",
+        help="Keep shard index fragments and records files after merging.",
+    )
+
     return parser.parse_args()
 
 
-def require_runtime_deps() -> None:
+def require_runtime_deps(mode: str = "abstract") -> None:
     missing: list[str] = []
-    if OpenAI is None:
-        missing.append("openai")
+    for choices in RUNTIME_DEPS[mode]:
+        if not any(module_available(name) for name in choices):
+            missing.append(" or ".join("PyMuPDF" if name == "fitz" else name for name in choices))
     if missing:
         raise RuntimeError(
             "Missing dependencies: "
@@ -240,6 +427,20 @@ def resolve_api_key() -> str:
     return ""
 
 
+def estimate_tokens(text: str) -> int:
+    """Cheap tokenizer-free estimate: ~1 token per CJK char, ~4 chars per token otherwise."""
+    if not text:
+        return 0
+    cjk = len(CJK_RE.findall(text))
+    return cjk + (len(text) - cjk + 3) // 4
+
+
+@lru_cache(maxsize=65536)
+def cached_token_count(text: str) -> int:
+    """estimate_tokens memoised per paragraph; chunking and relevance scoring ask repeatedly."""
+    return estimate_tokens(text)
+
+
 def clean_text(value: str) -> str:
     return re.sub(r"\s+", " ", value or "").strip()
 
@@ -254,6 +455,21 @@ def parse_datetime(raw: str) -> datetime | None:
         return None
 
 
+def published_sort_keys(raw: str) -> tuple[float, str]:
+    """Epoch seconds and Asia/Shanghai day key for a published date (0.0, "" if unparsable)."""
+    dt = parse_datetime(raw)
+    if dt is None:
+        return 0.0, ""
+    ts = dt.timestamp()
+    # Dependency-free UTC+8 conversion for day-level grouping.
+    return ts, _day_key_for_day_number(int((ts + 8 * 3600) // 86400))
+
+
+@lru_cache(maxsize=4096)
+def _day_key_for_day_number(day_number: int) -> str:
+    return sys.intern((EPOCH_DATE + timedelta(days=day_number)).isoformat())
+
+
 def normalize_arxiv_id(raw: str) -> str:
     value = (raw or "").strip()
     if not value:
@@ -271,7 +487,18 @@ def normalize_arxiv_id(raw: str) -> str:
 
 
 def canonical_arxiv_id(raw: str) -> str:
-    return re.sub(r"v\\d+$", "", normalize_arxiv_id(raw), flags=re.IGNORECASE)
+    return re.sub(r"v\d+$", "", normalize_arxiv_id(raw), flags=re.IGNORECASE)
+
+
+def abstract_hash(text: str) -> str:
+    """Short content hash of the cleaned abstract; changes when a revision edits it."""
+    return hashlib.sha1(clean_text(text).encode("utf-8")).hexdigest()[:16]
+
+
+def shard_of(arxiv_id: str, shard_count: int) -> int:
+    """Stable shard for a paper: same answer on every host and Python process."""
+    digest = hashlib.sha1(canonical_arxiv_id(arxiv_id).encode("utf-8")).hexdigest()
+    return int(digest[:12], 16) % shard_count
 
 
 def sanitize_id_for_filename(arxiv_id: str) -> str:
@@ -295,7 +522,7 @@ def derive_urls(arxiv_id: str) -> tuple[str, str]:
     )
 
 
-def normalize_record(raw: dict[str, Any]) -> PaperRecord | None:
+def normalize_values(raw: dict[str, Any]) -> tuple[str, str, str, str, str, str, str] | None:
     rid = normalize_arxiv_id(coalesce(raw.get("arxiv_id"), raw.get("id")))
     if not rid:
         return None
@@ -304,47 +531,415 @@ def normalize_record(raw: dict[str, Any]) -> PaperRecord | None:
     pdf_url = coalesce(raw.get("pdf_url"))
     default_html, default_pdf = derive_urls(rid)
 
-    return PaperRecord(
-        arxiv_id=rid,
-        title=coalesce(raw.get("title"), "Untitled"),
-        html_url=html_url or default_html,
-        pdf_url=pdf_url or default_pdf,
-        published_date=coalesce(raw.get("published_date"), raw.get("published")),
-        abstract=coalesce(raw.get("summary"), raw.get("abstract")),
+    return (
+        rid,
+        coalesce(raw.get("title"), "Untitled"),
+        html_url or default_html,
+        pdf_url or default_pdf,
+        coalesce(raw.get("published_date"), raw.get("published")),
+        coalesce(raw.get("summary"), raw.get("abstract")),
+        coalesce(raw.get("field"), raw.get("primary_category")),
     )
 
 
-def load_json_records(path: Path) -> list[PaperRecord]:
-    payload = json.loads(path.read_text(encoding="utf-8"))
-    rows: list[dict[str, Any]] = []
-
-    if isinstance(payload, list):
-        rows = [r for r in payload if isinstance(r, dict)]
-    elif isinstance(payload, dict):
-        if isinstance(payload.get("papers"), list):
-            rows.extend(r for r in payload["papers"] if isinstance(r, dict))
-        if isinstance(payload.get("fields"), list):
-            for field in payload["fields"]:
-                if not isinstance(field, dict):
-                    continue
-                papers = field.get("papers")
-                if isinstance(papers, list):
-                    rows.extend(r for r in papers if isinstance(r, dict))
-    else:
-        raise ValueError("Unsupported JSON structure for paper input.")
+def normalize_record(raw: dict[str, Any]) -> PaperRecord | None:
+    values = normalize_values(raw)
+    return PaperRecord(*values) if values is not None else None
+
+
+class PaperTable:
+    """Column-oriented paper store that the loaders fill directly.
+
+    One list per attribute, epoch timestamps in an `array("d")`, interned
+    field and day strings, and a canonical-id -> row dict (other versions of
+    an already-seen paper go to a small side dict). Dates are parsed and ids
+    canonicalized once per row on insert; `PaperRecord` objects are only
+    built for the rows a caller asks for.
+    """
+
+    def __init__(self) -> None:
+        self.arxiv_ids: list[str] = []
+        self.titles: list[str] = []
+        self.html_urls: list[str] = []
+        self.pdf_urls: list[str] = []
+        self.published_dates: list[str] = []
+        self.abstracts: list[str] = []
+        self.fields: list[str] = []
+        self.published_ts = array("d")
+        self.day_keys: list[str] = []
+        self.canonical_ids: list[str] = []
+        self._rows: dict[str, int] = {}
+        self._other_versions: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.arxiv_ids)
+
+    def add(self, raw: dict[str, Any]) -> bool:
+        """Normalize and append one raw row; duplicates of an earlier id are dropped."""
+        values = normalize_values(raw)
+        if values is None:
+            return False
+        rid, title, html_url, pdf_url, published_date, abstract, field_name = values
+        canonical = canonical_arxiv_id(rid)
+        row = len(self.arxiv_ids)
+        first_row = self._rows.get(canonical)
+        if first_row is None:
+            self._rows[canonical] = row
+        elif self.arxiv_ids[first_row] == rid or rid in self._other_versions:
+            return False
+        else:
+            self._other_versions[rid] = row
+
+        published_ts, day_key = published_sort_keys(published_date)
+        default_html, default_pdf = derive_urls(rid)
+        self.arxiv_ids.append(rid)
+        self.titles.append(title)
+        # Derived URLs are rebuilt on demand; only store ones the input overrides.
+        self.html_urls.append("" if html_url == default_html else html_url)
+        self.pdf_urls.append("" if pdf_url == default_pdf else pdf_url)
+        self.published_dates.append(published_date)
+        self.abstracts.append(abstract)
+        self.fields.append(sys.intern(field_name))
+        self.published_ts.append(published_ts)
+        self.day_keys.append(day_key)
+        self.canonical_ids.append(canonical)
+        return True
+
+    def record(self, row: int) -> PaperRecord:
+        rid = self.arxiv_ids[row]
+        html_url, pdf_url = self.html_urls[row], self.pdf_urls[row]
+        if not html_url or not pdf_url:
+            default_html, default_pdf = derive_urls(rid)
+            html_url, pdf_url = html_url or default_html, pdf_url or default_pdf
+        return PaperRecord(
+            arxiv_id=rid,
+            title=self.titles[row],
+            html_url=html_url,
+            pdf_url=pdf_url,
+            published_date=self.published_dates[row],
+            abstract=self.abstracts[row],
+            field=self.fields[row],
+            published_ts=self.published_ts[row],
+            day_key=self.day_keys[row],
+            canonical_id=self.canonical_ids[row],
+        )
 
-    normalized: list[PaperRecord] = []
+    def records(self, rows: Iterable[int] | None = None) -> list[PaperRecord]:
+        return [self.record(row) for row in (range(len(self)) if rows is None else rows)]
+
+    def newest_rows(self, n: int | None = None) -> list[int]:
+        """Rows newest first; ties keep load order, like `sort_newest`."""
+        rows = range(len(self))
+        if n is None or n >= len(self):
+            return sorted(rows, key=self.published_ts.__getitem__, reverse=True)
+        return heapq.nlargest(max(0, n), rows, key=self.published_ts.__getitem__)
+
+    def newest(self, n: int | None = None) -> list[PaperRecord]:
+        return self.records(self.newest_rows(n))
+
+    def latest_day(self) -> list[PaperRecord]:
+        """Every paper from the latest Asia/Shanghai day, newest first."""
+        latest_key = max(self.day_keys, default="")
+        if not latest_key:
+            return []
+        rows = [row for row, key in enumerate(self.day_keys) if key == latest_key]
+        rows.sort(key=self.published_ts.__getitem__, reverse=True)
+        return self.records(rows)
+
+    def find(self, arxiv_id: str) -> PaperRecord | None:
+        rid = normalize_arxiv_id(arxiv_id)
+        row = self._other_versions.get(rid)
+        if row is None:
+            row = self._rows.get(canonical_arxiv_id(rid))
+        return self.record(row) if row is not None else None
+
+
+class JsonPaperStream:
+    """Incremental reader for `fields[].papers[]`, `papers[]` or top-level list payloads.
+
+    Only the container structure is walked in Python. Each paper object, and
+    any value being skipped, is decoded by the stdlib C scanner through
+    `raw_decode`, refilling the buffer when a value runs past its end. Memory
+    stays near one chunk plus the paper being decoded, and callers can stop
+    after the first rows they need.
+    """
+
+    _WHITESPACE = " \t\n\r"
+
+    def __init__(self, fh: Any, chunk_chars: int = JSON_STREAM_CHUNK_CHARS) -> None:
+        self._fh = fh
+        self._chunk_chars = chunk_chars
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self, min_chars: int) -> bool:
+        if self._eof:
+            return False
+        data = self._fh.read(max(self._chunk_chars, min_chars))
+        if not data:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos :] + data
+        self._pos = 0
+        return True
+
+    def _peek(self) -> str:
+        while True:
+            buf, pos, size = self._buf, self._pos, len(self._buf)
+            while pos < size and buf[pos] in self._WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < size:
+                return buf[pos]
+            if not self._fill(0):
+                return ""
+
+    def _take(self, expected: str) -> None:
+        if self._peek() != expected:
+            raise ValueError(f"Malformed JSON paper input: expected {expected!r}")
+        self._pos += 1
+
+    def _value(self) -> Any:
+        self._peek()
+        want = self._chunk_chars
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                value, end = None, -1
+            # A value that ends exactly at the buffer edge may be a truncated number.
+            if end != -1 and (end < len(self._buf) or self._eof):
+                self._pos = end
+                return value
+            if not self._fill(want):
+                if end != -1:
+                    self._pos = end
+                    return value
+                raise ValueError("Malformed JSON paper input: truncated or invalid value")
+            want *= 2
+
+    def _array(self) -> Iterator[None]:
+        """Yield once per element with the cursor on it; the caller consumes the element."""
+        self._take("[")
+        if self._peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield
+            sep = self._peek()
+            self._pos += 1
+            if sep == "]":
+                return
+            if sep != ",":
+                raise ValueError("Malformed JSON paper input: expected ',' or ']'")
+
+    def _object(self) -> Iterator[str]:
+        """Yield each key with the cursor on its value; the caller consumes the value."""
+        self._take("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self._value()
+            self._take(":")
+            yield str(key)
+            sep = self._peek()
+            self._pos += 1
+            if sep == "}":
+                return
+            if sep != ",":
+                raise ValueError("Malformed JSON paper input: expected ',' or '}'")
+
+    def _papers(self) -> Iterator[dict[str, Any]]:
+        for _ in self._array():
+            item = self._value()
+            if isinstance(item, dict):
+                yield item
+
+    def rows(self) -> Iterator[dict[str, Any]]:
+        head = self._peek()
+        if head == "[":
+            yield from self._papers()
+            return
+        if head != "{":
+            raise ValueError("Unsupported JSON structure for paper input.")
+        for key in self._object():
+            if key == "papers" and self._peek() == "[":
+                yield from self._papers()
+            elif key == "fields" and self._peek() == "[":
+                for _ in self._array():
+                    if self._peek() != "{":
+                        self._value()
+                        continue
+                    for field_key in self._object():
+                        if field_key == "papers" and self._peek() == "[":
+                            yield from self._papers()
+                        else:
+                            self._value()
+            else:
+                self._value()
+
+
+def iter_json_paper_rows(path: Path) -> Iterator[dict[str, Any]]:
+    with open(path, "r", encoding="utf-8") as fh:
+        yield from JsonPaperStream(fh).rows()
+
+
+def load_json_table(path: Path) -> PaperTable:
+    table = PaperTable()
+    for row in iter_json_paper_rows(path):
+        table.add(row)
+    return table
+
+
+def _row_sort_keys(row: dict[str, Any]) -> tuple[float, str]:
+    return published_sort_keys(coalesce(row.get("published_date"), row.get("published")))
+
+
+def _row_arxiv_id(row: dict[str, Any]) -> str:
+    return normalize_arxiv_id(coalesce(row.get("arxiv_id"), row.get("id")))
+
+
+def stream_newest_json_records(path: Path, n: int) -> list[PaperRecord]:
+    """Newest `n` papers via a bounded heap; only heap entrants are normalized."""
+    if n <= 0:
+        return []
+    heap: list[tuple[float, int, PaperRecord]] = []
+    seen: set[str] = set()
+    for seq, row in enumerate(iter_json_paper_rows(path)):
+        rid = _row_arxiv_id(row)
+        if not rid or rid in seen:
+            continue
+        seen.add(rid)
+        published_ts, day_key = _row_sort_keys(row)
+        # (ts, -seq) orders ties by load order, matching a stable newest-first sort.
+        if len(heap) >= n and (published_ts, -seq) <= heap[0][:2]:
+            continue
+        values = normalize_values(row)
+        if values is None:
+            continue
+        entry = (published_ts, -seq, PaperRecord(*values, published_ts=published_ts, day_key=day_key))
+        if len(heap) < n:
+            heapq.heappush(heap, entry)
+        else:
+            heapq.heapreplace(heap, entry)
+    return [entry[2] for entry in sorted(heap, key=lambda e: (e[0], e[1]), reverse=True)]
+
+
+def stream_latest_day_json_records(path: Path) -> list[PaperRecord]:
+    """Papers of the latest Asia/Shanghai day, keeping only that day's rows in memory."""
+    latest_key = ""
+    kept: list[PaperRecord] = []
     seen: set[str] = set()
-    for row in rows:
-        item = normalize_record(row)
-        if item is None:
+    for row in iter_json_paper_rows(path):
+        rid = _row_arxiv_id(row)
+        if not rid or rid in seen:
             continue
-        if item.arxiv_id in seen:
+        seen.add(rid)
+        published_ts, day_key = _row_sort_keys(row)
+        if not day_key or day_key < latest_key:
             continue
-        seen.add(item.arxiv_id)
-        normalized.append(item)
+        if day_key > latest_key:
+            latest_key = day_key
+            kept = []
+        values = normalize_values(row)
+        if values is not None:
+            kept.append(PaperRecord(*values, published_ts=published_ts, day_key=day_key))
+    return sort_newest(kept)
+
+
+def stream_find_json_record(path: Path, arxiv_id: str) -> PaperRecord | None:
+    """First paper whose canonical id matches; stops reading at the match."""
+    target = canonical_arxiv_id(arxiv_id)
+    for row in iter_json_paper_rows(path):
+        rid = _row_arxiv_id(row)
+        if rid and canonical_arxiv_id(rid) == target:
+            return normalize_record(row)
+    return None
+
 
-    return normalized
+def is_json_input(input_path: Path) -> bool:
+    return input_path.suffix.lower() == ".json"
+
+
+def is_sqlite_input(input_path: Path) -> bool:
+    return input_path.suffix.lower() in {".sqlite", ".db"}
+
+
+def newest_records(input_path: Path, n: int) -> list[PaperRecord]:
+    if not input_path.exists():
+        raise FileNotFoundError(f"Input not found: {input_path}")
+    if is_json_input(input_path):
+        return stream_newest_json_records(input_path, n)
+    if is_sqlite_input(input_path):
+        return sqlite_newest_records(input_path, n)
+    return load_table(input_path).newest(n)
+
+
+def latest_day_records(input_path: Path) -> list[PaperRecord]:
+    if not input_path.exists():
+        raise FileNotFoundError(f"Input not found: {input_path}")
+    if is_json_input(input_path):
+        return stream_latest_day_json_records(input_path)
+    if is_sqlite_input(input_path):
+        return sqlite_latest_day_records(input_path)
+    return load_table(input_path).latest_day()
+
+
+def find_record(input_path: Path, arxiv_id: str) -> PaperRecord | None:
+    if not input_path.exists():
+        raise FileNotFoundError(f"Input not found: {input_path}")
+    if is_json_input(input_path):
+        return stream_find_json_record(input_path, arxiv_id)
+    if is_sqlite_input(input_path):
+        return sqlite_find_record(input_path, arxiv_id)
+    return load_table(input_path).find(arxiv_id)
+
+
+def load_json_records(path: Path) -> list[PaperRecord]:
+    return load_json_table(path).records()
+
+
+SQLITE_ID_PREFIXES = ("", "http://arxiv.org/abs/", "https://arxiv.org/abs/")
+
+
+@dataclass(frozen=True)
+class SqlitePaperSchema:
+    table: str
+    c_id: str
+    c_title: str | None
+    c_html: str | None
+    c_pdf: str | None
+    c_published: str | None
+    c_abstract: str | None
+    c_field: str | None
+    has_rowid: bool
+
+    def select_sql(self) -> str:
+        cols = [self.c_id, self.c_title, self.c_html, self.c_pdf, self.c_published, self.c_abstract, self.c_field]
+        return "SELECT " + ", ".join(_quote_ident(c) for c in cols if c) + f" FROM {_quote_ident(self.table)}"
+
+    def row_dict(self, row: sqlite3.Row) -> dict[str, Any]:
+        return {
+            "arxiv_id": row[self.c_id],
+            "title": row[self.c_title] if self.c_title else "",
+            "html_url": row[self.c_html] if self.c_html else "",
+            "pdf_url": row[self.c_pdf] if self.c_pdf else "",
+            "published_date": row[self.c_published] if self.c_published else "",
+            "summary": row[self.c_abstract] if self.c_abstract else "",
+            "field": row[self.c_field] if self.c_field else "",
+        }
+
+
+# (resolved path, PRAGMA schema_version) -> schema; probing and index creation run once per schema.
+_SQLITE_SCHEMAS: dict[tuple[str, int], SqlitePaperSchema] = {}
+_SQLITE_SCHEMAS_LOCK = threading.Lock()
+
+
+def _quote_ident(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
 
 
 def _choose_sql_table(conn: sqlite3.Connection) -> str:
@@ -355,107 +950,216 @@ def _choose_sql_table(conn: sqlite3.Connection) -> str:
         )
     ]
     for table in tables:
-        cols = [r[1] for r in conn.execute(f"PRAGMA table_info('{table}')")]
+        cols = [r[1] for r in conn.execute(f"PRAGMA table_info({_quote_ident(table)})")]
         lowered = {c.lower() for c in cols}
         if "arxiv_id" in lowered or "id" in lowered:
             return table
     raise ValueError("No suitable table found in SQLite input.")
 
 
-def load_sqlite_records(path: Path) -> list[PaperRecord]:
-    conn = sqlite3.connect(path)
+def _probe_sqlite_schema(conn: sqlite3.Connection) -> SqlitePaperSchema:
+    table = _choose_sql_table(conn)
+    cols = [r[1] for r in conn.execute(f"PRAGMA table_info({_quote_ident(table)})")]
+    by_lower = {c.lower(): c for c in reversed(cols)}
+
+    def pick_col(*names: str) -> str | None:
+        for n in names:
+            if n in by_lower:
+                return by_lower[n]
+        return None
+
+    try:
+        conn.execute(f"SELECT rowid FROM {_quote_ident(table)} LIMIT 0")
+        has_rowid = True
+    except sqlite3.OperationalError:
+        has_rowid = False
+    return SqlitePaperSchema(
+        table=table,
+        c_id=pick_col("arxiv_id", "id") or "",
+        c_title=pick_col("title"),
+        c_html=pick_col("html_url"),
+        c_pdf=pick_col("pdf_url"),
+        c_published=pick_col("published_date", "published"),
+        c_abstract=pick_col("summary", "abstract"),
+        c_field=pick_col("field", "primary_category"),
+        has_rowid=has_rowid,
+    )
+
+
+def _ensure_sqlite_indexes(conn: sqlite3.Connection, schema: SqlitePaperSchema) -> None:
+    """Create the id/published indexes the pushdown queries rely on (SQLITE_BUILD_INDEXES=1 only)."""
+    for col in (schema.c_id, schema.c_published):
+        if not col:
+            continue
+        index = f"idx_{schema.table}_{col}"
+        exists = conn.execute("SELECT 1 FROM sqlite_master WHERE type='index' AND name=?", (index,)).fetchone()
+        if exists:
+            continue
+        try:
+            conn.execute(f"CREATE INDEX {_quote_ident(index)} ON {_quote_ident(schema.table)}({_quote_ident(col)})")
+            conn.commit()
+            live_log(f"sqlite_index_created table={schema.table} column={col} index={index}")
+        except sqlite3.OperationalError as err:
+            live_log(f"sqlite_index_skipped table={schema.table} column={col} reason={err}")
+            return
+
+
+@contextmanager
+def open_sqlite_papers(path: Path) -> Iterator[tuple[sqlite3.Connection, SqlitePaperSchema]]:
+    """Open a papers DB; read-only unless SQLITE_BUILD_INDEXES allows writing indexes into it."""
+    if not path.exists():
+        raise FileNotFoundError(f"Input not found: {path}")
+    if SQLITE_BUILD_INDEXES:
+        conn = sqlite3.connect(path)
+    else:
+        conn = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
     conn.row_factory = sqlite3.Row
     try:
-        table = _choose_sql_table(conn)
-        cols = [r[1] for r in conn.execute(f"PRAGMA table_info('{table}')")]
-        lowered = {c.lower() for c in cols}
+        version = conn.execute("PRAGMA schema_version").fetchone()[0]
+        key = (str(path.resolve()), int(version))
+        with _SQLITE_SCHEMAS_LOCK:
+            schema = _SQLITE_SCHEMAS.get(key)
+        if schema is None:
+            schema = _probe_sqlite_schema(conn)
+            if SQLITE_BUILD_INDEXES:
+                _ensure_sqlite_indexes(conn, schema)
+            # Creating indexes bumps schema_version; cache under the post-index version.
+            version = conn.execute("PRAGMA schema_version").fetchone()[0]
+            with _SQLITE_SCHEMAS_LOCK:
+                _SQLITE_SCHEMAS[(key[0], int(version))] = schema
+        yield conn, schema
+    finally:
+        conn.close()
+
+
+def _sqlite_order_newest(schema: SqlitePaperSchema) -> str:
+    if not schema.c_published:
+        return " ORDER BY rowid" if schema.has_rowid else ""
+    order = f" ORDER BY {_quote_ident(schema.c_published)} DESC"
+    return order + (", rowid" if schema.has_rowid else "")
 
-        def pick_col(*names: str) -> str | None:
-            for n in names:
-                if n in lowered:
-                    for c in cols:
-                        if c.lower() == n:
-                            return c
-            return None
 
-        c_id = pick_col("arxiv_id", "id")
-        c_title = pick_col("title")
-        c_html = pick_col("html_url")
-        c_pdf = pick_col("pdf_url")
-        c_published = pick_col("published_date", "published")
-        c_abstract = pick_col("summary", "abstract")
+def load_sqlite_table(path: Path) -> PaperTable:
+    with open_sqlite_papers(path) as (conn, schema):
+        papers = PaperTable()
+        for row in conn.execute(schema.select_sql()):
+            papers.add(schema.row_dict(row))
+        return papers
 
-        select_cols = [c for c in [c_id, c_title, c_html, c_pdf, c_published, c_abstract] if c]
-        query = f"SELECT {', '.join(select_cols)} FROM '{table}'"
 
-        normalized: list[PaperRecord] = []
+def sqlite_newest_records(path: Path, n: int) -> list[PaperRecord]:
+    """`ORDER BY published DESC LIMIT n`, paging past duplicate or id-less rows."""
+    if n <= 0:
+        return []
+    with open_sqlite_papers(path) as (conn, schema):
+        query = schema.select_sql() + _sqlite_order_newest(schema) + " LIMIT ? OFFSET ?"
+        out: list[PaperRecord] = []
         seen: set[str] = set()
-        for row in conn.execute(query):
-            raw = {
-                "arxiv_id": row[c_id] if c_id else "",
-                "title": row[c_title] if c_title else "",
-                "html_url": row[c_html] if c_html else "",
-                "pdf_url": row[c_pdf] if c_pdf else "",
-                "published_date": row[c_published] if c_published else "",
-                "summary": row[c_abstract] if c_abstract else "",
-            }
-            item = normalize_record(raw)
-            if item is None:
-                continue
-            if item.arxiv_id in seen:
+        offset = 0
+        while len(out) < n:
+            rows = conn.execute(query, (n, offset)).fetchall()
+            for row in rows:
+                record = normalize_record(schema.row_dict(row))
+                if record is None or record.arxiv_id in seen:
+                    continue
+                seen.add(record.arxiv_id)
+                out.append(record)
+                if len(out) >= n:
+                    break
+            if len(rows) < n:
+                break
+            offset += len(rows)
+        # ISO strings with mixed offsets can sort slightly off in SQL; fix up in Python.
+        return sort_newest(out)
+
+
+def sqlite_latest_day_records(path: Path) -> list[PaperRecord]:
+    """Latest Asia/Shanghai day from the newest parsable row, then a range scan for that day."""
+    with open_sqlite_papers(path) as (conn, schema):
+        if not schema.c_published:
+            return []
+        pub = _quote_ident(schema.c_published)
+        latest_key = ""
+        for (raw,) in conn.execute(f"SELECT {pub} FROM {_quote_ident(schema.table)} ORDER BY {pub} DESC"):
+            latest_key = published_sort_keys(str(raw or ""))[1]
+            if latest_key:
+                break
+        if not latest_key:
+            return []
+        # The day starts at 16:00 UTC the previous date; a date-prefix bound is format-agnostic.
+        lower = (date.fromisoformat(latest_key) - timedelta(days=1)).isoformat()
+        query = schema.select_sql() + f" WHERE {pub} >= ?" + _sqlite_order_newest(schema)
+        out: list[PaperRecord] = []
+        seen: set[str] = set()
+        for row in conn.execute(query, (lower,)):
+            record = normalize_record(schema.row_dict(row))
+            if record is None or record.arxiv_id in seen or record.day_key != latest_key:
                 continue
-            seen.add(item.arxiv_id)
-            normalized.append(item)
+            seen.add(record.arxiv_id)
+            out.append(record)
+        return sort_newest(out)
 
-        return normalized
-    finally:
-        conn.close()
+
+def sqlite_find_record(path: Path, arxiv_id: str) -> PaperRecord | None:
+    """Index range scans for every stored spelling of the id (bare or abs URL, any version)."""
+    target = canonical_arxiv_id(arxiv_id)
+    if not target:
+        return None
+    with open_sqlite_papers(path) as (conn, schema):
+        col = _quote_ident(schema.c_id)
+        clauses = " OR ".join(f"({col} >= ? AND {col} < ?)" for _ in SQLITE_ID_PREFIXES)
+        params: list[str] = []
+        for prefix in SQLITE_ID_PREFIXES:
+            params.extend([prefix + target, prefix + target + "\uffff"])
+        query = schema.select_sql() + f" WHERE {clauses}" + _sqlite_order_newest(schema)
+        for row in conn.execute(query, params):
+            raw = schema.row_dict(row)
+            if canonical_arxiv_id(str(raw["arxiv_id"] or "")) == target:
+                return normalize_record(raw)
+        return None
 
 
-def load_records(input_path: Path) -> list[PaperRecord]:
+def load_sqlite_records(path: Path) -> list[PaperRecord]:
+    return load_sqlite_table(path).records()
+
+
+def load_table(input_path: Path) -> PaperTable:
     if not input_path.exists():
         raise FileNotFoundError(f"Input not found: {input_path}")
 
-    if input_path.suffix.lower() == ".json":
-        return load_json_records(input_path)
-    if input_path.suffix.lower() in {".sqlite", ".db"}:
-        return load_sqlite_records(input_path)
+    if is_json_input(input_path):
+        return load_json_table(input_path)
+    if is_sqlite_input(input_path):
+        return load_sqlite_table(input_path)
 
     raise ValueError("Unsupported input format. Use JSON or SQLite.")
 
 
-def sort_newest(records: Iterable[PaperRecord]) -> list[PaperRecord]:
-    def key_fn(item: PaperRecord) -> float:
-        dt = parse_datetime(item.published_date)
-        if dt is None:
-            return 0.0
-        return dt.timestamp()
+def load_records(input_path: Path) -> list[PaperRecord]:
+    return load_table(input_path).records()
+
 
-    return sorted(records, key=key_fn, reverse=True)
+def sort_newest(records: Iterable[PaperRecord]) -> list[PaperRecord]:
+    return sorted(records, key=lambda item: item.published_ts or 0.0, reverse=True)
 
 
 def date_key_asia_shanghai(item: PaperRecord) -> str:
-    dt = parse_datetime(item.published_date)
-    if dt is None:
-        return ""
-    utc_dt = dt.astimezone(timezone.utc)
-    # Dependency-free UTC+8 conversion for day-level grouping.
-    return (utc_dt + timedelta(hours=8)).date().isoformat()
+    return item.day_key or ""
 
 
-def pick_one_record(records: list[PaperRecord], arxiv_id: str | None, index: int | None) -> PaperRecord:
+def pick_one_record(input_path: Path, arxiv_id: str | None, index: int | None) -> PaperRecord:
     if arxiv_id:
-        target = canonical_arxiv_id(arxiv_id)
-        for item in records:
-            if canonical_arxiv_id(item.arxiv_id) == target:
-                return item
-        raise ValueError(f"arXiv ID not found in input: {target}")
+        paper = find_record(input_path, arxiv_id)
+        if paper is None:
+            raise ValueError(f"arXiv ID not found in input: {canonical_arxiv_id(arxiv_id)}")
+        return paper
 
     if index is None:
         raise ValueError("For summarize_one, provide --arxiv_id or --index.")
-    if index < 0 or index >= len(records):
+    newest = newest_records(input_path, index + 1) if index >= 0 else []
+    if index < 0 or index >= len(newest):
         raise IndexError(f"index out of range: {index}")
-    return records[index]
+    return newest[index]
 
 
 def retry_sleep(base: float, attempt: int) -> None:
@@ -469,6 +1173,7 @@ def fetch_with_retries(
     retries: int = DEFAULT_HTTP_RETRIES,
     backoff: float = DEFAULT_HTTP_BACKOFF,
 ) -> tuple[bytes | str, str]:
+    requests = optional_module("requests")
     last_error: str = ""
     for attempt in range(retries):
         try:
@@ -492,8 +1197,8 @@ def fetch_with_retries(
     raise RuntimeError(last_error or "unknown network error")
 
 
-def extract_html_sections(html: str, source_url: str) -> ExtractionResult:
-    soup = BeautifulSoup(html, "lxml")
+def extract_html_sections_bs4(html: str, source_url: str) -> ExtractionResult:
+    soup = optional_module("bs4").BeautifulSoup(html, "lxml")
     for tag in soup(["script", "style", "noscript"]):
         tag.decompose()
 
@@ -534,6 +1239,10 @@ def extract_html_sections(html: str, source_url: str) -> ExtractionResult:
     if current.paragraphs:
         sections.append(current)
 
+    return html_extraction_result(sections, source_url)
+
+
+def html_extraction_result(sections: list[HtmlSection], source_url: str) -> ExtractionResult:
     full_text_parts: list[str] = []
     for sec in sections:
         full_text_parts.append(f"\n## {sec.heading}")
@@ -549,8 +1258,133 @@ def extract_html_sections(html: str, source_url: str) -> ExtractionResult:
     )
 
 
+HTML_HEADING_TAGS = frozenset({"h1", "h2", "h3", "h4"})
+HTML_SKIP_TAGS = frozenset({"script", "style", "noscript"})
+
+
+def _parse_html_document(html: str) -> Any:
+    lxml_html = optional_module("lxml.html")
+    try:
+        return lxml_html.document_fromstring(html)
+    except ValueError:
+        # str input carrying an XML encoding declaration; hand lxml bytes instead.
+        parser = lxml_html.HTMLParser(encoding="utf-8")
+        return lxml_html.document_fromstring(html.encode("utf-8"), parser=parser)
+
+
+def _is_live_element(node: Any) -> bool:
+    return not any(
+        isinstance(parent.tag, str) and parent.tag.lower() in HTML_SKIP_TAGS
+        for parent in node.iterancestors()
+    )
+
+
+def _first_live_element(doc: Any, tag: str, element_id: str | None = None) -> Any:
+    for node in doc.iter(tag):
+        if element_id is not None and node.get("id") != element_id:
+            continue
+        if _is_live_element(node):
+            return node
+    return None
+
+
+def extract_html_sections_lxml(html: str, source_url: str) -> ExtractionResult:
+    """Same sections as extract_html_sections_bs4, from a single walk over the lxml tree.
+
+    script/style/noscript subtrees are skipped instead of decomposed, text is
+    gathered per text node (so `a<b>b</b>` still reads "a b"), and the nearest
+    id-carrying ancestor rides along on the walk stack rather than being looked
+    up again for every heading.
+    """
+    try:
+        doc = _parse_html_document(html)
+    except optional_module("lxml.etree").ParserError:  # empty document
+        return html_extraction_result([], source_url)
+
+    # lxml elements are falsy when childless, so no `or` chain here.
+    root = doc
+    for tag, element_id in (("article", None), ("main", None), ("div", "content"), ("body", None)):
+        found = _first_live_element(doc, tag, element_id)
+        if found is not None:
+            root = found
+            break
+
+    base_anchor = ""
+    for parent in root.iterancestors():
+        if "id" in parent.attrib:
+            base_anchor = parent.get("id") or ""
+            break
+
+    # h1-h4/p blocks in document (start-tag) order: (is_heading, text parts, anchor).
+    blocks: list[tuple[bool, list[str], str]] = []
+    # Parts lists of the blocks still open around the walk position.
+    collectors: list[list[str]] = []
+    # (node, child iterator, nearest anchor for children, opened a collector)
+    stack: list[tuple[Any, Iterator[Any], str, bool]] = []
+
+    def emit(text: str | None) -> None:
+        if text:
+            for parts in collectors:
+                parts.append(text)
+
+    def enter(node: Any, parent_anchor: str) -> bool:
+        tag = node.tag
+        if not isinstance(tag, str):  # comments / processing instructions
+            return False
+        name = tag.lower()
+        if name in HTML_SKIP_TAGS:
+            return False
+        is_block = name in HTML_HEADING_TAGS or name == "p"
+        if is_block:
+            parts: list[str] = []
+            blocks.append((name != "p", parts, node.get("id") or parent_anchor))
+            collectors.append(parts)
+        emit(node.text)
+        anchor = (node.get("id") or "") if "id" in node.attrib else parent_anchor
+        stack.append((node, iter(node), anchor, is_block))
+        return True
+
+    enter(root, base_anchor)
+    while stack:
+        _, children, anchor, _ = stack[-1]
+        child = next(children, None)
+        if child is not None:
+            if not enter(child, anchor):
+                emit(child.tail)
+            continue
+        node, _, _, is_block = stack.pop()
+        if is_block:
+            collectors.pop()
+        if stack:
+            emit(node.tail)
+
+    sections: list[HtmlSection] = []
+    current = HtmlSection(heading="Front Matter", anchor_id="", paragraphs=[])
+    for is_heading, parts, heading_anchor in blocks:
+        text = clean_text(" ".join(parts))
+        if is_heading:
+            if not text:
+                continue
+            if current.paragraphs:
+                sections.append(current)
+            current = HtmlSection(heading=text[:180], anchor_id=heading_anchor, paragraphs=[])
+        elif len(text) >= 40:
+            current.paragraphs.append(text)
+
+    if current.paragraphs:
+        sections.append(current)
+
+    return html_extraction_result(sections, source_url)
+
+
+def extract_html_sections(html: str, source_url: str) -> ExtractionResult:
+    if optional_module("lxml.html") is not None:
+        return extract_html_sections_lxml(html, source_url)
+    return extract_html_sections_bs4(html, source_url)
+
+
 def extract_pdf_pages(pdf_bytes: bytes, source_url: str) -> ExtractionResult:
-    doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+    doc = optional_module("fitz").open(stream=pdf_bytes, filetype="pdf")
     pages: list[tuple[int, str]] = []
     try:
         for i in range(doc.page_count):
@@ -570,28 +1404,42 @@ def extract_pdf_pages(pdf_bytes: bytes, source_url: str) -> ExtractionResult:
     )
 
 
+@lru_cache(maxsize=32)
+def keyword_signal_matcher(*keyword_sets: tuple[str, ...]) -> fulltext_validation.KeywordSignalMatcher:
+    return fulltext_validation.KeywordSignalMatcher({str(i): kws for i, kws in enumerate(keyword_sets)})
+
+
 def has_heading_like(text: str, keywords: list[str]) -> bool:
-    pattern = re.compile(
-        r"^\s*(?:\d+(?:\.\d+)*\s+)?(?:[A-Z][A-Za-z0-9\-,: ]{0,80})?\b(" + "|".join(re.escape(k) for k in keywords) + r")\b",
-        re.IGNORECASE | re.MULTILINE,
-    )
-    return bool(pattern.search(text))
+    scan = fulltext_validation.BodySignalScan(keyword_signal_matcher(tuple(keywords)))
+    scan.add_text(text)
+    return bool(scan.finish())
 
 
 def pass_full_body_checks(result: ExtractionResult, min_chars: int) -> None:
     if len(result.full_text) <= min_chars:
         raise FullTextUnavailableError("Full text not available; cannot summarize.")
 
-    heading_candidates = [sec.heading.lower() for sec in result.html_sections]
-    method_ok = any(any(k in h for k in METHOD_KEYWORDS) for h in heading_candidates)
-    exp_ok = any(any(k in h for k in EXPERIMENT_KEYWORDS) for h in heading_candidates)
+    scan = fulltext_validation.BodySignalScan(FULL_BODY_SIGNALS)
+    for sec in result.html_sections:
+        scan.add_heading(sec.heading)
+        if scan.complete:
+            return
 
-    if not method_ok:
-        method_ok = has_heading_like(result.full_text, METHOD_KEYWORDS)
-    if not exp_ok:
-        exp_ok = has_heading_like(result.full_text, EXPERIMENT_KEYWORDS)
+    # Same lines as full_text, taken from the structured result so nothing is re-joined.
+    if result.pdf_pages:
+        for page_no, page_text in result.pdf_pages:
+            scan.add_page(page_no, page_text)
+            if scan.complete:
+                return
+    elif result.html_sections:
+        for sec in result.html_sections:
+            scan.add_lines("\n".join([f"## {sec.heading}", *sec.paragraphs]))
+            if scan.complete:
+                return
+    else:
+        scan.add_text(result.full_text)
 
-    if not (method_ok and exp_ok):
+    if not scan.complete and not scan.wanted <= scan.finish():
         raise FullTextUnavailableError("Full text not available; cannot summarize.")
 
 
@@ -632,102 +1480,404 @@ def retrieve_full_text(
     raise FullTextUnavailableError("Full text not available; cannot summarize.")
 
 
-def chunk_html_sections(sections: list[HtmlSection], max_chars: int) -> list[TextChunk]:
-    chunks: list[TextChunk] = []
-    chunk_idx = 1
+@dataclass(frozen=True, slots=True)
+class ChunkUnit:
+    """One packable piece of a document: a paragraph (or a slice of an oversized one) or a page."""
 
-    for sec in sections:
+    group: int  # section index for HTML, page number for PDF
+    position: int  # 1-based paragraph number inside the section; page number for PDF
+    text: str
+    tokens: int
+
+
+def split_to_token_budget(text: str, budget: int) -> list[str]:
+    """Cut text that alone exceeds the budget into whitespace-aligned slices that fit."""
+    tokens = cached_token_count(text)
+    if tokens <= budget or budget <= 0:
+        return [text]
+    piece_chars = max(1, int(len(text) * budget / tokens))
+    pieces: list[str] = []
+    start = 0
+    while start < len(text):
+        end = min(len(text), start + piece_chars)
+        if end < len(text):
+            cut = text.rfind(" ", start + piece_chars // 2, end)
+            if cut > start:
+                end = cut
+        piece = text[start:end].strip()
+        if piece:
+            pieces.append(piece)
+        start = end
+    return pieces
+
+
+def pack_chunk_units(
+    units: list[ChunkUnit],
+    token_budget: int,
+    overlap_tokens: int,
+    group_header_tokens: dict[int, int] | None = None,
+) -> list[list[ChunkUnit]]:
+    """Greedily fill chunks up to token_budget; each chunk after the first re-opens with the
+    trailing units of the previous one, up to overlap_tokens, so context carries across the cut."""
+    headers = group_header_tokens or {}
+    packs: list[list[ChunkUnit]] = []
+    current: list[ChunkUnit] = []
+    used = 0
+    fresh = False  # current holds something beyond the carried-over overlap
+
+    def cost(unit: ChunkUnit, previous: ChunkUnit | None) -> int:
+        header = headers.get(unit.group, 0) if previous is None or previous.group != unit.group else 0
+        return unit.tokens + 1 + header
+
+    for unit in units:
+        unit_cost = cost(unit, current[-1] if current else None)
+        if fresh and used + unit_cost > token_budget:
+            packs.append(current)
+            carried: list[ChunkUnit] = []
+            carried_tokens = 0
+            for prev in reversed(current):
+                if carried_tokens + prev.tokens > overlap_tokens:
+                    break
+                carried.insert(0, prev)
+                carried_tokens += prev.tokens
+            current = []
+            used = 0
+            for prev in carried:
+                used += cost(prev, current[-1] if current else None)
+                current.append(prev)
+            fresh = False
+            unit_cost = cost(unit, current[-1] if current else None)
+            if used + unit_cost > token_budget:
+                current, used = [], 0
+                unit_cost = cost(unit, None)
+        current.append(unit)
+        used += unit_cost
+        fresh = True
+
+    if fresh:
+        packs.append(current)
+    return packs
+
+
+def html_section_header(sec: HtmlSection) -> str:
+    return f"Section: {sec.heading}\n"
+
+
+def chunk_html_sections(
+    sections: list[HtmlSection],
+    token_budget: int = DEFAULT_CHUNK_TOKENS,
+    overlap_tokens: int = DEFAULT_CHUNK_OVERLAP_TOKENS,
+) -> list[TextChunk]:
+    units: list[ChunkUnit] = []
+    header_tokens: dict[int, int] = {}
+    for group, sec in enumerate(sections):
         if not sec.paragraphs:
             continue
-        start = 1
-        current: list[str] = []
-        current_len = 0
-
-        for i, para in enumerate(sec.paragraphs, start=1):
-            candidate_len = current_len + len(para) + 1
-            if current and candidate_len > max_chars:
-                end = i - 1
-                evidence = f"({sec.heading}, paragraphs {start}-{end}, anchor {sec.anchor_id or 'N/A'})"
-                text = f"Section: {sec.heading}\n" + "\n".join(current)
-                chunks.append(TextChunk(chunk_id=f"C{chunk_idx:03d}", text=text, evidence_pointer=evidence))
-                chunk_idx += 1
-                current = []
-                current_len = 0
-                start = i
-
-            current.append(para)
-            current_len += len(para) + 1
-
-        if current:
-            end = len(sec.paragraphs)
-            evidence = f"({sec.heading}, paragraphs {start}-{end}, anchor {sec.anchor_id or 'N/A'})"
-            text = f"Section: {sec.heading}\n" + "\n".join(current)
-            chunks.append(TextChunk(chunk_id=f"C{chunk_idx:03d}", text=text, evidence_pointer=evidence))
-            chunk_idx += 1
+        header_tokens[group] = cached_token_count(html_section_header(sec))
+        room = max(1, token_budget - header_tokens[group] - 1)
+        for position, para in enumerate(sec.paragraphs, start=1):
+            for piece in split_to_token_budget(para, room):
+                units.append(ChunkUnit(group, position, piece, cached_token_count(piece)))
 
-    return chunks
-
-
-def chunk_pdf_pages(pages: list[tuple[int, str]], max_chars: int) -> list[TextChunk]:
     chunks: list[TextChunk] = []
-    chunk_idx = 1
-    current_pages: list[tuple[int, str]] = []
-    current_len = 0
+    for chunk_idx, pack in enumerate(pack_chunk_units(units, token_budget, overlap_tokens, header_tokens), start=1):
+        # Consecutive runs of one section keep the per-section evidence format; a chunk that
+        # spans sections lists one pointer per section.
+        runs: list[list[ChunkUnit]] = []
+        for unit in pack:
+            if runs and runs[-1][-1].group == unit.group:
+                runs[-1].append(unit)
+            else:
+                runs.append([unit])
+        texts: list[str] = []
+        evidence: list[str] = []
+        for run in runs:
+            sec = sections[run[0].group]
+            texts.append(html_section_header(sec) + "\n".join(unit.text for unit in run))
+            evidence.append(
+                f"({sec.heading}, paragraphs {run[0].position}-{run[-1].position}, anchor {sec.anchor_id or 'N/A'})"
+            )
+        chunks.append(
+            TextChunk(chunk_id=f"C{chunk_idx:03d}", text="\n\n".join(texts), evidence_pointer="; ".join(evidence))
+        )
+    return chunks
 
-    def flush() -> None:
-        nonlocal chunk_idx, current_pages, current_len
-        if not current_pages:
-            return
-        p_start = current_pages[0][0]
-        p_end = current_pages[-1][0]
-        evidence = f"(pages {p_start}-{p_end})"
-        text = "\n".join([f"[Page {n}] {t}" for n, t in current_pages])
-        chunks.append(TextChunk(chunk_id=f"C{chunk_idx:03d}", text=text, evidence_pointer=evidence))
-        chunk_idx += 1
-        current_pages = []
-        current_len = 0
 
+def chunk_pdf_pages(
+    pages: list[tuple[int, str]],
+    token_budget: int = DEFAULT_CHUNK_TOKENS,
+    overlap_tokens: int = DEFAULT_CHUNK_OVERLAP_TOKENS,
+) -> list[TextChunk]:
+    units: list[ChunkUnit] = []
     for page_no, page_text in pages:
-        candidate_len = current_len + len(page_text) + 20
-        if current_pages and candidate_len > max_chars:
-            flush()
-        current_pages.append((page_no, page_text))
-        current_len += len(page_text) + 20
+        prefix_tokens = cached_token_count(f"[Page {page_no}] ")
+        for piece in split_to_token_budget(page_text, max(1, token_budget - prefix_tokens - 1)):
+            units.append(ChunkUnit(page_no, page_no, piece, cached_token_count(piece) + prefix_tokens))
 
-    flush()
+    chunks: list[TextChunk] = []
+    for chunk_idx, pack in enumerate(pack_chunk_units(units, token_budget, overlap_tokens), start=1):
+        evidence = f"(pages {pack[0].position}-{pack[-1].position})"
+        text = "\n".join([f"[Page {unit.position}] {unit.text}" for unit in pack])
+        chunks.append(TextChunk(chunk_id=f"C{chunk_idx:03d}", text=text, evidence_pointer=evidence))
     return chunks
 
 
-def build_chunks(result: ExtractionResult, max_chars: int) -> list[TextChunk]:
+def build_chunks(
+    result: ExtractionResult,
+    token_budget: int = DEFAULT_CHUNK_TOKENS,
+    overlap_tokens: int = DEFAULT_CHUNK_OVERLAP_TOKENS,
+) -> list[TextChunk]:
     if result.source_type == "html":
-        chunks = chunk_html_sections(result.html_sections, max_chars=max_chars)
+        chunks = chunk_html_sections(result.html_sections, token_budget, overlap_tokens)
     else:
-        chunks = chunk_pdf_pages(result.pdf_pages, max_chars=max_chars)
+        chunks = chunk_pdf_pages(result.pdf_pages, token_budget, overlap_tokens)
 
     if not chunks:
-        fallback_text = result.full_text[:max_chars]
+        fallback_text = split_to_token_budget(result.full_text, token_budget)[0] if result.full_text else ""
         evidence = "(document body, location not segmented)"
         chunks = [TextChunk(chunk_id="C001", text=fallback_text, evidence_pointer=evidence)]
     return chunks
 
 
-def parse_json_response(text: str) -> dict[str, Any]:
+def is_boilerplate_heading(heading: str) -> bool:
+    return bool(BOILERPLATE_HEADING_RE.match(heading))
+
+
+def looks_like_reference_list(text: str) -> bool:
+    """Bibliography pages/chunks: a publication year every few words. Catches PDF back matter
+    that has no section headings to go by."""
+    words = len(text.split())
+    years = len(REFERENCE_YEAR_RE.findall(text))
+    return years >= 20 and years * 100 >= words * 3
+
+
+def drop_boilerplate_sections(result: ExtractionResult) -> tuple[ExtractionResult, list[HtmlSection]]:
+    """Remove references/acknowledgements-style HTML sections before chunking."""
+    if result.source_type != "html":
+        return result, []
+    kept: list[HtmlSection] = []
+    dropped: list[HtmlSection] = []
+    for sec in result.html_sections:
+        (dropped if is_boilerplate_heading(sec.heading) else kept).append(sec)
+    if not dropped or not kept:
+        return result, []
+    return html_extraction_result(kept, result.source_url), dropped
+
+
+def relevance_terms(text: str) -> list[str]:
+    return [tok for tok in RELEVANCE_TOKEN_RE.findall(text.lower()) if tok not in RELEVANCE_STOPWORDS]
+
+
+def bm25_scores(documents: list[list[str]], query: list[str], k1: float = 1.5, b: float = 0.75) -> list[float]:
+    """Okapi BM25 of each tokenised document against the query terms (set semantics)."""
+    if not documents:
+        return []
+    doc_freq: Counter[str] = Counter()
+    term_counts = [Counter(doc) for doc in documents]
+    for counts in term_counts:
+        doc_freq.update(counts.keys())
+    n_docs = len(documents)
+    avg_len = sum(len(doc) for doc in documents) / n_docs or 1.0
+    idf = {
+        term: math.log(1.0 + (n_docs - doc_freq[term] + 0.5) / (doc_freq[term] + 0.5))
+        for term in set(query)
+        if doc_freq[term]
+    }
+    scores: list[float] = []
+    for doc, counts in zip(documents, term_counts):
+        norm = k1 * (1.0 - b + b * len(doc) / avg_len)
+        score = 0.0
+        for term, weight in idf.items():
+            tf = counts.get(term, 0)
+            if tf:
+                score += weight * tf * (k1 + 1.0) / (tf + norm)
+        scores.append(score)
+    return scores
+
+
+def chunk_relevance_query(paper: PaperRecord) -> list[str]:
+    return relevance_terms(" ".join([paper.title, paper.abstract, *METHOD_KEYWORDS, *EXPERIMENT_KEYWORDS]))
+
+
+def select_relevant_chunks(
+    chunks: list[TextChunk],
+    query: list[str],
+    token_budget: int = DEFAULT_PAPER_TOKEN_BUDGET,
+) -> tuple[list[TextChunk], dict[str, int]]:
+    """Keep the highest-BM25 chunks that fit the per-paper budget, in document order.
+
+    Reference-list chunks are dropped outright; the best-scoring chunk is always kept
+    so a paper never reaches the model empty-handed.
+    """
+    tokens = [cached_token_count(chunk.text) for chunk in chunks]
+    candidates = [i for i, chunk in enumerate(chunks) if not looks_like_reference_list(chunk.text)]
+    if not candidates:
+        candidates = list(range(len(chunks)))
+    scores = bm25_scores([relevance_terms(chunks[i].text) for i in candidates], query)
+
+    chosen: list[int] = []
+    used = 0
+    for score, i in sorted(zip(scores, candidates), key=lambda item: (-item[0], item[1])):
+        if chosen and used + tokens[i] > token_budget:
+            continue
+        chosen.append(i)
+        used += tokens[i]
+    chosen.sort()
+
+    total = sum(tokens)
+    stats = {
+        "chunks_total": len(chunks),
+        "chunks_selected": len(chosen),
+        "chunks_reference_list": len(chunks) - len(candidates),
+        "tokens_total": total,
+        "tokens_selected": used,
+        "tokens_saved": total - used,
+    }
+    return [chunks[i] for i in chosen], stats
+
+
+def prepare_fulltext_chunks(
+    paper: PaperRecord,
+    result: ExtractionResult,
+    chunk_tokens: int = DEFAULT_CHUNK_TOKENS,
+    overlap_tokens: int = DEFAULT_CHUNK_OVERLAP_TOKENS,
+    paper_token_budget: int = DEFAULT_PAPER_TOKEN_BUDGET,
+) -> tuple[list[TextChunk], dict[str, int]]:
+    """Chunks worth a summarize_chunk call: boilerplate sections dropped, then BM25-selected
+    against the title, abstract and METHOD/EXPERIMENT keywords within the paper budget.
+
+    Library helper: summarize_single_paper is abstract-only and does not call this yet.
+    """
+    trimmed, dropped = drop_boilerplate_sections(result)
+    chunks = build_chunks(trimmed, chunk_tokens, overlap_tokens)
+    selected, stats = select_relevant_chunks(chunks, chunk_relevance_query(paper), paper_token_budget)
+    boilerplate_tokens = sum(cached_token_count(para) for sec in dropped for para in sec.paragraphs)
+    stats["sections_dropped"] = len(dropped)
+    stats["tokens_total"] += boilerplate_tokens
+    stats["tokens_saved"] += boilerplate_tokens
+    return selected, stats
+
+
+CHUNK_SUMMARY_FIELDS = ("key_points", "method_details", "experiment_details", "resources", "reasoning_brief")
+CHUNK_SUMMARY_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {name: {"type": "array", "items": {"type": "string"}} for name in CHUNK_SUMMARY_FIELDS},
+    "required": list(CHUNK_SUMMARY_FIELDS),
+    "additionalProperties": False,
+}
+
+STRUCTURED_OUTPUT_RESULTS = metrics.REGISTRY.counter(
+    "myarxiv_structured_output_total",
+    "Structured LLM replies by response_format mode and outcome (ok, repaired, reasked, failed).",
+    ("mode", "outcome"),
+)
+MODEL_ROUTING_DECISIONS = metrics.REGISTRY.counter(
+    "myarxiv_model_routing_total",
+    "--mode auto abstract summaries by final tier and routing reason.",
+    ("tier", "reason"),
+)
+
+
+def strip_code_fences(text: str) -> str:
     text = text.strip()
     if text.startswith("```"):
         text = re.sub(r"^```(?:json)?", "", text).strip()
         text = re.sub(r"```$", "", text).strip()
+    return text
 
-    start = text.find("{")
-    end = text.rfind("}")
-    if start >= 0 and end > start:
-        text = text[start : end + 1]
 
+def repair_json_text(text: str) -> str | None:
+    """Cheap local repair of an almost-JSON object reply.
+
+    Takes the first balanced {...} in one string-aware pass (braces and commas inside
+    values do not count), drops trailing commas before closing brackets, and for a
+    truncated reply drops a dangling `"key"` / `"key":`, closes an open string and
+    the open brackets. Returns None when there is no object to recover.
+    """
+    start = text.find("{")
+    if start < 0:
+        return None
+    out: list[str] = []
+    # One frame per open bracket: [closer, state, index in `out` where the current key starts].
+    # Object states: "key" (a key may follow), "colon" (key read), "value" (after ':'), "member" (value begun).
+    stack: list[list[Any]] = []
+    in_string = False
+    escaped = False
+
+    def drop_trailing_comma() -> None:
+        i = len(out) - 1
+        while i >= 0 and out[i].isspace():
+            i -= 1
+        if i >= 0 and out[i] == ",":
+            del out[i]
+
+    for ch in text[start:]:
+        if in_string:
+            out.append(ch)
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+            continue
+        frame = stack[-1] if stack else None
+        in_object = frame is not None and frame[0] == "}"
+        if ch in "}]":
+            drop_trailing_comma()
+            out.append(ch)
+            if frame is not None and frame[0] == ch:
+                stack.pop()
+            if not stack:
+                break
+            continue
+        if ch == '"':
+            in_string = True
+            if in_object and frame[1] == "key":
+                frame[1], frame[2] = "colon", len(out)
+        elif in_object and ch == ":":
+            frame[1] = "value"
+        elif in_object and ch == ",":
+            frame[1] = "key"
+        if in_object and frame[1] == "value" and ch != ":" and not ch.isspace():
+            frame[1] = "member"
+        if ch in "{[":
+            stack.append(["}" if ch == "{" else "]", "key", 0])
+        out.append(ch)
+
+    if stack:
+        if in_string:
+            out.append('"')
+        frame = stack[-1]
+        if frame[0] == "}" and frame[1] in ("colon", "value"):
+            del out[frame[2] :]
+        while out and out[-1].isspace():
+            out.pop()
+        drop_trailing_comma()
+        out.extend(reversed([f[0] for f in stack]))
+    return "".join(out)
+
+
+def load_json_object(text: str) -> tuple[dict[str, Any] | None, bool]:
+    """(object, repaired): strict parse first, then the local repair pass."""
+    text = strip_code_fences(text)
     try:
         data = json.loads(text)
         if isinstance(data, dict):
-            return data
+            return data, False
     except json.JSONDecodeError:
         pass
+    repaired = repair_json_text(text)
+    if repaired is None:
+        return None, False
+    try:
+        data = json.loads(repaired)
+    except json.JSONDecodeError:
+        return None, False
+    return (data, True) if isinstance(data, dict) else (None, False)
+
+
+def degraded_chunk_summary(text: str) -> dict[str, Any]:
     return {
         "key_points": [clean_text(text)[:2000]] if text else [],
         "method_details": [],
@@ -737,6 +1887,29 @@ def parse_json_response(text: str) -> dict[str, Any]:
     }
 
 
+def parse_json_response(text: str) -> dict[str, Any]:
+    data, _ = load_json_object(text)
+    if data is not None:
+        return data
+    return degraded_chunk_summary(strip_code_fences(text))
+
+
+def response_format_for(mode: str, name: str, schema: dict[str, Any]) -> dict[str, Any] | None:
+    if mode == "json_schema":
+        return {"type": "json_schema", "json_schema": {"name": name, "strict": True, "schema": schema}}
+    if mode == "json_object":
+        return {"type": "json_object"}
+    return None
+
+
+def is_response_format_rejection(err: Exception) -> bool:
+    """400s from providers that do not implement the requested response_format."""
+    if getattr(err, "status_code", None) != 400:
+        return False
+    message = str(err).lower()
+    return any(hint in message for hint in ("response_format", "json_schema", "json_object", "json mode"))
+
+
 def build_abstract_messages(paper: PaperRecord) -> list[dict[str, str]]:
     abstract = clean_text(paper.abstract)
     if not abstract:
@@ -760,38 +1933,71 @@ def build_abstract_messages(paper: PaperRecord) -> list[dict[str, str]]:
     ]
 
 
+def endpoint_pool(base_url: str | None, endpoints_spec: str) -> llm_pool.EndpointPool:
+    """Shared pool for `LLM_ENDPOINTS` (when set) or the single `base_url` endpoint."""
+    specs = llm_pool.load_endpoint_specs(endpoints_spec)
+    endpoints = llm_pool.build_endpoints(specs, default_api_key="")
+    api_key = ""
+    if not endpoints or any(not e.api_key for e in endpoints):
+        api_key = resolve_api_key()
+        if not api_key:
+            raise RuntimeError("API key is required. Set LLM_API_KEY / DASHSCOPE_API_KEY / OPENAI_API_KEY.")
+    key = (base_url or "", endpoints_spec.strip(), api_key)
+    pool = _ENDPOINT_POOLS.get(key)
+    if pool is not None:
+        return pool
+    with _ENDPOINT_POOLS_LOCK:
+        if key not in _ENDPOINT_POOLS:
+            for endpoint in endpoints:
+                endpoint.api_key = endpoint.api_key or api_key
+            if not endpoints:
+                endpoints = [llm_pool.Endpoint(name=base_url or "default", base_url=base_url, api_key=api_key)]
+            openai = optional_module("openai")
+            # With several endpoints the pool fails over instead of the SDK retrying the same one.
+            sdk_options: dict[str, Any] = {"max_retries": 0} if len(endpoints) > 1 else {}
+            _ENDPOINT_POOLS[key] = llm_pool.EndpointPool(
+                endpoints, lambda e: openai.OpenAI(api_key=e.api_key, base_url=e.base_url, **sdk_options)
+            )
+        return _ENDPOINT_POOLS[key]
+
+
 class LLMRunner:
     def __init__(self, model_fast: str, model_deep: str, base_url: str | None = None) -> None:
-        if OpenAI is None:
+        openai = optional_module("openai")
+        if openai is None:
             raise RuntimeError(
                 "Missing dependency: openai. Install with: python3 -m pip install -r requirements.txt"
             )
-        api_key = resolve_api_key()
-        if not api_key:
-            raise RuntimeError("API key is required. Set LLM_API_KEY / DASHSCOPE_API_KEY / OPENAI_API_KEY.")
         final_base_url = (
             (base_url or "").strip()
             or os.getenv("LLM_BASE_URL", "").strip()
             or os.getenv("OPENAI_BASE_URL", "").strip()
             or None
         )
-        self.client = OpenAI(api_key=api_key, base_url=final_base_url)
+        self.pool = endpoint_pool(final_base_url, os.getenv("LLM_ENDPOINTS", ""))
+        # Primary endpoint's client, for callers that talk to the SDK directly.
+        self.client = self.pool.endpoints[0].client
         self.model_fast = model_fast
         self.model_deep = model_deep
+        mode = DEFAULT_STRUCTURED_OUTPUT if DEFAULT_STRUCTURED_OUTPUT in STRUCTURED_OUTPUT_MODES else "json_schema"
+        self.structured_output = mode
 
-    def _chat(self, model: str, messages: list[dict[str, str]], temperature: float) -> str:
+    def _chat(
+        self,
+        model: str,
+        messages: list[dict[str, str]],
+        temperature: float,
+        response_format: dict[str, Any] | None = None,
+    ) -> str:
         last_error: Exception | None = None
+        extra: dict[str, Any] = {"response_format": response_format} if response_format else {}
         for attempt in range(4):
             try:
-                resp = self.client.chat.completions.create(
-                    model=model,
-                    temperature=temperature,
-                    messages=messages,
-                )
-                text = resp.choices[0].message.content or ""
-                return text.strip()
+                return self.pool.complete(model=model, temperature=temperature, messages=messages, **extra)
             except Exception as err:  # noqa: BLE001
                 last_error = err
+                if extra and is_response_format_rejection(err):
+                    raise
                 if attempt < 3:
                     retry_sleep(1.8, attempt)
                     continue
@@ -799,6 +2005,8 @@ class LLMRunner:
         raise RuntimeError(str(last_error) if last_error else "LLM request failed")
 
     def summarize_chunk(self, paper: PaperRecord, chunk: TextChunk, mode: str) -> dict[str, Any]:
+        """Structured facts from one full-text chunk. Not on the summarize_new/summarize_one
+        path yet, which summarizes abstracts only."""
         model = self.model_fast if mode == "fast" else self.model_fast
         prompt = {
             "role": "user",
@@ -822,7 +2030,7 @@ class LLMRunner:
                 f"{chunk.text}"
             ),
         }
-        out = self._chat(
+        data, raw = self._chat_json(
             model=model,
             temperature=0.1,
             messages=[
@@ -832,8 +2040,52 @@ class LLMRunner:
                 },
                 prompt,
             ],
+            schema_name="chunk_summary",
+            schema=CHUNK_SUMMARY_SCHEMA,
         )
-        return parse_json_response(out)
+        return data if data is not None else degraded_chunk_summary(strip_code_fences(raw))
+
+    def _chat_json(
+        self,
+        model: str,
+        messages: list[dict[str, str]],
+        temperature: float,
+        schema_name: str,
+        schema: dict[str, Any],
+    ) -> tuple[dict[str, Any] | None, str]:
+        """Chat for one JSON object: native response_format when the provider takes it,
+        local repair before any re-ask, and a single corrective re-ask as the last resort.
+
+        Returns (object or None, last raw reply).
+        """
+        while True:
+            mode = self.structured_output
+            try:
+                out = self._chat(model, messages, temperature, response_format_for(mode, schema_name, schema))
+                break
+            except Exception as err:  # noqa: BLE001
+                if mode == "off" or not is_response_format_rejection(err):
+                    raise
+                self.structured_output = STRUCTURED_OUTPUT_MODES[STRUCTURED_OUTPUT_MODES.index(mode) + 1]
+                live_log(f"structured_output downgrade {mode} -> {self.structured_output} ({err})")
+
+        data, repaired = load_json_object(out)
+        if data is not None:
+            STRUCTURED_OUTPUT_RESULTS.inc(mode=mode, outcome="repaired" if repaired else "ok")
+            return data, out
+
+        retry_messages = [
+            *messages,
+            {"role": "assistant", "content": out},
+            {"role": "user", "content": "That reply was not valid JSON. Return only the JSON object, nothing else."},
+        ]
+        retry_out = self._chat(model, retry_messages, temperature, response_format_for(mode, schema_name, schema))
+        data, _ = load_json_object(retry_out)
+        if data is not None:
+            STRUCTURED_OUTPUT_RESULTS.inc(mode=mode, outcome="reasked")
+            return data, retry_out
+        STRUCTURED_OUTPUT_RESULTS.inc(mode=mode, outcome="failed")
+        return None, retry_out or out
 
     def summarize_abstract(self, paper: PaperRecord, mode: str) -> str:
         model = self.model_fast if mode == "fast" else self.model_deep
@@ -844,6 +2096,73 @@ class LLMRunner:
             messages=messages,
         )
 
+    def summarize_abstract_routed(
+        self, paper: PaperRecord, router: model_routing.ModelRouter
+    ) -> tuple[str, dict[str, Any]]:
+        """`--mode auto`: pick the tier from the abstract, escalate a fast summary that fails the check.
+
+        Returns the summary and the routing decision recorded with the paper.
+        """
+        messages = build_abstract_messages(paper)
+        abstract = clean_text(paper.abstract)
+        abstract_tokens = estimate_tokens(abstract)
+        prompt_tokens = sum(estimate_tokens(m["content"]) for m in messages)
+        tier, reason = router.initial_tier(abstract, abstract_tokens, paper.field)
+        decision: dict[str, Any] = {
+            "initial_tier": tier,
+            "reason": reason,
+            "abstract_tokens": abstract_tokens,
+            "escalated": False,
+        }
+        text = self._routed_chat(tier, messages, prompt_tokens, router)
+        if text is None:
+            # Another worker took the last of the deep budget since initial_tier looked.
+            tier, reason = "fast", f"budget ({reason})"
+            decision.update(initial_tier=tier, reason=reason)
+            text = self._routed_chat(tier, messages, prompt_tokens, router) or ""
+        if tier == "fast":
+            issues = model_routing.summary_quality_issues(text, router.min_summary_chars)
+            if issues:
+                decision["quality_issues"] = issues
+                deep_text = None
+                if router.should_escalate(issues):
+                    try:
+                        deep_text = self._routed_chat("deep", messages, prompt_tokens, router)
+                    except Exception as err:  # noqa: BLE001
+                        # Keep the fast summary rather than failing the paper.
+                        decision["escalation_error"] = str(err)[:300]
+                if deep_text is not None:
+                    text = deep_text
+                    tier = "deep"
+                    decision["escalated"] = True
+                elif "escalation_error" not in decision:
+                    decision["escalation_skipped"] = "budget"
+        decision["final_tier"] = tier
+        decision["model"] = self.model_deep if tier == "deep" else self.model_fast
+        MODEL_ROUTING_DECISIONS.inc(tier=tier, reason="escalated" if decision["escalated"] else reason)
+        return text, decision
+
+    def _routed_chat(
+        self, tier: str, messages: list[dict[str, str]], prompt_tokens: int, router: model_routing.ModelRouter
+    ) -> str | None:
+        """One summary call; a deep call first reserves its estimated cost and returns None if it does not fit."""
+        if tier != "deep":
+            return self._chat(model=self.model_fast, temperature=0.1, messages=messages)
+        budget = router.budget
+        reserved_tokens, reserved_seconds = budget.estimate(prompt_tokens)
+        if not budget.try_reserve(reserved_tokens, reserved_seconds):
+            return None
+        started = time.perf_counter()
+        completion_tokens = 0
+        try:
+            text = self._chat(model=self.model_deep, temperature=0.1, messages=messages)
+            completion_tokens = estimate_tokens(text)
+            return text
+        finally:
+            budget.settle(
+                reserved_tokens, reserved_seconds, prompt_tokens, completion_tokens, time.perf_counter() - started
+            )
+
     def synthesize_final(
         self,
         paper: PaperRecord,
@@ -895,30 +2214,43 @@ class LLMRunner:
         )
 
     def synthesize_daily_report(self, records: list[dict[str, Any]], mode: str) -> str:
-        model = self.model_fast if mode == "fast" else self.model_deep
-        payload = []
-        for item in records:
-            if item.get("status") != "success":
-                continue
-            payload.append(
-                {
-                    "arxiv_id": item.get("arxiv_id", ""),
-                    "summary_excerpt": item.get("summary_excerpt", ""),
-                }
-            )
-
+        payload = daily_report_payload(records)
         prompt = (
             "Create a daily robotics paper report from abstract-grounded summaries.\n"
-            "Output Markdown with sections:\n"
-            "1) Daily highlights\n"
-            "2) Method trends\n"
-            "3) Evaluation patterns\n"
-            "4) Risks and open gaps\n"
-            "5) Suggested follow-up reading order\n\n"
+            f"{DAILY_REPORT_SECTIONS}\n"
+            "If no evidence for an item, write 'Not specified'.\n\n"
+            f"Input summaries JSON:\n{json.dumps(payload, ensure_ascii=False)}"
+        )
+        return self._report_chat(prompt, mode)
+
+    def summarize_report_bucket(self, label: str, records: list[dict[str, Any]], mode: str) -> str:
+        """Map step: a partial daily report for one prompt-sized group of papers."""
+        payload = daily_report_payload(records)
+        prompt = (
+            f"Create a partial daily robotics paper report for the group '{label}' "
+            f"({len(payload)} papers) from abstract-grounded summaries.\n"
+            f"{DAILY_REPORT_SECTIONS}\n"
+            "Cite arXiv ids for every highlight so a later merge step can keep them.\n"
             "If no evidence for an item, write 'Not specified'.\n\n"
             f"Input summaries JSON:\n{json.dumps(payload, ensure_ascii=False)}"
         )
+        return self._report_chat(prompt, mode)
+
+    def reduce_report_partials(self, partials: list[str], mode: str, final: bool) -> str:
+        """Reduce step: merge partial reports, keeping the five-section layout."""
+        blob = "\n\n".join(f"### Partial report {i}\n{text}" for i, text in enumerate(partials, start=1))
+        prompt = (
+            f"Merge these {len(partials)} partial daily robotics paper reports into "
+            f"{'the final daily report' if final else 'one partial report'}. "
+            "Deduplicate trends, keep cited arXiv ids, and do not add facts that are not in the partials.\n"
+            f"{DAILY_REPORT_SECTIONS}\n"
+            "If no evidence for an item, write 'Not specified'.\n\n"
+            f"Partial reports:\n{blob}"
+        )
+        return self._report_chat(prompt, mode)
 
+    def _report_chat(self, prompt: str, mode: str) -> str:
+        model = self.model_fast if mode == "fast" else self.model_deep
         return self._chat(
             model=model,
             temperature=0.1,
@@ -929,8 +2261,194 @@ class LLMRunner:
         )
 
 
+def daily_report_payload(records: list[dict[str, Any]]) -> list[dict[str, str]]:
+    payload = []
+    for item in records:
+        if item.get("status") != "success":
+            continue
+        payload.append(
+            {
+                "arxiv_id": item.get("arxiv_id", ""),
+                "summary_excerpt": item.get("summary_excerpt", ""),
+            }
+        )
+    return payload
+
+
+def pack_report_buckets(records: list[dict[str, Any]], token_budget: int) -> list[tuple[str, list[dict[str, Any]]]]:
+    """Group records by field, then pack each field into buckets under `token_budget`."""
+    by_field: dict[str, list[dict[str, Any]]] = {}
+    for rec in records:
+        by_field.setdefault(str(rec.get("field") or "misc"), []).append(rec)
+
+    capacity = max(1, token_budget - REPORT_PROMPT_OVERHEAD_TOKENS)
+    buckets: list[tuple[str, list[dict[str, Any]]]] = []
+    for field_name in sorted(by_field):
+        current: list[dict[str, Any]] = []
+        used = 0
+        part = 1
+        for rec in by_field[field_name]:
+            cost = estimate_tokens(str(rec.get("summary_excerpt", ""))) + 20
+            if current and used + cost > capacity:
+                buckets.append((f"{field_name} #{part}", current))
+                part += 1
+                current = []
+                used = 0
+            current.append(rec)
+            used += cost
+        if current:
+            buckets.append((f"{field_name} #{part}" if part > 1 else field_name, current))
+    return buckets
+
+
+class ReportCheckpoint:
+    """Append-only JSONL of finished map/reduce steps, so a crash keeps finished buckets."""
+
+    def __init__(self, path: Path | None) -> None:
+        self.path = path
+        self.done: dict[str, str] = {}
+        if path is None or not path.exists():
+            return
+        for line in path.read_text(encoding="utf-8").splitlines():
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(row, dict) and row.get("key") and isinstance(row.get("markdown"), str):
+                self.done[str(row["key"])] = row["markdown"]
+
+    def save(self, key: str, label: str, markdown: str) -> None:
+        self.done[key] = markdown
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        line = json.dumps({"key": key, "label": label, "markdown": markdown}, ensure_ascii=False) + "\n"
+        with open(self.path, "a", encoding="utf-8") as fh:
+            fh.write(line)
+            fh.flush()
+            os.fsync(fh.fileno())
+
+
+def _report_step_key(level: int, parts: Iterable[str]) -> str:
+    digest = hashlib.sha1("\x1f".join(parts).encode("utf-8")).hexdigest()[:16]
+    return f"L{level}-{digest}"
+
+
+def synthesize_daily_report_hierarchical(
+    runner: LLMRunner,
+    records: list[dict[str, Any]],
+    mode: str,
+    token_budget: int = DEFAULT_REPORT_TOKEN_BUDGET,
+    max_workers: int = DEFAULT_REPORT_WORKERS,
+    checkpoint_path: Path | None = None,
+) -> str:
+    """Map-reduce daily report: bucket summaries by field, summarize buckets
+    concurrently, then merge partials level by level until one prompt fits.
+    """
+    successful = [r for r in records if r.get("status") == "success"]
+    checkpoint = ReportCheckpoint(checkpoint_path)
+
+    def run_steps(steps: list[tuple[str, str, Any]]) -> list[str]:
+        results: dict[str, str] = {}
+        todo = []
+        for key, label, fn in steps:
+            if key in checkpoint.done:
+                live_log(f"daily_report reuse {label}")
+                results[key] = checkpoint.done[key]
+            else:
+                todo.append((key, label, fn))
+        if todo:
+            with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+                futures = {pool.submit(fn): (key, label) for key, label, fn in todo}
+                for fut in as_completed(futures):
+                    key, label = futures[fut]
+                    text = fut.result()
+                    checkpoint.save(key, label, text)
+                    live_log(f"daily_report step_done {label}")
+                    results[key] = text
+        return [results[key] for key, _, _ in steps]
+
+    buckets = pack_report_buckets(successful, token_budget)
+    live_log(f"daily_report map buckets={len(buckets)} budget={token_budget}")
+    if len(buckets) == 1:
+        # Everything fits one prompt: write the final report directly, not a partial.
+        key = _report_step_key(0, ["final", *sorted(str(r.get("arxiv_id", "")) for r in successful)])
+        return run_steps([(key, "report", lambda: runner.synthesize_daily_report(successful, mode))])[0]
+    steps = []
+    for label, items in buckets:
+        key = _report_step_key(0, sorted(str(r.get("arxiv_id", "")) for r in items))
+        steps.append((key, label, lambda label=label, items=items: runner.summarize_report_bucket(label, items, mode)))
+    partials = run_steps(steps)
+
+    capacity = max(1, token_budget - REPORT_PROMPT_OVERHEAD_TOKENS)
+    level = 1
+    while sum(estimate_tokens(p) for p in partials) > capacity and len(partials) > 1:
+        groups: list[list[str]] = []
+        current: list[str] = []
+        used = 0
+        for text in partials:
+            cost = estimate_tokens(text)
+            if current and used + cost > capacity:
+                groups.append(current)
+                current = []
+                used = 0
+            current.append(text)
+            used += cost
+        if current:
+            groups.append(current)
+        if len(groups) == len(partials):
+            # Each partial fills a prompt alone; merge pairwise to keep shrinking.
+            groups = [partials[i : i + 2] for i in range(0, len(partials), 2)]
+        live_log(f"daily_report reduce level={level} groups={len(groups)}")
+        steps = [
+            (
+                _report_step_key(level, group),
+                f"reduce L{level} #{i}",
+                lambda group=group: runner.reduce_report_partials(group, mode, final=False),
+            )
+            for i, group in enumerate(groups, start=1)
+        ]
+        partials = run_steps(steps)
+        level += 1
+
+    final_steps = [
+        (
+            _report_step_key(level, partials),
+            "reduce final",
+            lambda: runner.reduce_report_partials(partials, mode, final=True),
+        )
+    ]
+    return run_steps(final_steps)[0]
+
+
+def build_daily_report(
+    runner: LLMRunner,
+    records: list[dict[str, Any]],
+    mode: str,
+    report_mode: str = "auto",
+    token_budget: int = DEFAULT_REPORT_TOKEN_BUDGET,
+    max_workers: int = DEFAULT_REPORT_WORKERS,
+    checkpoint_path: Path | None = None,
+) -> str:
+    """Single-prompt report when it fits the budget (or is forced), map-reduce otherwise."""
+    if report_mode == "single":
+        return runner.synthesize_daily_report(records, mode=mode)
+    payload_tokens = estimate_tokens(json.dumps(daily_report_payload(records), ensure_ascii=False))
+    if report_mode == "auto" and payload_tokens + REPORT_PROMPT_OVERHEAD_TOKENS <= token_budget:
+        return runner.synthesize_daily_report(records, mode=mode)
+    live_log(f"daily_report hierarchical est_tokens={payload_tokens}")
+    return synthesize_daily_report_hierarchical(
+        runner,
+        records,
+        mode=mode,
+        token_budget=token_budget,
+        max_workers=max_workers,
+        checkpoint_path=checkpoint_path,
+    )
+
+
 def build_http_session() -> requests.Session:
-    session = requests.Session()
+    session = optional_module("requests").Session()
     session.headers.update(
         {
             "User-Agent": "arxiv-fulltext-summarizer/1.0 (+https://arxiv.org)",
@@ -962,6 +2480,7 @@ def summarize_single_paper(
     chunk_max_chars: int,
     save_result: bool,
     emit_final_stdout: bool = False,
+    router: model_routing.ModelRouter | None = None,
 ) -> dict[str, Any]:
     _ = (min_chars, chunk_max_chars)
     aid = paper.arxiv_id
@@ -970,6 +2489,8 @@ def summarize_single_paper(
         "summary_path": "",
         "status": "failed",
         "error": "",
+        "field": paper.field,
+        "abstract_hash": abstract_hash(paper.abstract),
     }
 
     try:
@@ -978,7 +2499,15 @@ def summarize_single_paper(
             raise ValueError("Abstract未提供，无法总结。")
         live_log(f"{aid} | abstract_ready chars={len(abstract)}")
         live_log(f"{aid} | abstract_summarize start mode={mode}")
-        final_md = runner.summarize_abstract(paper=paper, mode=mode)
+        if mode == "auto":
+            final_md, routing = runner.summarize_abstract_routed(paper, router or model_routing.ModelRouter())
+            record["routing"] = routing
+            live_log(
+                f"{aid} | route initial={routing['initial_tier']} reason={routing['reason']} "
+                f"final={routing['final_tier']} escalated={int(routing['escalated'])}"
+            )
+        else:
+            final_md = runner.summarize_abstract(paper=paper, mode=mode)
         final_preview = clean_text(final_md).replace("\n", " ")[:220]
         if final_preview:
             model_log(f"{aid} | final_preview: {final_preview}")
@@ -989,8 +2518,9 @@ def summarize_single_paper(
 
         if save_result:
             out_path = output_dir / summary_filename(paper)
-            out_path.parent.mkdir(parents=True, exist_ok=True)
-            out_path.write_text(final_md, encoding="utf-8")
+            with tracing.span("write_summary", arxiv_id=aid, chars=len(final_md)):
+                out_path.parent.mkdir(parents=True, exist_ok=True)
+                out_path.write_text(final_md, encoding="utf-8")
             live_log(f"{aid} | write_summary ok {out_path}")
             record["summary_path"] = str(out_path)
         else:
@@ -1009,6 +2539,53 @@ def summarize_single_paper(
         return record
 
 
+class RunJournal:
+    """Append-only, fsync'd JSONL of per-paper results for one summarize_new run.
+
+    Replaying it lets `--resume` skip papers that already succeeded, and the
+    records file and summary index are built from it at the end of the run.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def reset(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as fh:
+            fh.flush()
+            os.fsync(fh.fileno())
+
+    def append(self, record: dict[str, Any]) -> None:
+        row = {k: v for k, v in record.items() if k != "summary_text"}
+        row["journaled_at"] = now_utc().isoformat()
+        line = json.dumps(row, ensure_ascii=False) + "\n"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as fh:
+            fh.write(line)
+            fh.flush()
+            os.fsync(fh.fileno())
+
+    def replay(self) -> dict[str, dict[str, Any]]:
+        """Latest record per canonical arXiv id, in first-seen order."""
+        out: dict[str, dict[str, Any]] = {}
+        if not self.path.exists():
+            return out
+        with open(self.path, "r", encoding="utf-8") as fh:
+            for line in fh:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # torn tail from a killed process
+                if not isinstance(row, dict) or not row.get("arxiv_id"):
+                    continue
+                row.pop("journaled_at", None)
+                out[canonical_arxiv_id(str(row["arxiv_id"]))] = row
+        return out
+
+
 def write_records(output_dir: Path, command: str, records: list[dict[str, Any]]) -> Path:
     ts = now_utc().strftime("%Y%m%dT%H%M%SZ")
     path = output_dir / f"{ts}_{command}_records.json"
@@ -1018,6 +2595,7 @@ def write_records(output_dir: Path, command: str, records: list[dict[str, Any]])
             "summary_path": r.get("summary_path", ""),
             "status": r.get("status", "failed"),
             "error": r.get("error", ""),
+            **({"routing": r["routing"]} if r.get("routing") else {}),
         }
         for r in records
     ]
@@ -1034,29 +2612,9 @@ def build_summary_web_path(output_dir: Path, summary_path: str) -> tuple[str, st
     return file_name, file_name
 
 
-def upsert_summary_index(output_dir: Path, records: list[dict[str, Any]]) -> Path:
-    index_path = output_dir / "summary_index.json"
-    index_payload: dict[str, Any] = {
-        "updated_at": now_utc().isoformat(),
-        "items": {},
-    }
-
-    if index_path.exists():
-        try:
-            existing = json.loads(index_path.read_text(encoding="utf-8"))
-            if isinstance(existing, dict):
-                index_payload.update(existing)
-            if not isinstance(index_payload.get("items"), dict):
-                index_payload["items"] = {}
-        except Exception:
-            index_payload = {
-                "updated_at": now_utc().isoformat(),
-                "items": {},
-            }
-
-    items: dict[str, Any] = index_payload["items"]
+def build_index_entries(output_dir: Path, records: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    entries: list[dict[str, Any]] = []
     ts = now_utc().isoformat()
-
     for rec in records:
         if rec.get("status") != "success":
             continue
@@ -1072,15 +2630,192 @@ def upsert_summary_index(output_dir: Path, records: list[dict[str, Any]]) -> Pat
             "summary_path": web_path,
             "updated_at": ts,
         }
-        items[aid] = entry
-
-        canonical = canonical_arxiv_id(aid)
-        if canonical and canonical != aid:
-            items[canonical] = entry
-
-    index_payload["updated_at"] = ts
-    write_json(index_path, index_payload)
-    return index_path
+        if rec.get("abstract_hash"):
+            entry["abstract_hash"] = rec["abstract_hash"]
+        entries.append(entry)
+    return entries
+
+
+def apply_index_entry(items: dict[str, Any], entry: dict[str, Any]) -> None:
+    aid = str(entry.get("arxiv_id", ""))
+    if not aid:
+        return
+    items[aid] = entry
+    canonical = canonical_arxiv_id(aid)
+    if canonical and canonical != aid:
+        items[canonical] = entry
+
+
+_INDEX_THREAD_LOCK = threading.Lock()
+
+
+class SummaryIndexStore:
+    """summary_index.json snapshot plus an append-only journal of upserts.
+
+    Each save appends one fsync'd JSONL line under an exclusive file lock, so
+    its cost does not grow with the index and concurrent writers (threads or
+    processes) never lose entries. `compact()` folds the journal into the JSON
+    snapshot the site reads, via an atomic rename, then truncates the journal.
+    Replaying a journal twice is harmless: entries are keyed by arXiv id.
+    """
+
+    def __init__(self, output_dir: Path, compact_bytes: int = DEFAULT_INDEX_COMPACT_BYTES) -> None:
+        self.output_dir = output_dir
+        self.index_path = output_dir / SUMMARY_INDEX_FILE
+        self.journal_path = output_dir / SUMMARY_INDEX_JOURNAL
+        self.lock_path = output_dir / SUMMARY_INDEX_LOCK
+        self.compact_bytes = compact_bytes
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        if fcntl is None:
+            with _INDEX_THREAD_LOCK:
+                yield
+            return
+        with open(self.lock_path, "a+b") as lock_fh:
+            fcntl.flock(lock_fh.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_fh.fileno(), fcntl.LOCK_UN)
+
+    def append(self, records: list[dict[str, Any]]) -> int:
+        """Journal successful records; returns the number of entries written."""
+        entries = build_index_entries(self.output_dir, records)
+        if not entries:
+            return 0
+        data = "".join(json.dumps(e, ensure_ascii=False) + "\n" for e in entries).encode("utf-8")
+        with self._locked():
+            with open(self.journal_path, "ab") as fh:
+                fh.write(data)
+                fh.flush()
+                os.fsync(fh.fileno())
+                journal_size = fh.tell()
+            if self.compact_bytes > 0 and journal_size >= self.compact_bytes:
+                self._compact_locked()
+        return len(entries)
+
+    def compact(self) -> Path:
+        with self._locked():
+            self._compact_locked()
+        return self.index_path
+
+    def load(self) -> dict[str, Any]:
+        """Current index (snapshot + pending journal) without rewriting anything."""
+        with self._locked():
+            payload = self._read_snapshot()
+            for entry in self._read_journal():
+                apply_index_entry(payload["items"], entry)
+                payload["updated_at"] = max(str(payload.get("updated_at", "")), str(entry.get("updated_at", "")))
+        return payload
+
+    def load_readonly(self) -> dict[str, Any]:
+        """Like `load()`, but never creates the directory or takes the lock (for readers such as the server).
+
+        The journal is read before the snapshot: a compaction in between folds those
+        entries into the new snapshot, and replaying them again is harmless. A last
+        line without its newline is a write in progress and is skipped.
+        """
+        entries = self._read_journal(complete_lines_only=True)
+        payload = self._read_snapshot()
+        for entry in entries:
+            apply_index_entry(payload["items"], entry)
+            payload["updated_at"] = max(str(payload.get("updated_at", "")), str(entry.get("updated_at", "")))
+        return payload
+
+    def _read_snapshot(self) -> dict[str, Any]:
+        payload: dict[str, Any] = {"updated_at": "", "items": {}}
+        if not self.index_path.exists():
+            return payload
+        try:
+            existing = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except Exception:
+            return payload
+        if isinstance(existing, dict):
+            payload.update(existing)
+        if not isinstance(payload.get("items"), dict):
+            payload["items"] = {}
+        return payload
+
+    def _read_journal(self, complete_lines_only: bool = False) -> list[dict[str, Any]]:
+        if not self.journal_path.exists():
+            return []
+        entries: list[dict[str, Any]] = []
+        with open(self.journal_path, "r", encoding="utf-8") as fh:
+            for line in fh:
+                if complete_lines_only and not line.endswith("\n"):
+                    break
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # torn tail from a crashed writer
+                if isinstance(entry, dict):
+                    entries.append(entry)
+        return entries
+
+    def _compact_locked(self) -> None:
+        entries = self._read_journal()
+        if not entries and self.index_path.exists():
+            return
+        payload = self._read_snapshot()
+        for entry in entries:
+            apply_index_entry(payload["items"], entry)
+        payload["updated_at"] = now_utc().isoformat()
+
+        tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            fh.write(json.dumps(payload, ensure_ascii=False, indent=2))
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp_path, self.index_path)
+        with open(self.journal_path, "wb") as fh:
+            os.fsync(fh.fileno())
+
+
+def upsert_summary_index(output_dir: Path, records: list[dict[str, Any]], compact: bool = True) -> Path:
+    store = SummaryIndexStore(output_dir)
+    store.append(records)
+    if compact:
+        store.compact()
+    return store.index_path
+
+
+def find_unchanged_summaries(output_dir: Path, papers: list[PaperRecord]) -> dict[str, dict[str, Any]]:
+    """Success records for papers whose indexed abstract hash still matches.
+
+    Entries written before abstract hashes were indexed never match, so those
+    papers are summarized once more and pick up a hash.
+    """
+    items = SummaryIndexStore(output_dir).load().get("items", {})
+    unchanged: dict[str, dict[str, Any]] = {}
+    for paper in papers:
+        key = paper.canonical_id
+        entry = items.get(key) or items.get(normalize_arxiv_id(paper.arxiv_id))
+        if not isinstance(entry, dict):
+            continue
+        digest = abstract_hash(paper.abstract)
+        summary_path = output_dir / str(entry.get("summary_file", ""))
+        if entry.get("abstract_hash") != digest or not summary_path.is_file():
+            continue
+        try:
+            summary_md = summary_path.read_text(encoding="utf-8")
+        except OSError:
+            continue
+        unchanged[key] = {
+            "arxiv_id": paper.arxiv_id,
+            "summary_path": str(summary_path),
+            "status": "success",
+            "error": "",
+            "field": paper.field,
+            "abstract_hash": digest,
+            "summary_excerpt": clean_text(summary_md)[:1200],
+            "reused": True,
+        }
+    return unchanged
 
 
 def run_summarize_new(args: argparse.Namespace) -> int:
@@ -1089,18 +2824,20 @@ def run_summarize_new(args: argparse.Namespace) -> int:
     output_dir = Path(args.output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    records = sort_newest(load_records(input_path))
-    if args.latest_day_only:
-        latest_key = ""
-        for item in records:
-            key = date_key_asia_shanghai(item)
-            if key > latest_key:
-                latest_key = key
-        selected = [item for item in records if date_key_asia_shanghai(item) == latest_key] if latest_key else []
-    else:
-        selected = records[: args.n]
+    with tracing.span("load_records", input=str(input_path)) as span:
+        selected = latest_day_records(input_path) if args.latest_day_only else newest_records(input_path, args.n)
+        span.set(records=len(selected))
+
+    sharded = args.shard_count > 1
+    if args.shard_count < 1 or not 0 <= args.shard_index < args.shard_count:
+        raise ValueError("--shard-index must be in [0, --shard-count)")
+    shard_tag = f"shard-{args.shard_index}-of-{args.shard_count}"
+    if sharded:
+        with tracing.span("select", stage="shard", shard=shard_tag):
+            selected = [item for item in selected if shard_of(item.arxiv_id, args.shard_count) == args.shard_index]
     live_log(
         f"batch_start mode={args.mode} latest_day_only={bool(args.latest_day_only)} selected={len(selected)}"
+        + (f" {shard_tag}" if sharded else "")
     )
 
     runner = LLMRunner(
@@ -1109,20 +2846,59 @@ def run_summarize_new(args: argparse.Namespace) -> int:
         base_url=args.base_url,
     )
     save_result = not args.no_save
+    router = None
+    if args.mode == "auto":
+        budget = model_routing.RoutingBudget(max_tokens=args.deep_token_budget, max_seconds=args.deep_seconds_budget)
+        router = model_routing.ModelRouter(budget=budget)
+
+    journal_name = RUN_JOURNAL_FILE.replace(".journal", f".{shard_tag}.journal") if sharded else RUN_JOURNAL_FILE
+    journal = RunJournal(output_dir / journal_name) if save_result else None
+    finished: dict[str, dict[str, Any]] = {}
+    if journal is not None:
+        if args.resume:
+            # Only papers in this selection: an older run's journal may hold others.
+            wanted = {p.canonical_id for p in selected}
+            finished = {k: v for k, v in journal.replay().items() if k in wanted and v.get("status") == "success"}
+            live_log(f"resume journal={journal.path} finished={len(finished)}")
+        else:
+            journal.reset()
+
+    unchanged: dict[str, dict[str, Any]] = {}
+    if save_result and not args.resummarize_all:
+        with tracing.span("select", stage="unchanged_abstracts", candidates=len(selected)):
+            unchanged = find_unchanged_summaries(output_dir, selected)
+        live_log(f"unchanged_abstracts reused={len(unchanged)}")
 
     run_records: list[dict[str, Any]] = []
     for i, paper in enumerate(selected, start=1):
+        done = finished.get(paper.canonical_id)
+        if done is not None:
+            print(f"[{i}/{len(selected)}] skip {paper.arxiv_id} (already in journal)", flush=True)
+            run_records.append(done)
+            continue
+        reused = unchanged.get(paper.canonical_id)
+        if reused is not None:
+            print(f"[{i}/{len(selected)}] skip {paper.arxiv_id} (abstract unchanged)", flush=True)
+            if journal is not None:
+                journal.append(reused)
+            run_records.append(reused)
+            continue
         print(f"[{i}/{len(selected)}] summarizing {paper.arxiv_id} ...", flush=True)
-        rec = summarize_single_paper(
-            paper=paper,
-            output_dir=output_dir,
-            runner=runner,
-            _session=None,
-            mode=args.mode,
-            min_chars=args.min_chars,
-            chunk_max_chars=args.chunk_max_chars,
-            save_result=save_result,
-        )
+        with tracing.span("summarize_paper", arxiv_id=paper.arxiv_id) as span:
+            rec = summarize_single_paper(
+                paper=paper,
+                output_dir=output_dir,
+                runner=runner,
+                _session=None,
+                mode=args.mode,
+                min_chars=args.min_chars,
+                chunk_max_chars=args.chunk_max_chars,
+                save_result=save_result,
+                router=router,
+            )
+            span.set(status=rec["status"])
+        if journal is not None:
+            journal.append(rec)
         run_records.append(rec)
         if rec["status"] == "success":
             target_path = rec.get("summary_path") or "(in-memory)"
@@ -1130,21 +2906,53 @@ def run_summarize_new(args: argparse.Namespace) -> int:
         else:
             print(f"  failed  -> {rec['error']}", flush=True)
 
-    if args.daily_report and save_result:
+    if router is not None:
+        budget = router.budget.snapshot()
+        live_log(
+            f"routing deep_tokens={budget['spent_tokens']}/{budget['max_tokens'] or 'inf'} "
+            f"deep_seconds={budget['spent_seconds']}/{budget['max_seconds'] or 'inf'}"
+        )
+
+    if journal is not None:
+        # Bookkeeping comes from the journal so resumed runs cover every finished paper,
+        # limited to this selection and kept in its order.
+        replayed = journal.replay()
+        run_records = [replayed[p.canonical_id] for p in selected if p.canonical_id in replayed]
+
+    if args.daily_report and sharded:
+        live_log("daily_report skipped in shard mode; run it after merge_shards")
+    elif args.daily_report and save_result:
         successful = [r for r in run_records if r.get("status") == "success"]
         if successful:
             live_log(f"daily_report start source_count={len(successful)}")
-            report_md = runner.synthesize_daily_report(successful, mode=args.mode)
             day = now_utc().date().isoformat()
             report_path = output_dir / f"{day}_daily_report.md"
+            checkpoint_path = output_dir / f"{day}_daily_report.partials.jsonl"
+            report_md = build_daily_report(
+                runner,
+                successful,
+                mode=router.report_mode() if router is not None else args.mode,
+                report_mode=args.report_mode,
+                token_budget=args.report_token_budget,
+                max_workers=args.report_workers,
+                checkpoint_path=checkpoint_path,
+            )
             report_path.write_text(report_md, encoding="utf-8")
+            checkpoint_path.unlink(missing_ok=True)
             print(f"daily report -> {report_path}", flush=True)
             preview = clean_text(report_md)[:220]
             if preview:
                 model_log(f"daily_report preview: {preview}")
 
-    if save_result:
-        index_path = upsert_summary_index(output_dir, run_records)
+    if save_result and sharded:
+        with tracing.span("upsert_index", records=len(run_records), shard=shard_tag):
+            fragment_path = write_index_fragment(output_dir, shard_tag, run_records)
+        print(f"summary index fragment -> {fragment_path}")
+        records_path = write_records(output_dir, f"summarize_new_{shard_tag}", run_records)
+        print(f"records -> {records_path}")
+    elif save_result:
+        with tracing.span("upsert_index", records=len(run_records)):
+            index_path = upsert_summary_index(output_dir, run_records)
         print(f"summary index -> {index_path}")
         records_path = write_records(output_dir, "summarize_new", run_records)
         print(f"records -> {records_path}")
@@ -1159,14 +2967,86 @@ def run_summarize_new(args: argparse.Namespace) -> int:
     return 0 if failed == 0 else 2
 
 
+def write_index_fragment(output_dir: Path, shard_tag: str, records: list[dict[str, Any]]) -> Path:
+    items: dict[str, Any] = {}
+    for entry in build_index_entries(output_dir, records):
+        apply_index_entry(items, entry)
+    path = output_dir / SHARD_INDEX_GLOB.replace("shard-*-of-*", shard_tag)
+    write_json(path, {"updated_at": now_utc().isoformat(), "shard": shard_tag, "items": items})
+    return path
+
+
+def run_merge_shards(args: argparse.Namespace) -> int:
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    source_dirs = [output_dir] + [Path(d) for d in args.shard_dir]
+
+    fragments = sorted(p for d in source_dirs for p in d.glob(SHARD_INDEX_GLOB))
+    records_files = sorted(p for d in source_dirs for p in d.glob(SHARD_RECORDS_GLOB))
+    if not fragments and not records_files:
+        print(f"no shard outputs found in: {', '.join(str(d) for d in source_dirs)}")
+        return 2
+
+    merged_records: dict[str, dict[str, Any]] = {}
+    for path in sorted(records_files, key=lambda p: p.name):  # timestamp prefix => oldest first
+        rows = json.loads(path.read_text(encoding="utf-8"))
+        for row in rows if isinstance(rows, list) else []:
+            if not isinstance(row, dict) or not row.get("arxiv_id"):
+                continue
+            summary_path = str(row.get("summary_path", ""))
+            if summary_path:
+                row["summary_path"] = str(output_dir / Path(summary_path).name)
+            merged_records[canonical_arxiv_id(str(row["arxiv_id"]))] = row
+
+    # Summaries written by other hosts live next to their fragment; bring them home.
+    for path in fragments + records_files:
+        if path.parent.resolve() == output_dir.resolve():
+            continue
+        for md in path.parent.glob("*.md"):
+            target = output_dir / md.name
+            if not target.exists() or target.stat().st_mtime < md.stat().st_mtime:
+                target.write_bytes(md.read_bytes())
+
+    store = SummaryIndexStore(output_dir)
+    entries = 0
+    for path in fragments:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        items = payload.get("items", {}) if isinstance(payload, dict) else {}
+        # Fragments hold canonical-id aliases too; journal each paper once.
+        unique = {str(e.get("arxiv_id")): e for e in items.values() if isinstance(e, dict) and e.get("summary_file")}
+        entries += store.append(
+            [
+                {
+                    "arxiv_id": aid,
+                    "summary_path": str(output_dir / str(entry["summary_file"])),
+                    "status": "success",
+                    # Keep the hash so the next run can reuse unchanged summaries.
+                    **{k: entry[k] for k in ("abstract_hash", "field") if entry.get(k)},
+                }
+                for aid, entry in unique.items()
+            ]
+        )
+    index_path = store.compact()
+    print(f"summary index -> {index_path} (+{entries} entries from {len(fragments)} fragments)")
+
+    records_path = write_records(output_dir, "summarize_new", list(merged_records.values()))
+    print(f"records -> {records_path} ({len(merged_records)} papers from {len(records_files)} shards)")
+
+    if not args.keep_fragments:
+        for path in fragments + records_files:
+            if path.parent.resolve() == output_dir.resolve():
+                path.unlink(missing_ok=True)
+    return 0
+
+
 def run_summarize_one(args: argparse.Namespace) -> int:
     require_runtime_deps()
     input_path = Path(args.input)
     output_dir = Path(args.output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    records = sort_newest(load_records(input_path))
-    paper = pick_one_record(records, arxiv_id=args.arxiv_id, index=args.index)
+    with tracing.span("load_records", input=str(input_path)):
+        paper = pick_one_record(input_path, arxiv_id=args.arxiv_id, index=args.index)
 
     runner = LLMRunner(
         model_fast=args.model_fast,
@@ -1187,7 +3067,8 @@ def run_summarize_one(args: argparse.Namespace) -> int:
         emit_final_stdout=True,
     )
     if save_result:
-        index_path = upsert_summary_index(output_dir, [rec])
+        with tracing.span("upsert_index", records=1):
+            index_path = upsert_summary_index(output_dir, [rec])
         print(f"summary index -> {index_path}")
         records_path = write_records(output_dir, "summarize_one", [rec])
         print(f"records -> {records_path}")
@@ -1205,13 +3086,33 @@ def run_summarize_one(args: argparse.Namespace) -> int:
     return 2
 
 
+def add_profiling_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--trace",
+        type=Path,
+        help="Record per-stage timing spans to this JSONL file (plus a .chrome.json trace-event file).",
+    )
+    parser.add_argument(
+        "--profile",
+        choices=tracing.PROFILERS,
+        help="Run under cProfile or the stack sampler and write a report.",
+    )
+    parser.add_argument(
+        "--profile-output",
+        type=Path,
+        help="Profile report path (default: profile-<kind>.txt in the working directory).",
+    )
+
+
 def main() -> int:
     try:
         args = parse_args()
-        if args.command == "summarize_new":
-            return run_summarize_new(args)
-        if args.command == "summarize_one":
-            return run_summarize_one(args)
+        if args.command in {"summarize_new", "summarize_one"}:
+            run = run_summarize_new if args.command == "summarize_new" else run_summarize_one
+            with tracing.profiled(args.profile, args.profile_output), tracing.traced(args.trace):
+                return run(args)
+        if args.command in {"merge_shards", "merge-shards"}:
+            return run_merge_shards(args)
         raise ValueError(f"Unsupported command: {args.command}")
     except Exception as err:  # noqa: BLE001
         print(f"ERROR: {err}", file=sys.stderr)
@@ -6,16 +6,22 @@ from __future__ import annotations
 import argparse
 import json
 import os
+import re
+import shutil
 import sys
+import threading
 import time
 import urllib.error
 import urllib.parse
 import urllib.request
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
-ARXIV_API_URL = "https://export.arxiv.org/api/query"
+import tracing
+
+ARXIV_API_URL = os.getenv("ARXIV_API_URL", "https://export.arxiv.org/api/query")
 DEFAULT_CATEGORIES = ["cs.RO", "cs.CV", "cs.CL", "cs.SY"]
 CATEGORY_NAMES = {
     "cs.RO": "Robotics",
@@ -23,6 +29,7 @@ CATEGORY_NAMES = {
     "cs.CL": "Computation and Language",
     "cs.SY": "Systems and Control",
 }
+DEFAULT_DELTA_KEEP = 14
 NAMESPACES = {
     "atom": "http://www.w3.org/2005/Atom",
     "arxiv": "http://arxiv.org/schemas/atom",
@@ -68,6 +75,44 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Ignore existing output cache and refetch full window.",
     )
+    parser.add_argument(
+        "--backfill",
+        action="store_true",
+        help="Refetch the window as submittedDate slices fetched in parallel (implies --full-refresh).",
+    )
+    parser.add_argument(
+        "--slice-days",
+        type=int,
+        default=7,
+        help="Days per submittedDate slice in --backfill mode (default: 7).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=3,
+        help="Concurrent slice fetchers in --backfill mode; requests still honor --request-interval (default: 3).",
+    )
+    parser.add_argument(
+        "--delta-keep",
+        type=int,
+        default=DEFAULT_DELTA_KEEP,
+        help=f"Per-run delta files kept in the manifest chain; 0 disables deltas (default: {DEFAULT_DELTA_KEEP}).",
+    )
+    parser.add_argument(
+        "--trace",
+        type=Path,
+        help="Record fetch_page/parse_page timing spans to this JSONL file (plus a .chrome.json trace-event file).",
+    )
+    parser.add_argument(
+        "--profile",
+        choices=tracing.PROFILERS,
+        help="Run under cProfile or the stack sampler and write a report.",
+    )
+    parser.add_argument(
+        "--profile-output",
+        type=Path,
+        help="Profile report path (default: profile-<kind>.txt in the working directory).",
+    )
     return parser.parse_args()
 
 
@@ -144,10 +189,78 @@ def extract_cached_field_papers(
     return []
 
 
-def build_query(category: str, start: int, batch_size: int) -> str:
+def compute_high_water_mark(papers: list[dict]) -> dict:
+    """Newest `published` timestamp plus the ids that share it, and the newest `updated`."""
+    newest: datetime | None = None
+    newest_updated: datetime | None = None
+    ids: list[str] = []
+    for paper in papers:
+        updated_at = parse_arxiv_datetime(str(paper.get("updated", "")))
+        if updated_at is not None and (newest_updated is None or updated_at > newest_updated):
+            newest_updated = updated_at
+        published_at = parse_arxiv_datetime(str(paper.get("published", "")))
+        if published_at is None:
+            continue
+        paper_id = str(paper.get("id", "")).strip()
+        if newest is None or published_at > newest:
+            newest = published_at
+            ids = [paper_id] if paper_id else []
+        elif published_at == newest and paper_id:
+            ids.append(paper_id)
+    if newest is None:
+        return {}
+    mark = {"published": newest.isoformat(), "ids": sorted(set(ids))}
+    if newest_updated is not None:
+        mark["updated"] = newest_updated.isoformat()
+    return mark
+
+
+def extract_cached_high_water_mark(payload: dict, category: str) -> dict:
+    fields = payload.get("fields", [])
+    if not isinstance(fields, list):
+        return {}
+    for field in fields:
+        if not isinstance(field, dict) or field.get("code") != category:
+            continue
+        mark = field.get("high_water_mark")
+        if not isinstance(mark, dict) or parse_arxiv_datetime(str(mark.get("published", ""))) is None:
+            return {}
+        ids = mark.get("ids", [])
+        return {
+            "published": str(mark["published"]),
+            "ids": [str(i) for i in ids] if isinstance(ids, list) else [],
+            "updated": str(mark.get("updated", "")),
+        }
+    return {}
+
+
+class RateLimiter:
+    """Global minimum spacing between API requests, shared by all fetch threads."""
+
+    def __init__(self, interval: float) -> None:
+        self.interval = max(0.0, interval)
+        self._lock = threading.Lock()
+        self._next_at = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            wait_for = self._next_at - now
+            self._next_at = max(now, self._next_at) + self.interval
+        if wait_for > 0:
+            time.sleep(wait_for)
+
+
+def build_query(
+    category: str,
+    start: int,
+    batch_size: int,
+    search_query: str = "",
+    sort_by: str = "submittedDate",
+) -> str:
     params = {
-        "search_query": f"cat:{category}",
-        "sortBy": "submittedDate",
+        "search_query": search_query or f"cat:{category}",
+        "sortBy": sort_by,
         "sortOrder": "descending",
         "start": start,
         "max_results": batch_size,
@@ -166,6 +279,13 @@ def extract_pdf_url(entry: ET.Element) -> str:
 
 
 def parse_feed_page(xml_bytes: bytes, category: str) -> tuple[str, list[dict]]:
+    with tracing.span("parse_page", category=category, bytes=len(xml_bytes)) as span:
+        feed_title, papers = _parse_feed_entries(xml_bytes, category)
+        span.set(entries=len(papers))
+    return feed_title, papers
+
+
+def _parse_feed_entries(xml_bytes: bytes, category: str) -> tuple[str, list[dict]]:
     root = ET.fromstring(xml_bytes)
     feed_title = text_or_empty(root.find("atom:title", NAMESPACES))
 
@@ -184,10 +304,11 @@ def parse_feed_page(xml_bytes: bytes, category: str) -> tuple[str, list[dict]]:
         primary_category = ""
         primary = entry.find("arxiv:primary_category", NAMESPACES)
         if primary is not None:
-            primary_category = primary.attrib.get("term", "")
+            primary_category = sys.intern(primary.attrib.get("term", ""))
 
+        # A handful of category codes repeat across every entry; share one string each.
         categories = [
-            cat.attrib.get("term", "")
+            sys.intern(cat.attrib.get("term", ""))
             for cat in entry.findall("atom:category", NAMESPACES)
         ]
 
@@ -217,35 +338,107 @@ def fetch_xml(url: str) -> bytes:
             "Accept": "application/atom+xml",
         },
     )
-    with urllib.request.urlopen(req, timeout=30) as resp:
+    with tracing.span("fetch_page", url=url), urllib.request.urlopen(req, timeout=30) as resp:
         return resp.read()
 
 
+def canonical_paper_id(raw: str) -> str:
+    """`http://arxiv.org/abs/2401.12345v2` -> `2401.12345`, so versions share one key."""
+    value = str(raw or "").strip()
+    if "/abs/" in value:
+        value = value.split("/abs/", 1)[1]
+    return re.sub(r"v\d+$", "", value)
+
+
+def paper_updated_at(paper: dict) -> datetime:
+    return (
+        parse_arxiv_datetime(str(paper.get("updated", "")))
+        or parse_arxiv_datetime(str(paper.get("published", "")))
+        or datetime.min.replace(tzinfo=timezone.utc)
+    )
+
+
+def merge_paper_version(merged: dict[str, dict], paper: dict) -> tuple[str, dict | None]:
+    """Keep the newest version of `paper` (by `updated`) under its canonical id.
+
+    Returns ("added" | "updated" | "unchanged", previous record or None).
+    """
+    key = canonical_paper_id(paper.get("id", ""))
+    previous = merged.get(key)
+    if previous is None:
+        merged[key] = paper
+        return "added", None
+    if paper_updated_at(paper) > paper_updated_at(previous):
+        merged[key] = paper
+        return "updated", previous
+    return "unchanged", previous
+
+
 def fetch_field_recent_papers(
     category: str,
     batch_size: int,
     cutoff: datetime,
     request_interval: float,
     existing_papers: list[dict] | None = None,
+    high_water_mark: dict | None = None,
 ) -> dict:
-    existing_papers = existing_papers or []
-    existing_by_id: dict[str, dict] = {}
-    existing_without_id: list[dict] = []
-    for paper in existing_papers:
-        paper_id = str(paper.get("id", "")).strip()
-        if paper_id:
-            existing_by_id[paper_id] = paper
+    merged: dict[str, dict] = {}
+    without_id: list[dict] = []
+    for paper in existing_papers or []:
+        if canonical_paper_id(paper.get("id", "")):
+            merge_paper_version(merged, paper)
         else:
-            existing_without_id.append(paper)
+            without_id.append(paper)
 
     new_papers: list[dict] = []
-    seen_new_ids: set[str] = set()
+    changed_papers: list[dict] = []
+
+    def absorb(paper: dict) -> str:
+        if not canonical_paper_id(paper.get("id", "")):
+            without_id.append(paper)
+            new_papers.append(paper)
+            return "added"
+        status, previous = merge_paper_version(merged, paper)
+        if status == "added":
+            new_papers.append(paper)
+        elif status == "updated" and previous is not None:
+            changed_papers.append(
+                {
+                    "id": paper.get("id", ""),
+                    "previous_id": previous.get("id", ""),
+                    "updated": paper.get("updated", ""),
+                    "field": category,
+                }
+            )
+        return status
+
+    # With a high-water mark from the previous run, ask arXiv only for submissions
+    # at or after it; papers already seen at that timestamp merge as unchanged.
+    # Revisions keep their original submittedDate, so when the mark has an
+    # `updated` timestamp the same query also takes anything updated since, sorted
+    # by lastUpdatedDate: an unchanged feed still costs one near-empty request.
+    high_water_mark = high_water_mark or {}
+    search_query = ""
+    sort_by = "submittedDate"
+    mark_at = parse_arxiv_datetime(str(high_water_mark.get("published", "")))
+    updated_mark_at = parse_arxiv_datetime(str(high_water_mark.get("updated", "")))
+    if mark_at is not None and merged:
+        lower = max(mark_at, cutoff)
+        upper = datetime.now(timezone.utc) + timedelta(minutes=1)
+        submitted = f"submittedDate:[{arxiv_date_stamp(lower)} TO {arxiv_date_stamp(upper)}]"
+        search_query = f"cat:{category} AND {submitted}"
+        if updated_mark_at is not None:
+            updated_lower = max(updated_mark_at, cutoff)
+            revised = f"lastUpdatedDate:[{arxiv_date_stamp(updated_lower)} TO {arxiv_date_stamp(upper)}]"
+            search_query = f"cat:{category} AND ({submitted} OR {revised})"
+            sort_by = "lastUpdatedDate"
+
     feed_title = ""
     start = 0
     page_count = 0
 
     while True:
-        xml_data = fetch_xml(build_query(category, start, batch_size))
+        xml_data = fetch_xml(build_query(category, start, batch_size, search_query=search_query, sort_by=sort_by))
         page_count += 1
         page_title, page_papers = parse_feed_page(xml_data, category)
 
@@ -256,24 +449,19 @@ def fetch_field_recent_papers(
             break
 
         reached_cutoff = False
-        added_count = 0
+        fresh_count = 0
         existing_hits = 0
 
         for paper in page_papers:
-            paper_id = str(paper.get("id", "")).strip()
-            if paper_id and (paper_id in existing_by_id or paper_id in seen_new_ids):
-                existing_hits += 1
-                continue
-
             published_at = parse_arxiv_datetime(paper.get("published", ""))
             if published_at is not None and published_at < cutoff:
-                reached_cutoff = True
+                # Only in submittedDate order is everything after this past the cutoff too.
+                reached_cutoff = sort_by == "submittedDate"
                 continue
-
-            new_papers.append(paper)
-            if paper_id:
-                seen_new_ids.add(paper_id)
-            added_count += 1
+            if absorb(paper) == "unchanged":
+                existing_hits += 1
+            else:
+                fresh_count += 1
 
         if reached_cutoff:
             break
@@ -283,34 +471,20 @@ def fetch_field_recent_papers(
 
         start += len(page_papers)
 
-        if added_count == 0 and existing_hits > 0:
+        if fresh_count == 0 and existing_hits > 0:
             break
 
         if request_interval > 0:
             time.sleep(request_interval)
 
-    merged_by_id = dict(existing_by_id)
-    merged_without_id = list(existing_without_id)
-    for paper in new_papers:
-        paper_id = str(paper.get("id", "")).strip()
-        if paper_id:
-            merged_by_id[paper_id] = paper
-        else:
-            merged_without_id.append(paper)
-
-    all_papers = list(merged_by_id.values()) + merged_without_id
     filtered_papers: list[dict] = []
-    for paper in all_papers:
+    for paper in list(merged.values()) + without_id:
         published_at = parse_arxiv_datetime(str(paper.get("published", "")))
         if published_at is not None and published_at < cutoff:
             continue
         filtered_papers.append(paper)
 
-    filtered_papers.sort(
-        key=lambda item: parse_arxiv_datetime(item.get("published", ""))
-        or datetime.min.replace(tzinfo=timezone.utc),
-        reverse=True,
-    )
+    filtered_papers.sort(key=paper_sort_key, reverse=True)
 
     return {
         "code": category,
@@ -319,11 +493,178 @@ def fetch_field_recent_papers(
         "feed_title": feed_title,
         "count": len(filtered_papers),
         "new_count": len(new_papers),
+        "changed_count": len(changed_papers),
         "request_pages": page_count,
+        "high_water_mark": compute_high_water_mark(filtered_papers),
+        "changed_papers": changed_papers,
         "papers": filtered_papers,
     }
 
 
+def arxiv_date_stamp(value: datetime) -> str:
+    return value.astimezone(timezone.utc).strftime("%Y%m%d%H%M")
+
+
+def build_backfill_slices(
+    cutoff: datetime,
+    now_utc: datetime,
+    slice_days: int,
+) -> list[tuple[datetime, datetime]]:
+    """Split [cutoff, now] on a UTC-midnight grid so closed slices repeat across runs."""
+    slices: list[tuple[datetime, datetime]] = []
+    start = cutoff.astimezone(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    while start < now_utc:
+        end = min(start + timedelta(days=slice_days), now_utc)
+        slices.append((start, end))
+        start = end
+    return slices
+
+
+def backfill_checkpoint_path(checkpoint_dir: Path, category: str, start: datetime, end: datetime) -> Path:
+    return checkpoint_dir / f"{category}_{arxiv_date_stamp(start)}_{arxiv_date_stamp(end)}.json"
+
+
+def fetch_slice_papers(
+    category: str,
+    start_at: datetime,
+    end_at: datetime,
+    batch_size: int,
+    limiter: RateLimiter,
+) -> tuple[str, list[dict], int]:
+    # arXiv's range is inclusive on both ends; stop one minute short of the next slice.
+    last_minute = end_at - timedelta(minutes=1)
+    search_query = (
+        f"cat:{category} AND submittedDate:[{arxiv_date_stamp(start_at)} TO {arxiv_date_stamp(last_minute)}]"
+    )
+    feed_title = ""
+    papers: list[dict] = []
+    start = 0
+    page_count = 0
+    while True:
+        limiter.wait()
+        xml_data = fetch_xml(build_query(category, start, batch_size, search_query=search_query))
+        page_count += 1
+        page_title, page_papers = parse_feed_page(xml_data, category)
+        if page_title and not feed_title:
+            feed_title = page_title
+        papers.extend(page_papers)
+        if len(page_papers) < batch_size:
+            break
+        start += len(page_papers)
+    return feed_title, papers, page_count
+
+
+def fetch_backfill(
+    categories: list[str],
+    cutoff: datetime,
+    now_utc: datetime,
+    batch_size: int,
+    request_interval: float,
+    slice_days: int,
+    workers: int,
+    checkpoint_dir: Path,
+    previous_payload: dict | None = None,
+) -> tuple[list[dict], list[str]]:
+    """Fetch every (category, slice) pair in parallel under one rate limit.
+
+    Each closed slice is checkpointed as soon as it completes, so a restart
+    only refetches missing slices. The open slice ending at `now_utc` is
+    always refetched. A slice that fails keeps the papers the previous
+    snapshot had in its range, and its category gets no high-water mark, so
+    the next incremental run refetches that category's whole window.
+    """
+    limiter = RateLimiter(request_interval)
+    slices = build_backfill_slices(cutoff, now_utc, slice_days)
+    checkpoint_dir.mkdir(parents=True, exist_ok=True)
+
+    per_category: dict[str, dict] = {
+        cat: {"feed_title": "", "pages": 0, "slices": {}} for cat in categories
+    }
+    todo: list[tuple[str, datetime, datetime]] = []
+    for category in categories:
+        for start_at, end_at in slices:
+            path = backfill_checkpoint_path(checkpoint_dir, category, start_at, end_at)
+            cached = load_existing_payload(path) if end_at < now_utc else {}
+            if isinstance(cached.get("papers"), list):
+                per_category[category]["slices"][start_at] = cached["papers"]
+                per_category[category]["feed_title"] = per_category[category]["feed_title"] or cached.get(
+                    "feed_title", ""
+                )
+                continue
+            todo.append((category, start_at, end_at))
+
+    errors: list[str] = []
+    failed: dict[str, list[tuple[datetime, datetime]]] = {cat: [] for cat in categories}
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {
+            pool.submit(fetch_slice_papers, cat, start_at, end_at, batch_size, limiter): (cat, start_at, end_at)
+            for cat, start_at, end_at in todo
+        }
+        for fut in as_completed(futures):
+            category, start_at, end_at = futures[fut]
+            label = f"{category} {start_at.date().isoformat()}..{end_at.date().isoformat()}"
+            try:
+                feed_title, papers, pages = fut.result()
+            except (urllib.error.URLError, ET.ParseError, OSError) as exc:
+                errors.append(f"{label}: {exc}")
+                failed[category].append((start_at, end_at))
+                continue
+            state = per_category[category]
+            state["slices"][start_at] = papers
+            state["pages"] += pages
+            state["feed_title"] = state["feed_title"] or feed_title
+            if end_at < now_utc:
+                write_json(
+                    {"category": category, "feed_title": feed_title, "papers": papers},
+                    backfill_checkpoint_path(checkpoint_dir, category, start_at, end_at),
+                )
+            print(f"slice {label}: {len(papers)} papers in {pages} pages", flush=True)
+
+    fields: list[dict] = []
+    for category in categories:
+        state = per_category[category]
+        if failed[category]:
+            previous = extract_cached_field_papers(previous_payload or {}, category, cutoff)
+            for start_at, end_at in failed[category]:
+                kept: list[dict] = []
+                for paper in previous:
+                    published_at = parse_arxiv_datetime(str(paper.get("published", "")))
+                    if published_at is not None and start_at <= published_at < end_at:
+                        kept.append(paper)
+                state["slices"][start_at] = kept
+        if not any(state["slices"].values()):
+            continue
+        merged: dict[str, dict] = {}
+        without_id: list[dict] = []
+        for start_at in sorted(state["slices"]):
+            for paper in state["slices"][start_at]:
+                if canonical_paper_id(paper.get("id", "")):
+                    merge_paper_version(merged, paper)
+                else:
+                    without_id.append(paper)
+        papers = [
+            p
+            for p in list(merged.values()) + without_id
+            if (parse_arxiv_datetime(str(p.get("published", ""))) or now_utc) >= cutoff
+        ]
+        papers.sort(key=paper_sort_key, reverse=True)
+        fields.append(
+            {
+                "code": category,
+                "name": CATEGORY_NAMES.get(category, category),
+                "query": f"cat:{category}",
+                "feed_title": state["feed_title"],
+                "count": len(papers),
+                "new_count": len(papers),
+                "changed_count": 0,
+                "request_pages": state["pages"],
+                "high_water_mark": {} if failed[category] else compute_high_water_mark(papers),
+                "papers": papers,
+            }
+        )
+    return fields, errors
+
+
 def write_json(data: dict, output_path: Path) -> None:
     output_path.parent.mkdir(parents=True, exist_ok=True)
     output_path.write_text(
@@ -332,9 +673,151 @@ def write_json(data: dict, output_path: Path) -> None:
     )
 
 
+def manifest_path_for(output_path: Path) -> Path:
+    return output_path.with_name(f"{output_path.stem}.manifest.json")
+
+
+def delta_dir_for(output_path: Path) -> Path:
+    return output_path.with_name(f"{output_path.stem}.deltas")
+
+
+def paper_delta_key(paper: dict) -> str:
+    return canonical_paper_id(paper.get("id", "")) or str(paper.get("title", ""))
+
+
+def paper_sort_key(paper: dict) -> tuple[datetime, str]:
+    """Snapshot order (with reverse=True): newest `published` first, ties by canonical id.
+
+    site/app.js `byPublishedThenKey` must order papers the same way so a
+    delta-rebuilt snapshot matches the fetched one.
+    """
+    published_at = parse_arxiv_datetime(str(paper.get("published", ""))) or datetime.min.replace(tzinfo=timezone.utc)
+    return published_at, paper_delta_key(paper)
+
+
+def index_payload_papers(payload: dict) -> dict[str, dict]:
+    indexed: dict[str, dict] = {}
+    for field in payload.get("fields", []) if isinstance(payload.get("fields"), list) else []:
+        if not isinstance(field, dict):
+            continue
+        code = str(field.get("code", ""))
+        for paper in field.get("papers", []) if isinstance(field.get("papers"), list) else []:
+            if not isinstance(paper, dict):
+                continue
+            indexed[f"{code}|{paper_delta_key(paper)}"] = paper
+    return indexed
+
+
+def build_delta(previous: dict, payload: dict) -> dict:
+    """Added, updated and expired papers per field between two snapshots.
+
+    `header` is the new payload without paper lists, so a consumer can rebuild
+    every snapshot-level and field-level value from the delta alone.
+    """
+    old = index_payload_papers(previous)
+    new = index_payload_papers(payload)
+    added: list[dict] = []
+    updated: list[dict] = []
+    for key, paper in new.items():
+        before = old.get(key)
+        if before is None:
+            added.append({"field": key.split("|", 1)[0], "paper": paper})
+        elif before != paper:
+            updated.append({"field": key.split("|", 1)[0], "paper": paper})
+    expired = [
+        {"field": key.split("|", 1)[0], "key": key.split("|", 1)[1], "id": paper.get("id", "")}
+        for key, paper in old.items()
+        if key not in new
+    ]
+    header = {k: v for k, v in payload.items() if k != "fields"}
+    header["fields"] = [{k: v for k, v in field.items() if k != "papers"} for field in payload.get("fields", [])]
+    return {
+        "from": previous.get("fetched_at", ""),
+        "to": payload.get("fetched_at", ""),
+        "header": header,
+        "added": added,
+        "updated": updated,
+        "expired": expired,
+    }
+
+
+def apply_delta(snapshot: dict, delta: dict) -> dict:
+    """Rebuild the snapshot `delta["to"]` from the snapshot `delta["from"]`."""
+    if snapshot.get("fetched_at", "") != delta.get("from"):
+        raise ValueError("delta does not start at this snapshot")
+    papers = index_payload_papers(snapshot)
+    for item in delta.get("expired", []):
+        papers.pop(f"{item.get('field', '')}|{item.get('key', '')}", None)
+    for item in list(delta.get("added", [])) + list(delta.get("updated", [])):
+        paper = item.get("paper", {})
+        papers[f"{item.get('field', '')}|{paper_delta_key(paper)}"] = paper
+
+    by_field: dict[str, list[dict]] = {}
+    for key, paper in papers.items():
+        by_field.setdefault(key.split("|", 1)[0], []).append(paper)
+    rebuilt = dict(delta.get("header", {}))
+    rebuilt["fields"] = []
+    for field in delta.get("header", {}).get("fields", []):
+        field_papers = sorted(by_field.get(field.get("code", ""), []), key=paper_sort_key, reverse=True)
+        rebuilt["fields"].append({**field, "papers": field_papers})
+    return rebuilt
+
+
+def write_delta_files(output_path: Path, previous: dict, payload: dict, keep: int) -> dict | None:
+    """Write this run's delta and extend the manifest's delta chain.
+
+    The chain restarts whenever the previous snapshot is missing or is not the
+    one the manifest last pointed at; entries beyond `keep` are pruned.
+    """
+    manifest_path = manifest_path_for(output_path)
+    delta_dir = delta_dir_for(output_path)
+    manifest = load_existing_payload(manifest_path)
+    chain = manifest.get("deltas", []) if isinstance(manifest.get("deltas"), list) else []
+    previous_at = str(previous.get("fetched_at", ""))
+    if not previous_at or manifest.get("fetched_at") != previous_at:
+        chain = []
+
+    entry = None
+    if previous_at:
+        delta = build_delta(previous, payload)
+        fetched_at = parse_arxiv_datetime(str(payload.get("fetched_at", ""))) or datetime.now(timezone.utc)
+        delta_path = delta_dir / f"{fetched_at.astimezone(timezone.utc).strftime('%Y%m%dT%H%M%S%fZ')}.json"
+        write_json(delta, delta_path)
+        entry = {
+            "file": f"{delta_dir.name}/{delta_path.name}",
+            "from": delta["from"],
+            "to": delta["to"],
+            "added": len(delta["added"]),
+            "updated": len(delta["updated"]),
+            "expired": len(delta["expired"]),
+        }
+        chain.append(entry)
+    chain = chain[-keep:]
+
+    write_json(
+        {
+            "snapshot": output_path.name,
+            "fetched_at": payload.get("fetched_at", ""),
+            "total_count": payload.get("total_count", 0),
+            "deltas": chain,
+        },
+        manifest_path,
+    )
+    referenced = {Path(item.get("file", "")).name for item in chain}
+    if delta_dir.is_dir():
+        for stale in delta_dir.glob("*.json"):
+            if stale.name not in referenced:
+                stale.unlink(missing_ok=True)
+    return entry
+
+
 def main() -> int:
     args = parse_args()
+    with tracing.profiled(args.profile, args.profile_output), tracing.traced(args.trace):
+        return run_fetch(args)
 
+
+def run_fetch(args: argparse.Namespace) -> int:
     if args.window_days < 1:
         print("--window-days must be >= 1", file=sys.stderr)
         return 2
@@ -347,6 +830,14 @@ def main() -> int:
         print("--request-interval must be >= 0", file=sys.stderr)
         return 2
 
+    if args.slice_days < 1:
+        print("--slice-days must be >= 1", file=sys.stderr)
+        return 2
+
+    if args.delta_keep < 0:
+        print("--delta-keep must be >= 0", file=sys.stderr)
+        return 2
+
     categories = parse_categories(args.categories)
     if not categories:
         print("--categories is empty", file=sys.stderr)
@@ -355,30 +846,52 @@ def main() -> int:
     now_utc = datetime.now(timezone.utc)
     cutoff = now_utc - timedelta(days=args.window_days)
 
+    # The previous snapshot seeds incremental fetches and is the base of this run's delta.
+    previous_payload = load_existing_payload(args.output)
     existing_payload = {}
-    if not args.full_refresh:
-        existing_payload = load_existing_payload(args.output)
+    if not args.full_refresh and not args.backfill:
+        existing_payload = previous_payload
 
     fields = []
     errors = []
-    for category in categories:
-        try:
-            cached_papers = (
-                []
-                if args.full_refresh
-                else extract_cached_field_papers(existing_payload, category, cutoff)
-            )
-            fields.append(
-                fetch_field_recent_papers(
-                    category=category,
-                    batch_size=args.batch_size,
-                    cutoff=cutoff,
-                    request_interval=args.request_interval,
-                    existing_papers=cached_papers,
+    checkpoint_dir = args.output.with_name(args.output.name + ".backfill")
+    if args.backfill:
+        fields, errors = fetch_backfill(
+            categories=categories,
+            cutoff=cutoff,
+            now_utc=now_utc,
+            batch_size=args.batch_size,
+            request_interval=args.request_interval,
+            slice_days=args.slice_days,
+            workers=args.workers,
+            checkpoint_dir=checkpoint_dir,
+            previous_payload=previous_payload,
+        )
+    else:
+        for category in categories:
+            try:
+                cached_papers = (
+                    []
+                    if args.full_refresh
+                    else extract_cached_field_papers(existing_payload, category, cutoff)
                 )
-            )
-        except (urllib.error.URLError, ET.ParseError) as exc:
-            errors.append(f"{category}: {exc}")
+                with tracing.span("fetch_field", category=category):
+                    fields.append(
+                        fetch_field_recent_papers(
+                            category=category,
+                            batch_size=args.batch_size,
+                            cutoff=cutoff,
+                            request_interval=args.request_interval,
+                            existing_papers=cached_papers,
+                            high_water_mark=(
+                                {}
+                                if args.full_refresh
+                                else extract_cached_high_water_mark(existing_payload, category)
+                            ),
+                        )
+                    )
+            except (urllib.error.URLError, ET.ParseError) as exc:
+                errors.append(f"{category}: {exc}")
 
     if not fields:
         print(
@@ -387,17 +900,26 @@ def main() -> int:
         )
         return 1
 
+    # Cross-listed papers show up under several fields; report each revision once.
+    changed_by_id: dict[str, dict] = {}
+    for field in fields:
+        for item in field.pop("changed_papers", []):
+            changed_by_id.setdefault(str(item.get("id", "")), item)
+    changed_papers = list(changed_by_id.values())
+
     payload = {
         "source": "arXiv API",
         "fetched_at": now_utc.isoformat(),
         "window_days": args.window_days,
         "window_start": cutoff.isoformat(),
         "window_end": now_utc.isoformat(),
-        "fetch_strategy": "full" if args.full_refresh else "incremental",
+        "fetch_strategy": "backfill" if args.backfill else ("full" if args.full_refresh else "incremental"),
         "categories": categories,
         "total_count": sum(field["count"] for field in fields),
         "total_new_count": sum(field.get("new_count", 0) for field in fields),
+        "total_changed_count": len(changed_papers),
         "total_request_pages": sum(field["request_pages"] for field in fields),
+        "changed_papers": changed_papers,
         "fields": fields,
         "errors": errors,
     }
@@ -408,16 +930,35 @@ def main() -> int:
         print(f"File write error: {exc}", file=sys.stderr)
         return 1
 
+    if args.backfill and not errors:
+        shutil.rmtree(checkpoint_dir, ignore_errors=True)
+
+    if args.delta_keep > 0:
+        try:
+            delta_entry = write_delta_files(args.output, previous_payload, payload, args.delta_keep)
+        except OSError as exc:
+            print(f"Delta write error: {exc}", file=sys.stderr)
+        else:
+            if delta_entry is not None:
+                print(
+                    f"Delta +{delta_entry['added']} ~{delta_entry['updated']} -{delta_entry['expired']} "
+                    f"-> {os.fspath(delta_dir_for(args.output) / Path(delta_entry['file']).name)}"
+                )
+
     print(
         "Fetched "
         f"{payload['total_count']} papers across {len(fields)} categories "
         f"within last {args.window_days} days "
-        f"(new: {payload['total_new_count']}, strategy: {payload['fetch_strategy']}) "
+        f"(new: {payload['total_new_count']}, changed: {payload['total_changed_count']}, strategy: {payload['fetch_strategy']}) "
         f"-> {os.fspath(args.output)}"
     )
 
     if errors:
         print("Partial errors: " + "; ".join(errors), file=sys.stderr)
+        if args.backfill:
+            # Finished slices are checkpointed; rerunning --backfill fetches only the failed ones.
+            print(f"Backfill incomplete; rerun --backfill to retry failed slices ({checkpoint_dir}).", file=sys.stderr)
+            return 1
 
     return 0
 
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Precompiled section-signal checks for extracted full text.
+
+- Keyword sets (Method / Experiments, ...) compile once per category, at import time.
+- Headings are matched by substring; body text by the "heading-like line" rule
+  (optional numbering, a short title run, then the keyword as a whole word).
+- `BodySignalScan` is incremental: feed headings, PDF pages or raw text pieces as
+  they arrive. Complete lines are scanned once, only for categories still missing,
+  and feeding stops doing work as soon as every category has matched — so the
+  check never needs the joined `full_text`.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Iterable, Mapping
+
+
+def heading_like_pattern(keywords: Iterable[str]) -> re.Pattern[str]:
+    """Line-anchored pattern: optional "3.2" numbering, up to ~80 title characters, then a keyword."""
+    return re.compile(
+        r"^\s*(?:\d+(?:\.\d+)*\s+)?(?:[A-Z][A-Za-z0-9\-,: ]{0,80})?\b("
+        + "|".join(re.escape(k) for k in keywords)
+        + r")\b",
+        re.IGNORECASE | re.MULTILINE,
+    )
+
+
+class KeywordSignalMatcher:
+    """Per-category compiled patterns for headings and heading-like body lines."""
+
+    def __init__(self, categories: Mapping[str, Iterable[str]]):
+        self.categories = tuple(categories)
+        self._heading_res: dict[str, re.Pattern[str]] = {}
+        self._line_res: dict[str, re.Pattern[str]] = {}
+        for category, keywords in categories.items():
+            keywords = [k.lower() for k in keywords]
+            self._heading_res[category] = re.compile("|".join(re.escape(k) for k in keywords))
+            self._line_res[category] = heading_like_pattern(keywords)
+
+    def heading_categories(self, heading: str, wanted: Iterable[str] | None = None) -> set[str]:
+        """Categories whose keyword appears anywhere in the heading (case-insensitive substring)."""
+        lowered = heading.lower()
+        return {c for c in (self.categories if wanted is None else wanted) if self._heading_res[c].search(lowered)}
+
+    def text_categories(self, text: str, wanted: Iterable[str] | None = None) -> set[str]:
+        """Categories with at least one heading-like line in `text` (one or more whole lines)."""
+        return {c for c in (self.categories if wanted is None else wanted) if self._line_res[c].search(text)}
+
+
+class BodySignalScan:
+    """Incremental body check: character count plus category signals, short-circuiting."""
+
+    def __init__(self, matcher: KeywordSignalMatcher):
+        self.matcher = matcher
+        self.wanted = frozenset(matcher.categories)
+        self.found: set[str] = set()
+        self.chars = 0
+        self._partial_line = ""
+
+    @property
+    def complete(self) -> bool:
+        return self.wanted <= self.found
+
+    @property
+    def missing(self) -> set[str]:
+        return set(self.wanted - self.found)
+
+    def add_heading(self, heading: str) -> None:
+        if not self.complete:
+            self.found |= self.matcher.heading_categories(heading, self.missing)
+
+    def add_lines(self, text: str) -> None:
+        """Text made of whole lines (no line continues into the next call)."""
+        if not self.complete:
+            self.found |= self.matcher.text_categories(text, self.missing)
+
+    def add_text(self, text: str) -> None:
+        """Feed raw text in arbitrary pieces; a line split across pieces is scanned once, whole."""
+        self.chars += len(text)
+        if self.complete:
+            return
+        cut = text.rfind("\n")
+        if cut < 0:
+            self._partial_line += text
+            return
+        self.add_lines(self._partial_line + text[:cut])
+        self._partial_line = text[cut + 1 :]
+
+    def add_page(self, page_no: int, text: str) -> None:
+        """One PDF page, fed the way it appears in `full_text` ("[Page n]" line, then the text)."""
+        self.add_text(("\n" if self.chars else "") + f"[Page {page_no}]\n{text}")
+
+    def finish(self) -> set[str]:
+        if self._partial_line:
+            self.add_lines(self._partial_line)
+            self._partial_line = ""
+        return self.found
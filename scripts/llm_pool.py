@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+"""Weighted pool of OpenAI-compatible endpoints with health scoring and hedged requests.
+
+- Endpoints come from `LLM_ENDPOINTS` (inline JSON list or a path to a JSON file);
+  each entry has `base_url`, `api_key` or `api_key_env`, and an optional `weight`
+  and `name`. Without it the pool holds the single endpoint the CLI was given.
+- Each endpoint keeps a rolling window of latencies and outcomes. Picks are
+  weighted by `weight / (1 + median latency) * success_rate**2`; an endpoint with
+  several consecutive faults sits out a cooldown.
+- Hedging: if the first request has not answered after that endpoint's rolling
+  p95 (clamped to [hedge_min, hedge_max]), a backup goes to another endpoint and
+  the first answer wins. A losing stream is closed; a losing plain request
+  cannot be interrupted mid-flight, so its reply is dropped when it lands.
+- A fault before the hedge timer fails over to the next endpoint at once.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+import runtime_metrics as metrics
+import tracing
+
+HEDGE_MODES = ("auto", "on", "off")
+DEFAULT_HEDGE = os.getenv("LLM_HEDGE", "auto")
+DEFAULT_HEDGE_MIN_SECONDS = float(os.getenv("LLM_HEDGE_MIN_SECONDS", "1.0"))
+DEFAULT_HEDGE_MAX_SECONDS = float(os.getenv("LLM_HEDGE_MAX_SECONDS", "30.0"))
+# Used until an endpoint has HEALTH_MIN_SAMPLES latencies of its own.
+DEFAULT_HEDGE_SECONDS = float(os.getenv("LLM_HEDGE_SECONDS", "8.0"))
+# Requests run on pool threads while callers wait, so this bounds in-flight requests
+# (primaries, backups and abandoned losers) across all callers.
+DEFAULT_POOL_THREADS = int(os.getenv("LLM_POOL_THREADS", "64"))
+HEALTH_WINDOW = 50
+HEALTH_MIN_SAMPLES = 8
+COOLDOWN_FAULTS = 3
+COOLDOWN_SECONDS = 30.0
+
+ENDPOINT_REQUESTS = metrics.REGISTRY.counter(
+    "myarxiv_llm_endpoint_requests_total",
+    "LLM requests per pool endpoint by outcome (ok, fault, error, abandoned = closed by the pool after losing a race).",
+    ("endpoint", "outcome"),
+)
+ENDPOINT_LATENCY = metrics.REGISTRY.histogram(
+    "myarxiv_llm_endpoint_latency_seconds",
+    "Per-endpoint latency: full reply for plain requests, first token for streams.",
+    ("endpoint",),
+)
+HEDGED_REQUESTS = metrics.REGISTRY.counter(
+    "myarxiv_llm_hedged_total", "Backup requests sent by the pool, by which request won.", ("winner",)
+)
+
+
+class LostRace(RuntimeError):
+    """Raised by a request the pool itself aborted after another one won."""
+
+
+def is_endpoint_fault(err: Exception) -> bool:
+    """Errors that say something about the endpoint rather than the request.
+
+    Connection errors and timeouts carry no status; 429/5xx and auth failures are
+    endpoint-specific. Other 4xx (bad request, unsupported response_format) would
+    fail the same way anywhere, so they neither fail over nor hurt health.
+    """
+    status = getattr(err, "status_code", None)
+    if status is None:
+        return True
+    return status in (401, 403, 408, 409, 429) or status >= 500
+
+
+@dataclass
+class Endpoint:
+    name: str
+    base_url: str | None
+    api_key: str
+    weight: float = 1.0
+    client: Any = None
+    latencies: deque[float] = field(default_factory=lambda: deque(maxlen=HEALTH_WINDOW))
+    outcomes: deque[bool] = field(default_factory=lambda: deque(maxlen=HEALTH_WINDOW))
+    consecutive_faults: int = 0
+    cooldown_until: float = 0.0
+
+    def record(self, ok: bool, latency: float | None = None) -> None:
+        self.outcomes.append(ok)
+        if ok:
+            self.consecutive_faults = 0
+            if latency is not None:
+                self.latencies.append(latency)
+                ENDPOINT_LATENCY.observe(latency, endpoint=self.name)
+        else:
+            self.consecutive_faults += 1
+            if self.consecutive_faults >= COOLDOWN_FAULTS:
+                self.cooldown_until = time.monotonic() + COOLDOWN_SECONDS
+
+    def available(self, now: float) -> bool:
+        return now >= self.cooldown_until
+
+    def score(self) -> float:
+        success = (sum(self.outcomes) + 1) / (len(self.outcomes) + 1)
+        latency = sorted(self.latencies)[len(self.latencies) // 2] if self.latencies else 0.0
+        return self.weight / (1.0 + latency) * success * success
+
+    def hedge_delay(self, lower: float, upper: float, default: float) -> float:
+        if len(self.latencies) < HEALTH_MIN_SAMPLES:
+            return min(upper, max(lower, default))
+        ordered = sorted(self.latencies)
+        p95 = ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))]
+        return min(upper, max(lower, p95))
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "base_url": self.base_url,
+            "weight": self.weight,
+            "score": round(self.score(), 4),
+            "samples": len(self.outcomes),
+            "cooling": not self.available(time.monotonic()),
+        }
+
+
+def load_endpoint_specs(raw: str) -> list[dict[str, Any]]:
+    """`LLM_ENDPOINTS` value -> list of endpoint dicts (inline JSON or a JSON file path)."""
+    text = raw.strip()
+    if not text:
+        return []
+    if not text.startswith(("[", "{")):
+        text = Path(text).expanduser().read_text(encoding="utf-8")
+    data = json.loads(text)
+    if isinstance(data, dict):
+        data = data.get("endpoints", [])
+    if not isinstance(data, list) or not all(isinstance(item, dict) for item in data):
+        raise ValueError("LLM_ENDPOINTS must be a JSON list of {base_url, api_key|api_key_env, weight} objects")
+    return data
+
+
+def build_endpoints(specs: list[dict[str, Any]], default_api_key: str) -> list[Endpoint]:
+    endpoints: list[Endpoint] = []
+    for i, spec in enumerate(specs):
+        api_key = str(spec.get("api_key") or "").strip()
+        if not api_key and spec.get("api_key_env"):
+            api_key = os.getenv(str(spec["api_key_env"]), "").strip()
+        base_url = str(spec.get("base_url") or "").strip() or None
+        weight = float(spec.get("weight", 1.0))
+        if weight <= 0:
+            continue
+        endpoints.append(
+            Endpoint(
+                name=str(spec.get("name") or base_url or f"endpoint-{i}"),
+                base_url=base_url,
+                api_key=api_key or default_api_key,
+                weight=weight,
+            )
+        )
+    return endpoints
+
+
+class PooledStream:
+    """A winning chat stream: replays the parts read while racing, then the rest."""
+
+    def __init__(self, endpoint: Endpoint, stream: Any, buffered: list[Any], rest: Iterator[Any]) -> None:
+        self.endpoint = endpoint
+        self._stream = stream
+        self._buffered = buffered
+        self._rest = rest
+
+    def __iter__(self) -> Iterator[Any]:
+        yield from self._buffered
+        self._buffered = []
+        yield from self._rest
+
+    def close(self) -> None:
+        if hasattr(self._stream, "close"):
+            try:
+                self._stream.close()
+            except Exception:  # noqa: BLE001
+                pass
+
+
+class EndpointPool:
+    def __init__(
+        self,
+        endpoints: list[Endpoint],
+        client_factory: Callable[[Endpoint], Any],
+        hedge: str = DEFAULT_HEDGE,
+        hedge_min: float = DEFAULT_HEDGE_MIN_SECONDS,
+        hedge_max: float = DEFAULT_HEDGE_MAX_SECONDS,
+        hedge_default: float = DEFAULT_HEDGE_SECONDS,
+        seed: int | None = None,
+        max_threads: int = DEFAULT_POOL_THREADS,
+    ) -> None:
+        if not endpoints:
+            raise ValueError("LLM endpoint pool is empty")
+        for endpoint in endpoints:
+            endpoint.client = client_factory(endpoint)
+        self.endpoints = endpoints
+        self.hedge = hedge if hedge in HEDGE_MODES else "auto"
+        self.hedge_min = hedge_min
+        self.hedge_max = hedge_max
+        self.hedge_default = hedge_default
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max(4, max_threads), thread_name_prefix="llm-pool")
+
+    @property
+    def hedging(self) -> bool:
+        if self.hedge == "off":
+            return False
+        return self.hedge == "on" or len(self.endpoints) > 1
+
+    def pick(self, exclude: tuple[Endpoint, ...] = ()) -> Endpoint:
+        """Weighted pick by health score, skipping `exclude` and cooling endpoints when possible."""
+        with self._lock:
+            now = time.monotonic()
+            candidates = [e for e in self.endpoints if e not in exclude and e.available(now)]
+            if not candidates:
+                candidates = [e for e in self.endpoints if e not in exclude] or list(self.endpoints)
+            if len(candidates) == 1:
+                return candidates[0]
+            return self._rng.choices(candidates, weights=[e.score() for e in candidates])[0]
+
+    def _record(self, endpoint: Endpoint, ok: bool, latency: float | None = None, outcome: str = "") -> None:
+        with self._lock:
+            endpoint.record(ok, latency)
+        ENDPOINT_REQUESTS.inc(endpoint=endpoint.name, outcome=outcome or ("ok" if ok else "fault"))
+
+    def _attempt(
+        self,
+        endpoint: Endpoint,
+        run: Callable[[Endpoint, threading.Event], Any],
+        cancelled: threading.Event,
+        parent_id: int,
+        span_attrs: dict[str, Any],
+    ) -> Any:
+        started = time.perf_counter()
+        try:
+            # Attempts run on pool threads, so the caller's span is passed in explicitly.
+            with tracing.span("llm_call", parent_id=parent_id, endpoint=endpoint.name, **span_attrs):
+                result = run(endpoint, cancelled)
+        except LostRace:
+            # Aborted by us, which says nothing about the endpoint: leave its health alone.
+            ENDPOINT_REQUESTS.inc(endpoint=endpoint.name, outcome="abandoned")
+            raise
+        except Exception as err:  # noqa: BLE001
+            # A loser that failed on its own still counts, race or not.
+            if is_endpoint_fault(err):
+                self._record(endpoint, False)
+            else:
+                ENDPOINT_REQUESTS.inc(endpoint=endpoint.name, outcome="error")
+            raise
+        # A loser that still completed is a real, uncensored latency sample; only its result is dropped.
+        self._record(endpoint, True, time.perf_counter() - started)
+        return result
+
+    def _hedged(
+        self,
+        run: Callable[[Endpoint, threading.Event], Any],
+        on_win: Callable[[Any], None],
+        discard: Callable[[Any], None],
+        **span_attrs: Any,
+    ) -> Any:
+        """Run `run(endpoint, cancelled)` with failover and at most one backup; first success wins.
+
+        `on_win(result)` runs once the winner is known (to abort the loser); `discard`
+        receives a loser's result if it still completes. `span_attrs` go on each
+        attempt's llm_call span.
+        """
+        cancelled = threading.Event()
+        parent_id = tracing.current_span_id()
+        primary = self.pick()
+        if not self.hedging and len(self.endpoints) == 1:
+            return self._attempt(primary, run, cancelled, parent_id, span_attrs)
+
+        def launch(endpoint: Endpoint) -> None:
+            future = self._executor.submit(self._attempt, endpoint, run, cancelled, parent_id, span_attrs)
+            launched[future] = endpoint
+            pending.add(future)
+
+        launched: dict[Future[Any], Endpoint] = {}
+        pending: set[Future[Any]] = set()
+        launch(primary)
+        delay = primary.hedge_delay(self.hedge_min, self.hedge_max, self.hedge_default)
+        last_error: Exception | None = None
+        while pending:
+            timeout = delay if self.hedging and len(launched) == 1 else None
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                # Hedge timer fired with the first request still in flight.
+                launch(self.pick(exclude=(primary,)) if len(self.endpoints) > 1 else primary)
+                continue
+            for future in done:
+                err = future.exception()
+                if err is None:
+                    cancelled.set()
+                    result = future.result()
+                    on_win(result)
+                    if len(launched) > 1:
+                        HEDGED_REQUESTS.inc(winner="primary" if launched[future] is primary else "backup")
+                    for loser in pending:
+                        loser.add_done_callback(lambda f: discard(f.result()) if f.exception() is None else None)
+                    return result
+                last_error = err
+            if not pending and len(launched) == 1 and len(self.endpoints) > 1 and is_endpoint_fault(last_error):
+                # The first request faulted before any hedge: fail over once, right away.
+                launch(self.pick(exclude=(primary,)))
+        raise last_error if last_error else RuntimeError("LLM request failed")
+
+    def complete(self, **create_kwargs: Any) -> str:
+        """One non-streaming chat completion; returns the stripped reply text."""
+
+        def run(endpoint: Endpoint, _cancelled: threading.Event) -> str:
+            resp = endpoint.client.chat.completions.create(**create_kwargs)
+            return (resp.choices[0].message.content or "").strip()
+
+        return self._hedged(
+            run, on_win=lambda _text: None, discard=lambda _text: None, model=create_kwargs.get("model")
+        )
+
+    def open_stream(self, **create_kwargs: Any) -> PooledStream:
+        """Start a streaming chat completion; the race is decided by the first content token."""
+        opened: list[Any] = []
+        closed: list[Any] = []
+        opened_lock = threading.Lock()
+
+        def close_quietly(stream: Any) -> None:
+            if hasattr(stream, "close"):
+                try:
+                    stream.close()
+                except Exception:  # noqa: BLE001
+                    pass
+
+        def was_closed(stream: Any) -> bool:
+            with opened_lock:
+                return any(s is stream for s in closed)
+
+        def run(endpoint: Endpoint, cancelled: threading.Event) -> PooledStream:
+            stream = endpoint.client.chat.completions.create(stream=True, **create_kwargs)
+            with opened_lock:
+                if cancelled.is_set():
+                    close_quietly(stream)
+                    raise LostRace("stream lost the hedge race")
+                opened.append(stream)
+            parts = iter(stream)
+            buffered: list[Any] = []
+            try:
+                for part in parts:
+                    buffered.append(part)
+                    try:
+                        if part.choices[0].delta.content:
+                            break
+                    except Exception:  # noqa: BLE001
+                        continue
+                else:
+                    if was_closed(stream):
+                        raise LostRace("stream closed after losing the hedge race")
+            except LostRace:
+                raise
+            except Exception as err:  # noqa: BLE001
+                if was_closed(stream):
+                    raise LostRace("stream closed after losing the hedge race") from err
+                raise
+            return PooledStream(endpoint, stream, buffered, parts)
+
+        def close_losers(winner: PooledStream) -> None:
+            with opened_lock:
+                losers = [s for s in opened if s is not winner._stream]
+                closed.extend(losers)
+            for stream in losers:
+                close_quietly(stream)
+
+        return self._hedged(
+            run,
+            on_win=close_losers,
+            discard=lambda loser: loser.close(),
+            model=create_kwargs.get("model"),
+            stream=True,
+        )
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        with self._lock:
+            return [e.snapshot() for e in self.endpoints]
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Route abstract summaries between model_fast and model_deep (`--mode auto`).
+
+- Initial tier from the abstract itself: boilerplate notices (withdrawn, erratum)
+  and short abstracts go fast; long abstracts, or abstracts in a deep-listed
+  field past the short threshold, go deep.
+- A fast summary that fails the cheap quality check (missing [1]-[4]/[依据]
+  sections, too short) is escalated to deep once.
+- A per-batch deep budget in estimated tokens and/or seconds; once spent, the
+  remaining papers stay on fast, escalations included. Each deep call reserves
+  its estimated cost before it starts, so parallel workers cannot overshoot.
+- Every paper gets a decision dict, stored under `routing` in its record.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Any
+
+DEFAULT_SHORT_TOKENS = int(os.getenv("LLM_ROUTE_SHORT_TOKENS", "120"))
+DEFAULT_DEEP_TOKENS = int(os.getenv("LLM_ROUTE_DEEP_TOKENS", "320"))
+DEFAULT_DEEP_FIELDS = os.getenv("LLM_ROUTE_DEEP_FIELDS", "")
+DEFAULT_MIN_SUMMARY_CHARS = int(os.getenv("LLM_ROUTE_MIN_SUMMARY_CHARS", "200"))
+# Reservation estimates for a deep call until the batch has settled calls of its own.
+DEFAULT_COMPLETION_TOKENS = int(os.getenv("LLM_ROUTE_COMPLETION_TOKENS", "600"))
+DEFAULT_DEEP_CALL_SECONDS = float(os.getenv("LLM_ROUTE_DEEP_CALL_SECONDS", "10"))
+
+REQUIRED_SECTIONS = ("[1]", "[2]", "[3]", "[4]", "[依据]")
+BOILERPLATE_ABSTRACT_RE = re.compile(
+    r"\b(?:this (?:paper|article|submission) has been withdrawn|withdrawn by the authors?|erratum|corrigendum"
+    r"|duplicate submission|superseded by)\b",
+    re.IGNORECASE,
+)
+
+
+def summary_quality_issues(markdown: str, min_chars: int = DEFAULT_MIN_SUMMARY_CHARS) -> list[str]:
+    """Cheap structural check of an abstract summary; empty list means it passes."""
+    issues = [f"missing {section}" for section in REQUIRED_SECTIONS if section not in markdown]
+    if len(markdown.strip()) < min_chars:
+        issues.append(f"too short ({len(markdown.strip())} < {min_chars} chars)")
+    return issues
+
+
+@dataclass
+class RoutingBudget:
+    """Deep-model spend allowed for one batch; 0 means unlimited on that axis.
+
+    Deep calls go through `estimate` -> `try_reserve` -> `settle`: the estimate is
+    held while the call runs and swapped for the measured cost afterwards.
+    """
+
+    max_tokens: int = 0
+    max_seconds: float = 0.0
+    spent_tokens: int = 0
+    spent_seconds: float = 0.0
+    reserved_tokens: int = 0
+    reserved_seconds: float = 0.0
+    settled_calls: int = 0
+    settled_completion_tokens: int = 0
+    settled_seconds: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def exhausted(self) -> bool:
+        with self._lock:
+            return (self.max_tokens > 0 and self.spent_tokens + self.reserved_tokens >= self.max_tokens) or (
+                self.max_seconds > 0 and self.spent_seconds + self.reserved_seconds >= self.max_seconds
+            )
+
+    def estimate(self, prompt_tokens: int) -> tuple[int, float]:
+        """(tokens, seconds) to reserve for one deep call, from this batch's settled calls once it has any."""
+        with self._lock:
+            if not self.settled_calls:
+                return prompt_tokens + DEFAULT_COMPLETION_TOKENS, DEFAULT_DEEP_CALL_SECONDS
+            completion = self.settled_completion_tokens // self.settled_calls
+            return prompt_tokens + completion, self.settled_seconds / self.settled_calls
+
+    def try_reserve(self, tokens: int, seconds: float) -> bool:
+        """Hold `tokens`/`seconds` for a deep call if they fit under the caps; False means stay on fast."""
+        with self._lock:
+            if self.max_tokens > 0 and self.spent_tokens + self.reserved_tokens + tokens > self.max_tokens:
+                return False
+            if self.max_seconds > 0 and self.spent_seconds + self.reserved_seconds + seconds > self.max_seconds:
+                return False
+            self.reserved_tokens += tokens
+            self.reserved_seconds += seconds
+            return True
+
+    def settle(
+        self, reserved_tokens: int, reserved_seconds: float, prompt_tokens: int, completion_tokens: int, seconds: float
+    ) -> None:
+        """Release a reservation and charge what the call actually cost (no completion if it failed)."""
+        with self._lock:
+            self.reserved_tokens -= reserved_tokens
+            self.reserved_seconds -= reserved_seconds
+            self.spent_tokens += prompt_tokens + completion_tokens
+            self.spent_seconds += seconds
+            if completion_tokens:
+                self.settled_calls += 1
+                self.settled_completion_tokens += completion_tokens
+                self.settled_seconds += seconds
+
+    def charge(self, tokens: int, seconds: float) -> None:
+        with self._lock:
+            self.spent_tokens += tokens
+            self.spent_seconds += seconds
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "max_tokens": self.max_tokens,
+                "max_seconds": self.max_seconds,
+                "spent_tokens": self.spent_tokens,
+                "spent_seconds": round(self.spent_seconds, 3),
+            }
+
+
+@dataclass
+class ModelRouter:
+    short_tokens: int = DEFAULT_SHORT_TOKENS
+    deep_tokens: int = DEFAULT_DEEP_TOKENS
+    deep_fields: frozenset[str] = frozenset(f.strip() for f in DEFAULT_DEEP_FIELDS.split(",") if f.strip())
+    min_summary_chars: int = DEFAULT_MIN_SUMMARY_CHARS
+    budget: RoutingBudget = field(default_factory=RoutingBudget)
+
+    def initial_tier(self, abstract: str, abstract_tokens: int, paper_field: str) -> tuple[str, str]:
+        """(tier, reason) before any model call; tier is "fast" or "deep"."""
+        if BOILERPLATE_ABSTRACT_RE.search(abstract):
+            return "fast", "boilerplate"
+        if abstract_tokens < self.short_tokens:
+            return "fast", "short"
+        if abstract_tokens >= self.deep_tokens:
+            tier, reason = "deep", "long"
+        elif paper_field in self.deep_fields:
+            tier, reason = "deep", "field"
+        else:
+            return "fast", "default"
+        if self.budget.exhausted():
+            return "fast", f"budget ({reason})"
+        return tier, reason
+
+    def should_escalate(self, issues: list[str]) -> bool:
+        return bool(issues) and not self.budget.exhausted()
+
+    def report_mode(self) -> str:
+        """Tier for the daily report: deep unless the batch budget is spent."""
+        return "fast" if self.budget.exhausted() else "deep"
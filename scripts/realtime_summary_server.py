@@ -3,25 +3,88 @@
 
 - Keeps GitHub Actions for daily batch jobs.
 - Provides real-time streaming for one-paper summarization.
+- Multiplexes several paper summaries on one SSE connection (`/api/summarize-many/stream`).
+- Admission control: a bounded, priority-aware job queue caps concurrent LLM calls.
+- Prometheus-style `/metrics` with in-process counters and hot-path timers.
+- Serves finished summaries from a resident, ETag-validated store (`/api/summary/{id}`).
 """
 
 from __future__ import annotations
 
 import argparse
+import asyncio
+import gzip
+import hashlib
+import itertools
 import json
+import math
 import os
 import sys
+import threading
+import time
 import traceback
-from dataclasses import asdict
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Any, AsyncGenerator
+from typing import Any, AsyncGenerator, AsyncIterator
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import JSONResponse, PlainTextResponse, Response, StreamingResponse
 from pydantic import BaseModel, Field
 
 import arxiv_fulltext_summarizer as core
+import runtime_metrics as metrics
+
+try:
+    import brotli
+except ModuleNotFoundError:
+    brotli = None
+
+DEFAULT_MAX_CONCURRENCY = int(os.getenv("REALTIME_MAX_CONCURRENCY", "4"))
+DEFAULT_MAX_QUEUE = int(os.getenv("REALTIME_MAX_QUEUE", "32"))
+QUEUE_POLL_SECONDS = 1.0
+MAX_BATCH_IDS = int(os.getenv("REALTIME_MAX_BATCH_IDS", "50"))
+INDEX_COMPACT_DELAY_SECONDS = float(os.getenv("REALTIME_INDEX_COMPACT_DELAY", "5"))
+SUMMARY_CACHE_CONTROL = os.getenv("REALTIME_SUMMARY_CACHE_CONTROL", "public, max-age=300, stale-while-revalidate=3600")
+MIN_COMPRESS_BYTES = 512
+
+# Lower value = served first. Interactive single-paper requests always beat background work.
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 1
+
+HTTP_REQUESTS = metrics.REGISTRY.counter(
+    "myarxiv_http_requests_total", "HTTP requests by route and status.", ("route", "status")
+)
+ACTIVE_STREAMS = metrics.REGISTRY.gauge("myarxiv_active_streams", "SSE streams currently open.")
+QUEUE_DEPTH = metrics.REGISTRY.gauge("myarxiv_queue_depth", "Jobs waiting for a summarization slot.")
+QUEUE_RUNNING = metrics.REGISTRY.gauge("myarxiv_queue_running", "Jobs holding a summarization slot.")
+QUEUE_WAIT_SECONDS = metrics.REGISTRY.histogram(
+    "myarxiv_queue_wait_seconds", "Time from submit to slot grant."
+)
+RECORD_LOAD_SECONDS = metrics.REGISTRY.histogram(
+    "myarxiv_record_load_seconds", "Time to load and sort paper records."
+)
+TTFT_SECONDS = metrics.REGISTRY.histogram(
+    "myarxiv_time_to_first_token_seconds", "Time from LLM request to first streamed token."
+)
+TOKENS_PER_SECOND = metrics.REGISTRY.histogram(
+    "myarxiv_stream_tokens_per_second",
+    "Streamed token chunks per second after the first token.",
+    buckets=metrics.RATE_BUCKETS,
+)
+STREAM_DURATION_SECONDS = metrics.REGISTRY.histogram(
+    "myarxiv_stream_duration_seconds", "Total SSE stream duration, including queue wait."
+)
+UPSTREAM_ERRORS = metrics.REGISTRY.counter(
+    "myarxiv_upstream_errors_total", "LLM provider errors by exception class.", ("error_class",)
+)
+CACHE_REQUESTS = metrics.REGISTRY.counter(
+    "myarxiv_cache_requests_total", "Cache lookups by cache and result.", ("cache", "result")
+)
+CACHE_HIT_RATIO = metrics.REGISTRY.gauge(
+    "myarxiv_cache_hit_ratio", "Hits / lookups since start, per cache.", ("cache",)
+)
 
 
 def parse_args() -> argparse.Namespace:
@@ -33,6 +96,24 @@ def parse_args() -> argparse.Namespace:
         default=os.getenv("REALTIME_ALLOWED_ORIGINS", "*"),
         help="Comma-separated origins. Default '*'.",
     )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENCY,
+        help=f"Max summarizations running at once (default: {DEFAULT_MAX_CONCURRENCY}).",
+    )
+    parser.add_argument(
+        "--max-queue",
+        type=int,
+        default=DEFAULT_MAX_QUEUE,
+        help=f"Max waiting jobs before rejecting with 503 (default: {DEFAULT_MAX_QUEUE}).",
+    )
+    parser.add_argument(
+        "--summaries-dir",
+        type=Path,
+        default=Path(os.getenv("REALTIME_SUMMARIES_DIR", "outputs/summaries")),
+        help="Directory the read-only GET /api/summary endpoints serve from (default: outputs/summaries).",
+    )
     return parser.parse_args()
 
 
@@ -48,11 +129,26 @@ class StreamOneRequest(BaseModel):
     save: bool = Field(default=False)
 
 
+class StreamManyRequest(BaseModel):
+    arxiv_ids: list[str] = Field(..., description="arXiv ids to summarize on one stream")
+    input_path: str = Field(default="data/latest_cs_daily.json")
+    output_dir: str = Field(default="outputs/summaries")
+    mode: str = Field(default="deep")
+    model: str = Field(default="")
+    base_url: str = Field(default="")
+    save: bool = Field(default=False)
+    max_parallel: int = Field(default=3, ge=1, description="Papers summarized at once for this batch")
+
+
 class StreamEventEmitter:
-    def __init__(self) -> None:
+    def __init__(self, tags: dict[str, Any] | None = None) -> None:
         self._buffer: list[str] = []
+        # Merged into every event, e.g. arxiv_id when several papers share one stream.
+        self._tags = dict(tags or {})
 
     def emit(self, event: str, data: dict[str, Any]) -> None:
+        if self._tags:
+            data = {**self._tags, **data}
         payload = json.dumps(data, ensure_ascii=False)
         self._buffer.append(f"event: {event}\ndata: {payload}\n\n")
 
@@ -62,14 +158,425 @@ class StreamEventEmitter:
         return out
 
 
-def pick_record(records: list[core.PaperRecord], arxiv_id: str) -> core.PaperRecord:
+class QueueFullError(RuntimeError):
+    """Raised when the job queue cannot accept another waiting job."""
+
+    def __init__(self, retry_after: int) -> None:
+        super().__init__("Server busy, retry later.")
+        self.retry_after = retry_after
+
+
+@dataclass
+class JobTicket:
+    client_id: str
+    priority: int
+    seq: int
+    enqueued_at: float
+    started_at: float = 0.0
+    released: bool = False
+    granted: asyncio.Event = field(default_factory=asyncio.Event)
+
+
+class SummaryJobQueue:
+    """Bounded admission queue for LLM jobs.
+
+    Runs at most `max_concurrency` jobs at once. Waiting jobs are ordered by
+    priority first, then round-robin across clients (a client's n-th waiting job
+    ranks behind every other client's earlier jobs), then arrival order.
+    All methods must be called from the event loop thread.
+    """
+
+    def __init__(self, max_concurrency: int, max_queue: int) -> None:
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_queue = max(0, max_queue)
+        self._waiting: list[JobTicket] = []
+        self._active_by_client: dict[str, int] = {}
+        self._running = 0
+        self._seq = itertools.count()
+        # EWMA of job duration, used for Retry-After estimates.
+        self._avg_job_seconds = 20.0
+
+    @property
+    def running(self) -> int:
+        return self._running
+
+    @property
+    def depth(self) -> int:
+        return len(self._waiting)
+
+    def retry_after(self) -> int:
+        waves = (len(self._waiting) + 1) / self.max_concurrency
+        return max(1, min(300, math.ceil(self._avg_job_seconds * waves)))
+
+    def submit(self, client_id: str, priority: int = PRIORITY_INTERACTIVE) -> JobTicket:
+        if len(self._waiting) >= self.max_queue and self._running >= self.max_concurrency:
+            raise QueueFullError(self.retry_after())
+        ticket = JobTicket(
+            client_id=client_id,
+            priority=priority,
+            seq=next(self._seq),
+            enqueued_at=time.monotonic(),
+        )
+        self._waiting.append(ticket)
+        self._dispatch()
+        return ticket
+
+    def position(self, ticket: JobTicket) -> int:
+        """1-based position among waiting jobs, 0 once the job is running."""
+        if ticket.granted.is_set():
+            return 0
+        for i, item in enumerate(self._ordered_waiting(), start=1):
+            if item is ticket:
+                return i
+        return 0
+
+    def release(self, ticket: JobTicket) -> None:
+        if ticket.released:
+            return
+        ticket.released = True
+        if ticket.granted.is_set():
+            self._running -= 1
+            left = self._active_by_client.get(ticket.client_id, 1) - 1
+            if left > 0:
+                self._active_by_client[ticket.client_id] = left
+            else:
+                self._active_by_client.pop(ticket.client_id, None)
+            elapsed = time.monotonic() - ticket.started_at
+            self._avg_job_seconds = 0.8 * self._avg_job_seconds + 0.2 * elapsed
+        else:
+            self._waiting = [t for t in self._waiting if t is not ticket]
+        self._dispatch()
+
+    def _ordered_waiting(self) -> list[JobTicket]:
+        rounds = dict(self._active_by_client)
+        keyed: list[tuple[tuple[int, int, int], JobTicket]] = []
+        for ticket in self._waiting:  # already in arrival order
+            rnd = rounds.get(ticket.client_id, 0)
+            rounds[ticket.client_id] = rnd + 1
+            keyed.append(((ticket.priority, rnd, ticket.seq), ticket))
+        keyed.sort(key=lambda x: x[0])
+        return [t for _, t in keyed]
+
+    def _dispatch(self) -> None:
+        while self._running < self.max_concurrency and self._waiting:
+            ticket = self._ordered_waiting()[0]
+            self._waiting.remove(ticket)
+            self._running += 1
+            self._active_by_client[ticket.client_id] = self._active_by_client.get(ticket.client_id, 0) + 1
+            ticket.started_at = time.monotonic()
+            ticket.granted.set()
+
+
+def cache_hit_ratio(cache: str) -> float:
+    hits = CACHE_REQUESTS.value(cache=cache, result="hit")
+    total = hits + CACHE_REQUESTS.value(cache=cache, result="miss")
+    return hits / total if total else 0.0
+
+
+class RecordsCache:
+    """Loaded paper table per input path, reused until the file changes."""
+
+    name = "records"
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[str, tuple[tuple[int, int], core.PaperTable]] = {}
+        CACHE_HIT_RATIO.set_function(lambda: cache_hit_ratio(self.name), cache=self.name)
+
+    def get(self, input_path: Path) -> core.PaperTable:
+        if not input_path.exists():
+            raise FileNotFoundError(f"Input not found: {input_path}")
+        key = str(input_path.resolve())
+        stat = input_path.stat()
+        version = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._entries.get(key)
+        if cached is not None and cached[0] == version:
+            CACHE_REQUESTS.inc(cache=self.name, result="hit")
+            return cached[1]
+
+        CACHE_REQUESTS.inc(cache=self.name, result="miss")
+        with RECORD_LOAD_SECONDS.time():
+            table = core.load_table(input_path)
+        with self._lock:
+            self._entries[key] = (version, table)
+        return table
+
+
+class SummaryIndexWriter:
+    """Journal saves per output dir and compact the JSON snapshot once saves go quiet."""
+
+    def __init__(self, compact_delay: float = INDEX_COMPACT_DELAY_SECONDS) -> None:
+        self.compact_delay = compact_delay
+        self._stores: dict[str, core.SummaryIndexStore] = {}
+        self._timers: dict[str, asyncio.TimerHandle] = {}
+        # Strong references to in-flight compactions; the loop only keeps weak ones.
+        self._compactions: set[asyncio.Task[None]] = set()
+
+    def store(self, output_dir: Path) -> core.SummaryIndexStore:
+        key = str(output_dir.resolve())
+        store = self._stores.get(key)
+        if store is None:
+            store = core.SummaryIndexStore(output_dir)
+            self._stores[key] = store
+        return store
+
+    async def append(self, output_dir: Path, records: list[dict[str, Any]]) -> None:
+        store = self.store(output_dir)
+        await asyncio.to_thread(store.append, records)
+        key = str(output_dir.resolve())
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        loop = asyncio.get_running_loop()
+        self._timers[key] = loop.call_later(self.compact_delay, self._start_compaction, loop, key, store)
+
+    def _start_compaction(
+        self, loop: asyncio.AbstractEventLoop, key: str, store: core.SummaryIndexStore
+    ) -> None:
+        self._timers.pop(key, None)
+        task = loop.create_task(asyncio.to_thread(store.compact))
+        self._compactions.add(task)
+        task.add_done_callback(self._compaction_done)
+
+    def _compaction_done(self, task: asyncio.Task[None]) -> None:
+        self._compactions.discard(task)
+        if task.cancelled():
+            return
+        err = task.exception()
+        if err is not None:
+            core.live_log(f"summary_index compact_error {type(err).__name__}: {err}")
+
+    async def flush(self) -> None:
+        """Cancel pending timers, wait for running compactions, then compact every store once more."""
+        for timer in self._timers.values():
+            timer.cancel()
+        self._timers.clear()
+        if self._compactions:
+            await asyncio.gather(*self._compactions, return_exceptions=True)
+        for store in self._stores.values():
+            await asyncio.to_thread(store.compact)
+
+
+@dataclass
+class EncodedBody:
+    """One response body with precompressed variants and a strong ETag each."""
+
+    digest: str
+    identity: bytes
+    gzip: bytes | None = None
+    br: bytes | None = None
+
+    @classmethod
+    def build(cls, body: bytes, fast: bool = False) -> EncodedBody:
+        """Precompress once at max ratio; `fast` trades ratio for latency on per-request bodies."""
+        item = cls(digest=hashlib.sha256(body).hexdigest()[:32], identity=body)
+        if len(body) >= MIN_COMPRESS_BYTES:
+            item.gzip = gzip.compress(body, compresslevel=5 if fast else 9, mtime=0)
+            if brotli is not None:
+                item.br = brotli.compress(body, quality=5 if fast else 11)
+        return item
+
+    def select(self, accept_encoding: str) -> tuple[str, bytes]:
+        accepted = {
+            token.split(";")[0].strip().lower()
+            for token in accept_encoding.split(",")
+            if token.strip() and not token.strip().endswith("q=0")
+        }
+        if self.br is not None and "br" in accepted:
+            return "br", self.br
+        if self.gzip is not None and ("gzip" in accepted or "*" in accepted):
+            return "gzip", self.gzip
+        return "identity", self.identity
+
+    def etag(self, encoding: str) -> str:
+        # Strong ETags must differ per content-coding.
+        return f'"{self.digest}"' if encoding == "identity" else f'"{self.digest}-{encoding}"'
+
+
+def encoded_response(request: Request, body: EncodedBody, media_type: str) -> Response:
+    encoding, payload = body.select(request.headers.get("accept-encoding", ""))
+    etag = body.etag(encoding)
+    headers = {
+        "ETag": etag,
+        "Cache-Control": SUMMARY_CACHE_CONTROL,
+        "Vary": "Accept-Encoding",
+    }
+    if_none_match = request.headers.get("if-none-match", "")
+    if if_none_match:
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if "*" in candidates or etag in candidates:
+            return Response(status_code=304, headers=headers)
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
+    return Response(content=payload, media_type=media_type, headers=headers)
+
+
+@dataclass
+class CachedSummary:
+    arxiv_id: str
+    summary_path: str
+    updated_at: str
+    version: tuple[int, int]
+    text: str
+    body: EncodedBody
+
+
+class SummaryStore:
+    """Resident, read-only cache of finished summaries in one directory fixed at startup.
+
+    Index lookups reuse the parsed index until its snapshot or journal changes;
+    Markdown bodies are read and compressed once and revalidated with a stat().
+    Reads never create files or directories.
+    """
+
+    name = "summaries"
+
+    def __init__(self, output_dir: Path) -> None:
+        self.output_dir = output_dir
+        self._index_store = core.SummaryIndexStore(output_dir)
+        self._lock = threading.Lock()
+        self._index: tuple[tuple[int, int, int], dict[str, Any]] | None = None
+        self._entries: dict[str, CachedSummary] = {}
+        CACHE_HIT_RATIO.set_function(lambda: cache_hit_ratio(self.name), cache=self.name)
+
+    def _index_items(self) -> dict[str, Any]:
+        store = self._index_store
+
+        def stat_pair(path: Path) -> tuple[int, int]:
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                return 0, 0
+            return st.st_mtime_ns, st.st_size
+
+        snap_mtime, snap_size = stat_pair(store.index_path)
+        _, journal_size = stat_pair(store.journal_path)
+        version = (snap_mtime, snap_size, journal_size)
+        with self._lock:
+            cached = self._index
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        items = store.load_readonly().get("items", {})
+        with self._lock:
+            self._index = (version, items)
+        # Bodies for ids that left the index would never be asked for again.
+        with self._lock:
+            for key in [k for k in self._entries if k not in items]:
+                del self._entries[key]
+        return items
+
+    def get(self, arxiv_id: str) -> CachedSummary | None:
+        aid = core.normalize_arxiv_id(arxiv_id)
+        if not aid:
+            return None
+        output_dir = self.output_dir
+        items = self._index_items()
+        entry = items.get(aid) or items.get(core.canonical_arxiv_id(aid))
+        if not isinstance(entry, dict):
+            CACHE_REQUESTS.inc(cache=self.name, result="miss")
+            return None
+        md_path = output_dir / Path(str(entry.get("summary_file") or entry.get("summary_path") or "")).name
+        try:
+            st = md_path.stat()
+        except FileNotFoundError:
+            CACHE_REQUESTS.inc(cache=self.name, result="miss")
+            return None
+        version = (st.st_mtime_ns, st.st_size)
+        key = str(entry.get("arxiv_id") or aid)
+        with self._lock:
+            cached = self._entries.get(key)
+        if cached is not None and cached.version == version:
+            CACHE_REQUESTS.inc(cache=self.name, result="hit")
+            return cached
+
+        CACHE_REQUESTS.inc(cache=self.name, result="miss")
+        text = md_path.read_text(encoding="utf-8")
+        item = CachedSummary(
+            arxiv_id=key,
+            summary_path=str(entry.get("summary_path", "")),
+            updated_at=str(entry.get("updated_at", "")),
+            version=version,
+            text=text,
+            body=EncodedBody.build(text.encode("utf-8")),
+        )
+        with self._lock:
+            self._entries[key] = item
+        return item
+
+
+class TicketStreamingResponse(StreamingResponse):
+    """SSE response that releases its queue tickets however the stream ends.
+
+    A generator's `finally` only runs once the generator has started, so a
+    client that disconnects before the first chunk would otherwise hold its
+    slot forever. `tickets` is shared with the handler: whatever is still in it
+    when the response finishes is released here (release is idempotent).
+    """
+
+    def __init__(self, content: AsyncIterator[bytes], job_queue: SummaryJobQueue, tickets: list[JobTicket]) -> None:
+        super().__init__(content, media_type="text/event-stream")
+        self.job_queue = job_queue
+        self.tickets = tickets
+
+    async def __call__(self, scope: Any, receive: Any, send: Any) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            for ticket in list(self.tickets):
+                self.job_queue.release(ticket)
+
+
+def busy_response(err: QueueFullError) -> JSONResponse:
+    return JSONResponse(
+        {"ok": False, "message": str(err), "retry_after": err.retry_after},
+        status_code=503,
+        headers={"Retry-After": str(err.retry_after)},
+    )
+
+
+def request_client_id(request: Request) -> str:
+    explicit = (request.headers.get("x-client-id") or "").strip()
+    if explicit:
+        return explicit[:128]
+    return request.client.host if request.client else "anonymous"
+
+
+async def wait_for_slot(
+    queue: SummaryJobQueue,
+    ticket: JobTicket,
+    emitter: StreamEventEmitter,
+) -> AsyncGenerator[bytes, None]:
+    """Yield `queued` events while the ticket waits; returns once it may run."""
+    last_position = -1
+    while not ticket.granted.is_set():
+        position = queue.position(ticket)
+        if position != last_position:
+            last_position = position
+            emitter.emit(
+                "queued",
+                {
+                    "position": position,
+                    "queue_depth": queue.depth,
+                    "running": queue.running,
+                },
+            )
+            for chunk in emitter.flush():
+                yield chunk.encode("utf-8")
+        try:
+            await asyncio.wait_for(ticket.granted.wait(), timeout=QUEUE_POLL_SECONDS)
+        except asyncio.TimeoutError:
+            continue
+
+
+def pick_record(records: core.PaperTable, arxiv_id: str) -> core.PaperRecord:
     target = core.normalize_arxiv_id(arxiv_id)
     if not target:
         raise ValueError("arxiv_id is required")
 
-    for item in records:
-        if core.canonical_arxiv_id(item.arxiv_id) == core.canonical_arxiv_id(target):
-            return item
+    found = records.find(target)
+    if found is not None:
+        return found
 
     html_url, pdf_url = core.derive_urls(target)
     return core.PaperRecord(
@@ -82,8 +589,132 @@ def pick_record(records: list[core.PaperRecord], arxiv_id: str) -> core.PaperRec
     )
 
 
-def create_app(allowed_origins: str) -> FastAPI:
-    app = FastAPI(title="myArxiv Realtime Summary Server", version="1.0.0")
+async def stream_paper_summary(
+    paper: core.PaperRecord,
+    runner: core.LLMRunner,
+    model_name: str,
+    output_dir: Path,
+    save: bool,
+    emitter: StreamEventEmitter,
+    index_writer: SummaryIndexWriter,
+) -> AsyncGenerator[bytes, None]:
+    """Stream one abstract summary as SSE chunks, ending with `done`.
+
+    Raises on failure; callers turn the exception into an `error` event.
+    """
+    abstract = core.clean_text(paper.abstract)
+    if not abstract:
+        raise RuntimeError("Abstract未提供，无法总结。")
+    emitter.emit(
+        "stage",
+        {
+            "name": "abstract_ready",
+            "message": f"Abstract ready, chars={len(abstract)}",
+        },
+    )
+    emitter.emit("stage", {"name": "abstract_summarize", "message": "Streaming abstract summary..."})
+    for chunk in emitter.flush():
+        yield chunk.encode("utf-8")
+
+    messages = core.build_abstract_messages(paper)
+    final_text = ""
+    stream = None
+    llm_started = time.perf_counter()
+    first_token_at = 0.0
+    token_count = 0
+    try:
+        # The pool races a backup endpoint when the first token is late; output is unchanged.
+        stream = await asyncio.to_thread(
+            runner.pool.open_stream,
+            model=model_name,
+            temperature=0.1,
+            messages=messages,
+        )
+
+        # The OpenAI client is blocking; pull each part off the event loop
+        # so concurrent streams (and queued-position updates) keep flowing.
+        parts = iter(stream)
+        while True:
+            part = await asyncio.to_thread(next, parts, None)
+            if part is None:
+                break
+            try:
+                delta = part.choices[0].delta.content or ""
+            except Exception:
+                delta = ""
+            if not delta:
+                continue
+            if not first_token_at:
+                first_token_at = time.perf_counter()
+                TTFT_SECONDS.observe(first_token_at - llm_started)
+            token_count += 1
+            final_text += delta
+            emitter.emit("token", {"text": delta})
+            for chunk in emitter.flush():
+                yield chunk.encode("utf-8")
+    except Exception as err:
+        UPSTREAM_ERRORS.inc(error_class=type(err).__name__)
+        raise
+    finally:
+        if stream is not None and hasattr(stream, "close"):
+            try:
+                stream.close()
+            except Exception:  # noqa: BLE001
+                pass
+
+    if first_token_at and token_count > 1:
+        elapsed = time.perf_counter() - first_token_at
+        if elapsed > 0:
+            TOKENS_PER_SECOND.observe((token_count - 1) / elapsed)
+    if not final_text.strip():
+        UPSTREAM_ERRORS.inc(error_class="EmptyOutput")
+        raise RuntimeError("Model returned empty output")
+
+    out_path = output_dir / core.summary_filename(paper)
+    if save:
+        out_path.write_text(final_text, encoding="utf-8")
+        rec = {
+            "arxiv_id": paper.arxiv_id,
+            "summary_path": str(out_path),
+            "status": "success",
+            "error": "",
+        }
+        await index_writer.append(output_dir, [rec])
+
+    emitter.emit(
+        "done",
+        {
+            "ok": True,
+            "arxiv_id": paper.arxiv_id,
+            "summary_path": str(out_path),
+            "saved": bool(save),
+        },
+    )
+    for chunk in emitter.flush():
+        yield chunk.encode("utf-8")
+
+
+def create_app(
+    allowed_origins: str,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    max_queue: int = DEFAULT_MAX_QUEUE,
+    summaries_dir: Path = Path("outputs/summaries"),
+) -> FastAPI:
+    index_writer = SummaryIndexWriter()
+    summary_store = SummaryStore(summaries_dir)
+
+    @asynccontextmanager
+    async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+        yield
+        await index_writer.flush()
+
+    app = FastAPI(title="myArxiv Realtime Summary Server", version="1.0.0", lifespan=lifespan)
+    job_queue = SummaryJobQueue(max_concurrency=max_concurrency, max_queue=max_queue)
+    records_cache = RecordsCache()
+    app.state.job_queue = job_queue
+    app.state.records_cache = records_cache
+    QUEUE_DEPTH.set_function(lambda: job_queue.depth)
+    QUEUE_RUNNING.set_function(lambda: job_queue.running)
 
     if allowed_origins.strip() == "*":
         origins = ["*"]
@@ -98,19 +729,40 @@ def create_app(allowed_origins: str) -> FastAPI:
         allow_headers=["*"],
     )
 
+    @app.middleware("http")
+    async def count_requests(request: Request, call_next: Any) -> Any:
+        response = await call_next(request)
+        route = request.scope.get("route")
+        HTTP_REQUESTS.inc(route=getattr(route, "path", "unmatched"), status=str(response.status_code))
+        return response
+
     @app.get("/health")
     async def health() -> dict[str, str]:
         return {"ok": "true"}
 
+    @app.get("/metrics")
+    async def metrics_endpoint() -> PlainTextResponse:
+        return PlainTextResponse(metrics.REGISTRY.render(), media_type=metrics.CONTENT_TYPE)
+
     @app.post("/api/summarize-one/stream")
-    async def summarize_one_stream(req: StreamOneRequest) -> StreamingResponse:
+    async def summarize_one_stream(req: StreamOneRequest, request: Request) -> Any:
         if not req.arxiv_id.strip():
             raise HTTPException(status_code=400, detail="arxiv_id is required")
 
+        try:
+            ticket = job_queue.submit(request_client_id(request), priority=PRIORITY_INTERACTIVE)
+        except QueueFullError as err:
+            return busy_response(err)
+
         async def event_stream() -> AsyncGenerator[bytes, None]:
             emitter = StreamEventEmitter()
-            final_text = ""
+            stream_started = time.perf_counter()
+            ACTIVE_STREAMS.inc()
             try:
+                async for chunk in wait_for_slot(job_queue, ticket, emitter):
+                    yield chunk
+                QUEUE_WAIT_SECONDS.observe(time.perf_counter() - stream_started)
+
                 core.require_runtime_deps()
 
                 input_path = Path(req.input_path)
@@ -124,7 +776,7 @@ def create_app(allowed_origins: str) -> FastAPI:
                 for chunk in emitter.flush():
                     yield chunk.encode("utf-8")
 
-                records = core.sort_newest(core.load_records(input_path))
+                records = await asyncio.to_thread(records_cache.get, input_path)
                 paper = pick_record(records, req.arxiv_id)
 
                 emitter.emit(
@@ -138,72 +790,150 @@ def create_app(allowed_origins: str) -> FastAPI:
                 for chunk in emitter.flush():
                     yield chunk.encode("utf-8")
 
-                abstract = core.clean_text(paper.abstract)
-                if not abstract:
-                    raise RuntimeError("Abstract未提供，无法总结。")
+                runner = core.LLMRunner(
+                    model_fast=model_name,
+                    model_deep=model_name,
+                    base_url=base_url,
+                )
+                async for chunk in stream_paper_summary(
+                    paper, runner, model_name, output_dir, req.save, emitter, index_writer
+                ):
+                    yield chunk
+
+            except Exception as err:  # noqa: BLE001
+                emitter.emit(
+                    "error",
+                    {
+                        "ok": False,
+                        "message": str(err),
+                        "trace": traceback.format_exc(limit=3),
+                    },
+                )
+                for chunk in emitter.flush():
+                    yield chunk.encode("utf-8")
+            finally:
+                job_queue.release(ticket)
+                ACTIVE_STREAMS.dec()
+                STREAM_DURATION_SECONDS.observe(time.perf_counter() - stream_started)
+
+        return TicketStreamingResponse(event_stream(), job_queue, [ticket])
+
+    @app.post("/api/summarize-many/stream")
+    async def summarize_many_stream(req: StreamManyRequest, request: Request) -> Any:
+        ids: list[str] = []
+        seen: set[str] = set()
+        for raw in req.arxiv_ids:
+            key = core.canonical_arxiv_id(raw)
+            if key and key not in seen:
+                seen.add(key)
+                ids.append(core.normalize_arxiv_id(raw))
+        if not ids:
+            raise HTTPException(status_code=400, detail="arxiv_ids is required")
+        if len(ids) > MAX_BATCH_IDS:
+            raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH_IDS} arxiv_ids per request")
+
+        client_id = request_client_id(request)
+        workers = max(1, min(req.max_parallel, len(ids), job_queue.max_concurrency))
+        # Reserve every worker's first slot up front so a saturated server
+        # rejects the whole batch with 503 instead of failing it midway.
+        first_tickets: list[JobTicket] = []
+        try:
+            for _ in range(workers):
+                first_tickets.append(job_queue.submit(client_id, priority=PRIORITY_BACKGROUND))
+        except QueueFullError as err:
+            for ticket in first_tickets:
+                job_queue.release(ticket)
+            return busy_response(err)
+
+        async def event_stream() -> AsyncGenerator[bytes, None]:
+            emitter = StreamEventEmitter()
+            stream_started = time.perf_counter()
+            ACTIVE_STREAMS.inc()
+            out: asyncio.Queue[bytes | None] = asyncio.Queue()
+            pending = list(ids)
+            counts = {"success": 0, "failed": 0}
+            tasks: list[asyncio.Task[None]] = []
+
+            async def run_worker(ticket: JobTicket | None, runner: core.LLMRunner, records: core.PaperTable) -> None:
+                # Take ownership of the reserved ticket only once actually running;
+                # a task cancelled before its first step leaves it in first_tickets.
+                if ticket in first_tickets:
+                    first_tickets.remove(ticket)
+                try:
+                    while pending:
+                        arxiv_id = pending.pop(0)
+                        paper_emitter = StreamEventEmitter(tags={"arxiv_id": arxiv_id})
+                        while ticket is None:
+                            try:
+                                ticket = job_queue.submit(client_id, priority=PRIORITY_BACKGROUND)
+                            except QueueFullError as err:
+                                await asyncio.sleep(min(err.retry_after, QUEUE_POLL_SECONDS * 5))
+                        try:
+                            async for chunk in wait_for_slot(job_queue, ticket, paper_emitter):
+                                await out.put(chunk)
+                            paper = pick_record(records, arxiv_id)
+                            paper_emitter.emit(
+                                "stage",
+                                {"name": "paper_selected", "message": f"Selected: {paper.arxiv_id}", "paper": asdict(paper)},
+                            )
+                            async for chunk in stream_paper_summary(
+                                paper, runner, model_name, output_dir, req.save, paper_emitter, index_writer
+                            ):
+                                await out.put(chunk)
+                            counts["success"] += 1
+                        except Exception as err:  # noqa: BLE001
+                            counts["failed"] += 1
+                            paper_emitter.emit("error", {"ok": False, "message": str(err)})
+                            for chunk in paper_emitter.flush():
+                                await out.put(chunk.encode("utf-8"))
+                        finally:
+                            job_queue.release(ticket)
+                            ticket = None
+                finally:
+                    if ticket is not None:
+                        job_queue.release(ticket)
+                    await out.put(None)
+
+            try:
+                core.require_runtime_deps()
+                input_path = Path(req.input_path)
+                output_dir = Path(req.output_dir)
+                output_dir.mkdir(parents=True, exist_ok=True)
+                model_name = (req.model or "").strip() or core.DEFAULT_MODEL_DEEP
+                base_url = (req.base_url or "").strip() or core.DEFAULT_BASE_URL
+
                 emitter.emit(
                     "stage",
                     {
-                        "name": "abstract_ready",
-                        "message": f"Abstract ready, chars={len(abstract)}",
+                        "name": "load_records",
+                        "message": f"Loading records from {input_path}",
+                        "total": len(ids),
+                        "parallel": workers,
                     },
                 )
                 for chunk in emitter.flush():
                     yield chunk.encode("utf-8")
 
+                # One record load and one LLM client shared by the whole batch.
+                records = await asyncio.to_thread(records_cache.get, input_path)
                 runner = core.LLMRunner(
                     model_fast=model_name,
                     model_deep=model_name,
                     base_url=base_url,
                 )
 
-                emitter.emit("stage", {"name": "abstract_summarize", "message": "Streaming abstract summary..."})
-                for chunk in emitter.flush():
-                    yield chunk.encode("utf-8")
-
-                messages = core.build_abstract_messages(paper)
-
-                stream = runner.client.chat.completions.create(
-                    model=model_name,
-                    temperature=0.1,
-                    messages=messages,
-                    stream=True,
-                )
-
-                for part in stream:
-                    try:
-                        delta = part.choices[0].delta.content or ""
-                    except Exception:
-                        delta = ""
-                    if not delta:
+                tasks = [asyncio.create_task(run_worker(t, runner, records)) for t in list(first_tickets)]
+                open_workers = len(tasks)
+                while open_workers:
+                    chunk = await out.get()
+                    if chunk is None:
+                        open_workers -= 1
                         continue
-                    final_text += delta
-                    emitter.emit("token", {"text": delta})
-                    for chunk in emitter.flush():
-                        yield chunk.encode("utf-8")
-
-                if not final_text.strip():
-                    raise RuntimeError("Model returned empty output")
-
-                out_path = output_dir / core.summary_filename(paper)
-                if req.save:
-                    out_path.write_text(final_text, encoding="utf-8")
-                    rec = {
-                        "arxiv_id": paper.arxiv_id,
-                        "summary_path": str(out_path),
-                        "status": "success",
-                        "error": "",
-                    }
-                    core.upsert_summary_index(output_dir, [rec])
+                    yield chunk
 
                 emitter.emit(
-                    "done",
-                    {
-                        "ok": True,
-                        "arxiv_id": paper.arxiv_id,
-                        "summary_path": str(out_path),
-                        "saved": bool(req.save),
-                    },
+                    "batch_done",
+                    {"ok": counts["failed"] == 0, "total": len(ids), **counts},
                 )
                 for chunk in emitter.flush():
                     yield chunk.encode("utf-8")
@@ -219,8 +949,59 @@ def create_app(allowed_origins: str) -> FastAPI:
                 )
                 for chunk in emitter.flush():
                     yield chunk.encode("utf-8")
+            finally:
+                for task in tasks:
+                    task.cancel()
+                for ticket in first_tickets:
+                    job_queue.release(ticket)
+                ACTIVE_STREAMS.dec()
+                STREAM_DURATION_SECONDS.observe(time.perf_counter() - stream_started)
+
+        return TicketStreamingResponse(event_stream(), job_queue, first_tickets)
 
-        return StreamingResponse(event_stream(), media_type="text/event-stream")
+    @app.get("/api/summary/{arxiv_id:path}")
+    async def get_summary(arxiv_id: str, request: Request) -> Response:
+        if not summary_store.output_dir.is_dir():
+            raise HTTPException(status_code=404, detail="No summaries directory")
+        item = await asyncio.to_thread(summary_store.get, arxiv_id)
+        if item is None:
+            raise HTTPException(status_code=404, detail=f"No summary for {arxiv_id}")
+        response = encoded_response(request, item.body, "text/markdown; charset=utf-8")
+        response.headers["X-Arxiv-Id"] = item.arxiv_id
+        if item.updated_at:
+            response.headers["X-Summary-Updated-At"] = item.updated_at
+        return response
+
+    @app.get("/api/summaries")
+    async def get_summaries(ids: str, request: Request) -> Response:
+        if not summary_store.output_dir.is_dir():
+            raise HTTPException(status_code=404, detail="No summaries directory")
+        wanted = [x.strip() for x in ids.split(",") if x.strip()]
+        if not wanted:
+            raise HTTPException(status_code=400, detail="ids is required")
+        if len(wanted) > MAX_BATCH_IDS:
+            raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH_IDS} ids per request")
+
+        def collect() -> tuple[dict[str, Any], list[str]]:
+            found: dict[str, Any] = {}
+            missing: list[str] = []
+            for raw in wanted:
+                item = summary_store.get(raw)
+                if item is None:
+                    missing.append(raw)
+                    continue
+                found[raw] = {
+                    "arxiv_id": item.arxiv_id,
+                    "summary_path": item.summary_path,
+                    "updated_at": item.updated_at,
+                    "etag": item.body.etag("identity"),
+                    "text": item.text,
+                }
+            return found, missing
+
+        found, missing = await asyncio.to_thread(collect)
+        payload = json.dumps({"items": found, "missing": missing}, ensure_ascii=False).encode("utf-8")
+        return encoded_response(request, EncodedBody.build(payload, fast=True), "application/json")
 
     @app.get("/api/models")
     async def models() -> JSONResponse:
@@ -243,7 +1024,12 @@ def create_app(allowed_origins: str) -> FastAPI:
 
 def main() -> int:
     args = parse_args()
-    app = create_app(args.allowed_origins)
+    app = create_app(
+        args.allowed_origins,
+        max_concurrency=args.max_concurrency,
+        max_queue=args.max_queue,
+        summaries_dir=args.summaries_dir,
+    )
 
     try:
         import uvicorn
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""Opt-in timing spans and profiling for the CLI pipelines.
+
+- `span("llm_call", model=...)` times a block with perf_counter_ns; spans nest per
+  thread. Work handed to another thread passes `parent_id=current_span_id()`
+  along so its spans stay under the caller's. While tracing is off it returns a
+  shared no-op context, so the instrumented hot paths pay one global lookup and a call.
+- `export_jsonl()` writes one span per line; `export_chrome_trace()` writes the
+  trace-event format that chrome://tracing and Perfetto open directly.
+- `profiled("cprofile" | "sample", path)` wraps a whole run in cProfile or in a
+  stdlib stack sampler and writes a text report (plus a .prof / collapsed-stack
+  file for flamegraph tools).
+"""
+
+from __future__ import annotations
+
+import cProfile
+import io
+import itertools
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator
+
+PROFILERS = ("cprofile", "sample")
+DEFAULT_SAMPLE_INTERVAL = 0.005
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+    def set(self, **attrs: Any) -> None:
+        return None
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class Span:
+    __slots__ = ("tracer", "name", "attrs", "span_id", "parent_id", "start_ns", "thread_id")
+
+    def __init__(self, tracer: "Tracer", name: str, attrs: dict[str, Any], parent_id: int | None = None) -> None:
+        self.tracer = tracer
+        self.name = name
+        self.attrs = attrs
+        self.span_id = 0
+        # None: take the enclosing span on this thread when entered.
+        self.parent_id = parent_id
+        self.start_ns = 0
+        self.thread_id = 0
+
+    def set(self, **attrs: Any) -> None:
+        """Attach attributes known only once the block has run (sizes, statuses)."""
+        self.attrs.update(attrs)
+
+    def __enter__(self) -> "Span":
+        stack = self.tracer._stack()
+        if self.parent_id is None:
+            self.parent_id = stack[-1].span_id if stack else 0
+        self.span_id = next(self.tracer._ids)
+        self.thread_id = threading.get_ident()
+        stack.append(self)
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, exc: BaseException | None, tb: object) -> None:
+        end_ns = time.perf_counter_ns()
+        stack = self.tracer._stack()
+        if stack and stack[-1] is self:
+            stack.pop()
+        if exc_type is not None:
+            self.attrs["error"] = exc_type.__name__
+        self.tracer._finished.append(
+            {
+                "name": self.name,
+                "id": self.span_id,
+                "parent": self.parent_id,
+                "thread": self.thread_id,
+                "start_us": (self.start_ns - self.tracer.origin_ns) / 1000,
+                "duration_us": (end_ns - self.start_ns) / 1000,
+                "attrs": self.attrs,
+            }
+        )
+
+
+class Tracer:
+    def __init__(self) -> None:
+        self.enabled = False
+        self.origin_ns = time.perf_counter_ns()
+        self._local = threading.local()
+        self._ids = itertools.count(1)
+        # list.append is atomic under the GIL; worker threads share this list.
+        self._finished: list[dict[str, Any]] = []
+
+    def _stack(self) -> list[Span]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def enable(self) -> None:
+        self.origin_ns = time.perf_counter_ns()
+        self._finished.clear()
+        self.enabled = True
+
+    def spans(self) -> list[dict[str, Any]]:
+        return sorted(self._finished, key=lambda s: s["start_us"])
+
+    def export_jsonl(self, path: Path) -> Path:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as fh:
+            for item in self.spans():
+                fh.write(json.dumps(item, ensure_ascii=False, default=str) + "\n")
+        return path
+
+    def export_chrome_trace(self, path: Path) -> Path:
+        pid = os.getpid()
+        events = [
+            {
+                "name": item["name"],
+                "cat": "pipeline",
+                "ph": "X",
+                "ts": round(item["start_us"], 3),
+                "dur": round(item["duration_us"], 3),
+                "pid": pid,
+                "tid": item["thread"],
+                "args": {k: str(v) for k, v in item["attrs"].items()},
+            }
+            for item in self.spans()
+        ]
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}), encoding="utf-8")
+        return path
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Per span name: count, total and max milliseconds."""
+        out: dict[str, dict[str, float]] = {}
+        for item in self._finished:
+            row = out.setdefault(item["name"], {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+            ms = item["duration_us"] / 1000
+            row["count"] += 1
+            row["total_ms"] = round(row["total_ms"] + ms, 3)
+            row["max_ms"] = round(max(row["max_ms"], ms), 3)
+        return out
+
+
+TRACER = Tracer()
+
+
+def span(name: str, parent_id: int | None = None, **attrs: Any) -> Span | _NoopSpan:
+    if not TRACER.enabled:
+        return _NOOP_SPAN
+    return Span(TRACER, name, attrs, parent_id)
+
+
+def current_span_id() -> int:
+    """Id of the innermost open span on this thread (0 if none or tracing is off)."""
+    if not TRACER.enabled:
+        return 0
+    stack = TRACER._stack()
+    return stack[-1].span_id if stack else 0
+
+
+def trace_paths(base: Path) -> tuple[Path, Path]:
+    """`run.jsonl` -> (`run.jsonl`, `run.chrome.json`)."""
+    stem = base.name[: -len(base.suffix)] if base.suffix else base.name
+    return base, base.with_name(f"{stem}.chrome.json")
+
+
+@contextmanager
+def traced(base: Path | None) -> Iterator[None]:
+    """Enable spans for the block and export both formats afterwards; no-op for None."""
+    if base is None:
+        yield
+        return
+    TRACER.enable()
+    try:
+        yield
+    finally:
+        TRACER.enabled = False
+        jsonl_path, chrome_path = trace_paths(base)
+        TRACER.export_jsonl(jsonl_path)
+        TRACER.export_chrome_trace(chrome_path)
+        print(f"trace -> {jsonl_path} ({len(TRACER._finished)} spans), chrome trace -> {chrome_path}", flush=True)
+
+
+class StackSampler:
+    """Samples every thread's Python stack on a timer thread (stdlib only)."""
+
+    def __init__(self, interval: float = DEFAULT_SAMPLE_INTERVAL) -> None:
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            self.samples += 1
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own:
+                    continue
+                names: list[str] = []
+                while frame is not None:
+                    code = frame.f_code
+                    names.append(f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                self.stacks[";".join(reversed(names))] += 1
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def report(self, top: int = 40) -> str:
+        own: Counter[str] = Counter()
+        inclusive: Counter[str] = Counter()
+        for stack, count in self.stacks.items():
+            frames = stack.split(";")
+            own[frames[-1]] += count
+            for name in set(frames):
+                inclusive[name] += count
+        total = sum(self.stacks.values()) or 1
+        lines = [f"{self.samples} ticks every {self.interval * 1000:.1f} ms, {total} thread samples", ""]
+        for title, counter in (("self", own), ("inclusive", inclusive)):
+            lines.append(f"top {top} by {title} samples:")
+            for name, count in counter.most_common(top):
+                lines.append(f"  {100 * count / total:6.2f}%  {count:7d}  {name}")
+            lines.append("")
+        return "\n".join(lines)
+
+
+@contextmanager
+def profiled(kind: str | None, path: Path | None) -> Iterator[None]:
+    """Run the block under cProfile or the stack sampler and write a report to `path`."""
+    if not kind:
+        yield
+        return
+    if kind not in PROFILERS:
+        raise ValueError(f"unknown profiler: {kind} (choose from {', '.join(PROFILERS)})")
+    report_path = path or Path(f"profile-{kind}.txt")
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    if kind == "cprofile":
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            profiler.dump_stats(str(report_path.with_suffix(".prof")))
+            buf = io.StringIO()
+            pstats.Stats(profiler, stream=buf).sort_stats("cumulative").print_stats(60)
+            report_path.write_text(buf.getvalue(), encoding="utf-8")
+            print(f"profile -> {report_path} (+ {report_path.with_suffix('.prof')})", flush=True)
+        return
+
+    sampler = StackSampler()
+    sampler.start()
+    try:
+        yield
+    finally:
+        sampler.stop()
+        report_path.write_text(sampler.report(), encoding="utf-8")
+        collapsed = report_path.with_suffix(".collapsed")
+        collapsed.write_text("".join(f"{stack} {count}\n" for stack, count in sampler.stacks.items()), encoding="utf-8")
+        print(f"profile -> {report_path} (+ {collapsed} for flamegraph tools)", flush=True)
@@ -5,6 +5,7 @@ const summariesBaseUrl = window.location.pathname.includes("/site/")
   ? "../outputs/summaries"
   : "./outputs/summaries";
 const summaryIndexUrl = `${summariesBaseUrl}/summary_index.json`;
+const dataManifestUrl = dataUrl.replace(/\.json$/, ".manifest.json");
 const DISPLAY_TIMEZONE = "Asia/Shanghai";
 const DISPLAY_TIMEZONE_LABEL = "北京时间";
 const GITHUB_OWNER = "yangfeiyang-123";
@@ -1139,6 +1140,22 @@ function readSummaryPathFromIndex(arxivId) {
 }
 
 async function fetchSummaryMarkdown(meta, forceIndex = false) {
+  if (ENABLE_LOCAL_REALTIME && REALTIME_ENDPOINT && meta.arxivId) {
+    // Realtime server serves finished summaries with ETags; no redeploy needed.
+    const url = `${REALTIME_ENDPOINT}/api/summary/${encodeURIComponent(extractArxivId(meta.arxivId))}`;
+    try {
+      const resp = await fetch(url, { cache: "no-cache" });
+      if (resp.ok) {
+        const text = await resp.text();
+        if (text && text.trim().length > 120) {
+          return { text: text.trim(), path: url };
+        }
+      }
+    } catch (_) {
+      // Fall back to static files.
+    }
+  }
+
   await ensureSummaryIndex(forceIndex);
   const paths = [];
   const fromIndex = readSummaryPathFromIndex(meta.arxivId || "");
@@ -1520,6 +1537,11 @@ async function streamSummaryViaRealtime(meta) {
         const evt = parseSseBlock(rawBlock);
         const data = evt.data && typeof evt.data === "object" ? evt.data : {};
 
+        if (evt.eventName === "queued") {
+          pushSummaryDialogMessage("system", `排队中：第 ${data.position || "?"} 位（运行中 ${data.running ?? "?"}）`);
+          continue;
+        }
+
         if (evt.eventName === "stage") {
           const msg = data.message || data.name || "阶段更新";
           pushSummaryDialogMessage("system", String(msg));
@@ -3880,6 +3902,85 @@ function applyPayload(payload, sourceLabel, options = {}) {
   applyFilters();
 }
 
+function canonicalPaperId(raw) {
+  let value = String(raw || "").trim();
+  const marker = value.indexOf("/abs/");
+  if (marker >= 0) value = value.slice(marker + 5);
+  return value.replace(/v\d+$/, "");
+}
+
+function paperDeltaKey(paper) {
+  return canonicalPaperId(paper.id) || String(paper.title || "");
+}
+
+// Same order as fetch_cs_ro.paper_sort_key: newest published first, ties by canonical id (descending).
+function byPublishedThenKey(a, b) {
+  const diff = (new Date(b.published).getTime() || 0) - (new Date(a.published).getTime() || 0);
+  if (diff) return diff;
+  const ka = paperDeltaKey(a);
+  const kb = paperDeltaKey(b);
+  return ka < kb ? 1 : ka > kb ? -1 : 0;
+}
+
+function applyPayloadDelta(snapshot, delta) {
+  const papers = new Map();
+  (snapshot.fields || []).forEach((field) => {
+    (field.papers || []).forEach((paper) => {
+      papers.set(`${field.code}|${paperDeltaKey(paper)}`, paper);
+    });
+  });
+  (delta.expired || []).forEach((item) => papers.delete(`${item.field}|${item.key}`));
+  [...(delta.added || []), ...(delta.updated || [])].forEach((item) => {
+    papers.set(`${item.field}|${paperDeltaKey(item.paper)}`, item.paper);
+  });
+
+  const byField = new Map();
+  papers.forEach((paper, key) => {
+    const code = key.slice(0, key.indexOf("|"));
+    if (!byField.has(code)) byField.set(code, []);
+    byField.get(code).push(paper);
+  });
+  const header = delta.header || {};
+  return {
+    ...header,
+    fields: (header.fields || []).map((field) => ({
+      ...field,
+      papers: (byField.get(field.code) || []).sort(byPublishedThenKey),
+    })),
+  };
+}
+
+// Bring a cached snapshot up to date from the manifest's delta chain.
+// Returns null whenever the chain does not cover the cache, so the caller
+// falls back to downloading the full snapshot.
+async function fetchPayloadViaDeltas(cachedPayload) {
+  if (!cachedPayload || !cachedPayload.fetched_at) return null;
+  try {
+    const resp = await fetch(dataManifestUrl, { cache: "no-cache" });
+    if (!resp.ok) return null;
+    const manifest = await resp.json();
+    if (manifest.fetched_at === cachedPayload.fetched_at) return cachedPayload;
+
+    const chain = Array.isArray(manifest.deltas) ? manifest.deltas : [];
+    const startIndex = chain.findIndex((item) => item.from === cachedPayload.fetched_at);
+    if (startIndex < 0) return null;
+
+    const baseUrl = new URL(dataManifestUrl, window.location.href);
+    let payload = cachedPayload;
+    for (const item of chain.slice(startIndex)) {
+      const deltaResp = await fetch(new URL(item.file, baseUrl).toString());
+      if (!deltaResp.ok) return null;
+      const delta = await deltaResp.json();
+      if (delta.from !== payload.fetched_at) return null;
+      payload = applyPayloadDelta(payload, delta);
+    }
+    return payload.fetched_at === manifest.fetched_at ? payload : null;
+  } catch (err) {
+    console.warn("delta update failed", err);
+    return null;
+  }
+}
+
 async function loadData() {
   let hasRenderedCache = false;
   let cachedPayload = null;
@@ -3894,12 +3995,14 @@ async function loadData() {
       hasRenderedCache = true;
     }
 
-    const resp = await fetch(dataUrl, { cache: "no-cache" });
-    if (!resp.ok) {
-      throw new Error(`HTTP ${resp.status}`);
+    let payload = await fetchPayloadViaDeltas(cachedPayload);
+    if (!payload) {
+      const resp = await fetch(dataUrl, { cache: "no-cache" });
+      if (!resp.ok) {
+        throw new Error(`HTTP ${resp.status}`);
+      }
+      payload = await resp.json();
     }
-
-    const payload = await resp.json();
     setCachedPayload(payload);
     await setCachedPayloadToCacheApi(payload);
     const changedPaperKeys = computeChangedPaperKeys(cachedPayload, payload);